@@ -1,16 +1,36 @@
-from flask import Flask, g
+import time
+import uuid
+
+from flask import Flask, Response, g, request
 
 from flask_jwt_extended import JWTManager
 from marshmallow.exceptions import ValidationError
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from app.config import configs
 from auth.routers import auth_bp
 from auth.utils.exceptions import AuthUserInvalidPasswordException, invalid_user_password_error_handler
 from common.constants.api import ApiVersion
+from common.constants.db import (
+    DatabaseRoutingConstants,
+    QueryStatisticsConstants,
+    RequestDeadlineConstants,
+    StatementCommentConstants,
+)
 from courses.routers import courses_bp
 from courses.utils.exceptions import CourseNotFoundError, course_not_found_error_handler
-from db import create_db_engine, get_session
+from db import LazySession, create_db_engine, create_replica_engines, get_session
+from db.commands import sql_endpoints_report
+from db.monitoring import (
+    QueryStatistics,
+    SlowQueryLog,
+    register_query_statistics,
+    register_slow_query_log,
+    register_statement_comments,
+)
+from db.pool import engine_lifecycle
+from db.sequences import CardIdAllocator
+from health.routers import health_bp
 from students.routers import students_bp
 from students.utils.exceptions import (
     StudentNotFoundError,
@@ -29,12 +49,21 @@ from teachers.utils.exceptions import (
 )
 from users.routers import users_bp
 from users.utils.exceptions import UserNotFoundError, user_not_found_error_handler
-from utils.exceptions import integrity_error_handler, marshmallow_validation_error_handler
+from users.utils.passwords import PasswordHasher
+from utils.exceptions import (
+    RequestDeadlineExceededError,
+    integrity_error_handler,
+    marshmallow_validation_error_handler,
+    operational_error_handler,
+    request_deadline_exceeded_error_handler,
+)
 from utils.jwt import generic_token_verifier
+from utils.logging import setup_logging
 
 
 def create_app(config_name: str) -> Flask:
     app = Flask(__name__)
+    log = setup_logging(app.name)
     app.config.from_object(configs[config_name])
     # JWT initialization.
     jwt = JWTManager()
@@ -46,29 +75,127 @@ def create_app(config_name: str) -> Flask:
     error_handler_register(app=app)
 
     app.db_engine = create_db_engine(config=app.config, echo=app.config['SQLALCHEMY_ENGINE_ECHO'])
+    app.db_replica_engines = create_replica_engines(config=app.config, echo=app.config['SQLALCHEMY_ENGINE_ECHO'])
+    # Single session registry for the whole app, each request thread gets its own session from it.
+    app.db_session_registry = get_session(
+        engine=app.db_engine,
+        replica_engines=app.db_replica_engines,
+        balancing=app.config['POSTGRES_REPLICA_BALANCING'],
+    )
+    app.slow_query_log = SlowQueryLog(
+        threshold_ms=app.config['SLOW_QUERY_THRESHOLD_MS'],
+        explain_sample_rate=app.config['SLOW_QUERY_EXPLAIN_SAMPLE_RATE'],
+        log_file=app.config['SLOW_QUERY_LOG_FILE'],
+        max_bytes=app.config['SLOW_QUERY_LOG_MAX_BYTES'],
+        backup_count=app.config['SLOW_QUERY_LOG_BACKUP_COUNT'],
+    )
+    app.card_id_allocator = CardIdAllocator(block_size=app.config['CARD_ID_BLOCK_SIZE'])
+    app.password_hasher = PasswordHasher(workers=app.config['PASSWORD_HASH_WORKERS'])
+    for engine in [app.db_engine, *app.db_replica_engines]:
+        register_query_statistics(engine=engine)
+        register_slow_query_log(engine=engine, slow_query_log=app.slow_query_log)
+        if app.config['SQL_COMMENTS_ENABLED']:
+            register_statement_comments(engine=engine)
+        engine_lifecycle.register(engine=engine, warm_up_connections=app.config['SQLALCHEMY_POOL_WARM_UP_CONNECTIONS'])
+
+    app.cli.add_command(sql_endpoints_report)
+
+    @app.before_request
+    def set_request_id() -> None:
+        """Adding request id to the flask g object, the client's X-Request-ID header value if it is sent."""
+        request_id = request.headers.get(StatementCommentConstants.REQUEST_ID_HEADER.value, default='')
+        g.request_id = request_id[:StatementCommentConstants.REQUEST_ID_MAX_LENGTH.value] or uuid.uuid4().hex
+
+    @app.after_request
+    def report_request_id(response: Response) -> Response:
+        """Returning request id to the client, it tags the request's statements in the db."""
+        if 'request_id' in g:
+            response.headers[StatementCommentConstants.REQUEST_ID_HEADER.value] = g.request_id
+        return response
+
+    @app.before_request
+    def set_request_deadline() -> None:
+        """Adding request's deadline to the flask g object.
+
+        The budget is the endpoint's default, or the client's X-Request-Timeout header value in ms if it is shorter.
+        """
+        budget_ms = app.config['REQUEST_ENDPOINT_TIMEOUTS_MS'].get(request.endpoint, app.config['REQUEST_TIMEOUT_MS'])
+        client_budget_ms = request.headers.get(RequestDeadlineConstants.DEADLINE_HEADER.value, type=int)
+        if client_budget_ms is not None:
+            budget_ms = min(budget_ms, client_budget_ms)
+        g.request_deadline = time.monotonic() + budget_ms / 1000
 
     @app.before_request
     def set_session() -> None:
-        """Adding sqlalchemy session to the flask g object."""
-        g.db_session = get_session(engine=app.db_engine)
+        """Adding lazy sqlalchemy session to the flask g object.
+
+        GET requests are read-only and go to the read replicas, unless the client wrote to the db recently.
+        """
+        primary_until = request.cookies.get(
+            DatabaseRoutingConstants.PRIMARY_STICKINESS_COOKIE_NAME.value, default=0.0, type=float,
+        )
+        read_only = request.method == 'GET' and primary_until < time.time()
+        g.db_session = LazySession(
+            registry=app.db_session_registry,
+            info={
+                DatabaseRoutingConstants.SESSION_READ_ONLY_KEY.value: read_only,
+                RequestDeadlineConstants.SESSION_DEADLINE_KEY.value: g.request_deadline,
+            },
+        )
+
+    @app.after_request
+    def set_primary_stickiness(response: Response) -> Response:
+        """Keeping the client which just wrote to the db on the primary, so it can read its own writes."""
+        db_session = g.get('db_session')
+        if app.db_replica_engines and request.method != 'GET' and db_session and db_session.used:
+            stickiness = app.config['POSTGRES_PRIMARY_STICKINESS_SECONDS']
+            response.set_cookie(
+                key=DatabaseRoutingConstants.PRIMARY_STICKINESS_COOKIE_NAME.value,
+                value=str(time.time() + stickiness),
+                max_age=stickiness,
+                httponly=True,
+            )
+        return response
+
+    @app.before_request
+    def set_query_statistics() -> None:
+        """Adding per-request statements statistics to the flask g object."""
+        g.query_statistics = QueryStatistics()
+
+    @app.after_request
+    def report_query_statistics(response: Response) -> Response:
+        """Reporting request's statements statistics in response headers or logs, warning about N+1 queries."""
+        query_statistics = g.get('query_statistics')
+        if not query_statistics:
+            return response
+        repeated_statements = query_statistics.repeated_statements(threshold=app.config['SQL_N_PLUS_ONE_THRESHOLD'])
+        for statement, count in repeated_statements.items():
+            log.warning(f'Possible N+1 queries in {request.endpoint}, statement executed {count} times: {statement}')
+        if app.config['SQL_STATISTICS_HEADERS']:
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value] = query_statistics.statements
+            response.headers[QueryStatisticsConstants.TOTAL_TIME_HEADER.value] = query_statistics.total_time_ms
+            response.headers[QueryStatisticsConstants.REPEATED_STATEMENTS_HEADER.value] = len(repeated_statements)
+        else:
+            log.info(
+                f'{request.method} {request.path} endpoint: {request.endpoint}, '
+                f'statements: {query_statistics.statements}, db time: {query_statistics.total_time_ms} ms.'
+            )
+        return response
 
     @app.teardown_appcontext
     def remove_session(exception=None) -> None:
-        """Closing sqlalchemy session on the app teardown."""
-        if g.db_session:
-            g.db_session.remove()
+        """Closing sqlalchemy session on the app teardown, if the request used it."""
+        db_session = g.pop('db_session', None)
+        if db_session:
+            db_session.remove()
 
     return app
 
 
 def blueprints_register(app: Flask) -> Flask:
     """Registers blueprints in the flask app."""
-    app.register_blueprint(users_bp, url_prefix=f'/api/v{ApiVersion.V1.value}/{users_bp.url_prefix}')
-    app.register_blueprint(auth_bp, url_prefix=f'/api/v{ApiVersion.V1.value}/{auth_bp.url_prefix}')
-    app.register_blueprint(teachers_bp, url_prefix=f'/api/v{ApiVersion.V1.value}/{teachers_bp.url_prefix}')
-    app.register_blueprint(students_bp, url_prefix=f'/api/v{ApiVersion.V1.value}/{students_bp.url_prefix}')
-    app.register_blueprint(courses_bp, url_prefix=f'/api/v{ApiVersion.V1.value}/{courses_bp.url_prefix}')
-    app.register_blueprint(subjects_bp, url_prefix=f'/api/v{ApiVersion.V1.value}/{subjects_bp.url_prefix}')
+    for blueprint in [users_bp, auth_bp, teachers_bp, students_bp, courses_bp, subjects_bp, health_bp]:
+        app.register_blueprint(blueprint, url_prefix=f'/api/v{ApiVersion.V1.value}/{blueprint.url_prefix}')
     return app
 
 
@@ -77,6 +204,8 @@ def error_handler_register(app: Flask) -> Flask:
     app.register_error_handler(ValidationError, marshmallow_validation_error_handler)
     app.register_error_handler(UserNotFoundError, user_not_found_error_handler)
     app.register_error_handler(IntegrityError, integrity_error_handler)
+    app.register_error_handler(OperationalError, operational_error_handler)
+    app.register_error_handler(RequestDeadlineExceededError, request_deadline_exceeded_error_handler)
     app.register_error_handler(AuthUserInvalidPasswordException, invalid_user_password_error_handler)
     app.register_error_handler(StudentExistsError, student_exists_error_handler)
     app.register_error_handler(TeacherExistsError, teacher_exists_error_handler)
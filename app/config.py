@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 from dotenv import load_dotenv
 
@@ -18,12 +19,63 @@ class BaseConfig:
     POSTGRES_DB_HOST = os.getenv(key='POSTGRES_DB_HOST', default='postgres_server')
     POSTGRES_DB_PORT = os.getenv(key='POSTGRES_DB_PORT', default=5432)
     POSTGRES_DB_NAME = os.getenv(key='POSTGRES_DB_NAME', default='postgres')
+    # DB backend, 'postgresql' or 'sqlite' for embedded mode with no db server, in-memory if the path is ':memory:'.
+    DB_BACKEND = os.getenv(key='DB_BACKEND', default='postgresql')
+    SQLITE_DB_PATH = os.getenv(key='SQLITE_DB_PATH', default=':memory:')
+    # Read replicas configuration variables, comma separated list of replica db urls.
+    POSTGRES_REPLICA_URLS = [url for url in os.getenv(key='POSTGRES_REPLICA_URLS', default='').split(',') if url]
+    POSTGRES_REPLICA_BALANCING = os.getenv(key='POSTGRES_REPLICA_BALANCING', default='round_robin')
+    POSTGRES_PRIMARY_STICKINESS_SECONDS = int(os.getenv(key='POSTGRES_PRIMARY_STICKINESS_SECONDS', default=5))
+    # List endpoints streaming, rows are read with server-side cursor and sent in chunks of batch size objects.
+    LIST_STREAMING_ENABLED = (os.getenv(key='LIST_STREAMING_ENABLED', default=False) == 'True')
+    LIST_STREAMING_BATCH_SIZE = int(os.getenv(key='LIST_STREAMING_BATCH_SIZE', default=500))
+    # Request latency budget in milliseconds, per-endpoint defaults as comma separated 'endpoint=ms' list.
+    # Client's X-Request-Timeout header can only shorten it, the rest of the budget is the statement_timeout.
+    REQUEST_TIMEOUT_MS = int(os.getenv(key='REQUEST_TIMEOUT_MS', default=30000))
+    REQUEST_ENDPOINT_TIMEOUTS_MS = {
+        endpoint: int(timeout)
+        for endpoint, timeout in (
+            item.split('=') for item in os.getenv(key='REQUEST_ENDPOINT_TIMEOUTS_MS', default='').split(',') if item
+        )
+    }
     # JWT configuration variables.
     JWT_SECRET_KEY = os.getenv(key='JWT_SECRET_KEY', default='jwt secret key')
     JWT_TOKEN_LOCATION = os.getenv(key='JWT_TOKEN_LOCATION', default='cookies')
     JWT_COOKIE_CSRF_PROTECT = (os.getenv(key='JWT_COOKIE_CSRF_PROTECT', default=True) == 'True')
     # sqlalchemy configuration variables.
     SQLALCHEMY_ENGINE_ECHO = (os.getenv(key='SQLALCHEMY_ENGINE_ECHO', default=False) == 'True')
+    # External transaction-mode pooler in front of postgres, engines don't pool connections and keep no session state.
+    DB_EXTERNAL_POOLER = (os.getenv(key='DB_EXTERNAL_POOLER', default=False) == 'True')
+    # sqlalchemy connection pool configuration variables.
+    SQLALCHEMY_POOL_SIZE = int(os.getenv(key='SQLALCHEMY_POOL_SIZE', default=5))
+    SQLALCHEMY_MAX_OVERFLOW = int(os.getenv(key='SQLALCHEMY_MAX_OVERFLOW', default=10))
+    SQLALCHEMY_POOL_TIMEOUT = int(os.getenv(key='SQLALCHEMY_POOL_TIMEOUT', default=30))
+    SQLALCHEMY_POOL_RECYCLE = int(os.getenv(key='SQLALCHEMY_POOL_RECYCLE', default=1800))
+    SQLALCHEMY_POOL_PRE_PING = (os.getenv(key='SQLALCHEMY_POOL_PRE_PING', default='True') == 'True')
+    SQLALCHEMY_POOL_USE_LIFO = (os.getenv(key='SQLALCHEMY_POOL_USE_LIFO', default='True') == 'True')
+    # Transactions isolation level of the postgres engines, e.g. 'READ COMMITTED', 'REPEATABLE READ', 'SERIALIZABLE'.
+    POSTGRES_ISOLATION_LEVEL = os.getenv(key='POSTGRES_ISOLATION_LEVEL', default='READ COMMITTED')
+    # Write transactions failed with serialization failure or deadlock are retried with jittered backoff.
+    DB_RETRY_MAX_ATTEMPTS = int(os.getenv(key='DB_RETRY_MAX_ATTEMPTS', default=5))
+    DB_RETRY_BASE_BACKOFF_MS = int(os.getenv(key='DB_RETRY_BASE_BACKOFF_MS', default=10))
+    DB_RETRY_MAX_BACKOFF_MS = int(os.getenv(key='DB_RETRY_MAX_BACKOFF_MS', default=500))
+    # Card id numbers reserved from the db sequences at once by each worker process, 1 reserves no blocks.
+    CARD_ID_BLOCK_SIZE = int(os.getenv(key='CARD_ID_BLOCK_SIZE', default=1))
+    # Worker processes hashing passwords of the bulk requests, 1 hashes them in the request thread.
+    PASSWORD_HASH_WORKERS = int(os.getenv(key='PASSWORD_HASH_WORKERS', default=os.cpu_count() or 1))
+    # Connections opened in every worker process at boot, after the pre-fork server forks it.
+    SQLALCHEMY_POOL_WARM_UP_CONNECTIONS = int(os.getenv(key='SQLALCHEMY_POOL_WARM_UP_CONNECTIONS', default=2))
+    # Per-request statements statistics, sent in response headers if enabled, logged otherwise.
+    SQL_STATISTICS_HEADERS = (os.getenv(key='SQL_STATISTICS_HEADERS', default=False) == 'True')
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv(key='SQL_N_PLUS_ONE_THRESHOLD', default=5))
+    # Statements tagged with the request's endpoint, blueprint and request id comment, shown by postgres logs.
+    SQL_COMMENTS_ENABLED = (os.getenv(key='SQL_COMMENTS_ENABLED', default='True') == 'True')
+    # Slow query log, a sample of slow SELECT statements gets EXPLAIN (ANALYZE, BUFFERS) plan logged.
+    SLOW_QUERY_THRESHOLD_MS = int(os.getenv(key='SLOW_QUERY_THRESHOLD_MS', default=200))
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(os.getenv(key='SLOW_QUERY_EXPLAIN_SAMPLE_RATE', default=0.1))
+    SLOW_QUERY_LOG_FILE = os.getenv(key='SLOW_QUERY_LOG_FILE', default='logs/slow_queries.log')
+    SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv(key='SLOW_QUERY_LOG_MAX_BYTES', default=10 * 1024 * 1024))
+    SLOW_QUERY_LOG_BACKUP_COUNT = int(os.getenv(key='SLOW_QUERY_LOG_BACKUP_COUNT', default=5))
 
 
 class DevelopmentConfig(BaseConfig):
@@ -33,6 +85,7 @@ class DevelopmentConfig(BaseConfig):
     ENV = "development"
     DEBUG = True
     TESTING = False
+    SQL_STATISTICS_HEADERS = True
 
 
 class TestingConfig(BaseConfig):
@@ -42,9 +95,29 @@ class TestingConfig(BaseConfig):
     DEBUG = False
     TESTING = True
     POSTGRES_DB_NAME = 'test_postgres'
+    SQL_STATISTICS_HEADERS = True
+    SLOW_QUERY_LOG_FILE = os.path.join(tempfile.gettempdir(), 'test_postgres_slow_queries.log')
+    PASSWORD_HASH_WORKERS = 2
+
+
+class TestingSqliteConfig(TestingConfig):
+    """Testing configuration variables for the project on the in-memory SQLite db."""
+    CONFIG_NAME = "testing_sqlite"
+    DB_BACKEND = 'sqlite'
+    SQLITE_DB_PATH = ':memory:'
+
+
+class TestingExternalPoolerConfig(TestingConfig):
+    """Testing configuration variables for the project behind the external connection pooler."""
+    CONFIG_NAME = "testing_external_pooler"
+    DB_EXTERNAL_POOLER = True
+    POSTGRES_DB_HOST = os.getenv(key='PGBOUNCER_HOST', default='127.0.0.1')
+    POSTGRES_DB_PORT = int(os.getenv(key='PGBOUNCER_PORT', default=6432))
 
 
 configs = {
     'development': DevelopmentConfig,
     'testing': TestingConfig,
+    'testing_external_pooler': TestingExternalPoolerConfig,
+    'testing_sqlite': TestingSqliteConfig,
 }
@@ -7,6 +7,7 @@ from auth.services import AuthService
 from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
 from users.schemas import UserOutputSchema
+from utils.schemas import get_schema
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
@@ -14,10 +15,10 @@ auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 @auth_bp.post('/login')
 def login() -> Response:
     """POST '/login' endpoint view function."""
-    response = AuthService(
+    response = AuthService.for_session(
         session=g.db_session,
-        input_schema=AuthUserInputSchema(many=False),
-        output_schema=AuthUserOutputSchema(many=False),
+        input_schema=get_schema(AuthUserInputSchema, many=False),
+        output_schema=get_schema(AuthUserOutputSchema, many=False),
     ).login(request.get_json())
     return response, HttpStatusCodeConstants.HTTP_200_OK.value
 
@@ -26,9 +27,9 @@ def login() -> Response:
 @jwt_required()
 def me() -> Response:
     """GET '/me' endpoint view function."""
-    user = AuthService(session=g.db_session, output_schema=UserOutputSchema(many=False)).me()
+    user = AuthService.for_session(session=g.db_session, output_schema=get_schema(UserOutputSchema, many=False)).me()
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -44,5 +45,8 @@ def me() -> Response:
 @jwt_required()
 def logout() -> Response:
     """POST '/logout' endpoint view function."""
-    response = AuthService(session=g.db_session, output_schema=AuthUserLogoutSchema(many=False)).logout()
+    response = AuthService.for_session(
+        session=g.db_session,
+        output_schema=get_schema(AuthUserLogoutSchema, many=False),
+    ).logout()
     return response, HttpStatusCodeConstants.HTTP_200_OK.value
@@ -18,14 +18,18 @@ from sqlalchemy.orm import scoped_session
 from auth.schemas import AuthBaseSchema
 from auth.services.serializers import AuthSerializer
 from auth.utils.exceptions import AuthUserInvalidPasswordException
+from common.abstract.services import SessionBoundService
 from common.constants.auth import AuthJWTConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
 from users.services import UserService
 from utils.logging import setup_logging
+from utils.schemas import get_schema
 
 
-class AbstractAuthService(metaclass=abc.ABCMeta):
+class AbstractAuthService(SessionBoundService, metaclass=abc.ABCMeta):
+
+    nested_services = ('user_service',)
 
     def __init__(
         self, session: scoped_session,
@@ -34,7 +38,7 @@ class AbstractAuthService(metaclass=abc.ABCMeta):
             ) -> None:
         self._log = setup_logging(self.__class__.__name__)
         self.session = session
-        self.user_service = UserService(session=session)
+        self.user_service = UserService.for_session(session=session)
         self.validator = AuthSerializer(input_schema, output_schema)
 
     def login(self, user: dict) -> Response:
@@ -67,6 +71,7 @@ class AuthService(AbstractAuthService):
     def _login(self, user: dict) -> Response:
         user = self.validator.deserialize(data=user)
         db_user = self.user_service._get_user_by_username(username=user['username'])
+        self.user_service._release_connection()
         if self.user_service._verify_password(user['password'], db_user.password):
             access_token = self._create_jwt_token(
                 identity=db_user.id,
@@ -83,7 +88,7 @@ class AuthService(AbstractAuthService):
             response_tokens = {'access_token': access_token, 'refresh_token': refresh_token}
             self.validator.serialize(data=response_tokens)
             STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-            response = ResponseBaseSchema().load(
+            response = get_schema(ResponseBaseSchema).load(
                 {
                     'status': {
                         'code': STATUS_CODE,
@@ -112,6 +117,7 @@ class AuthService(AbstractAuthService):
         user_id = get_jwt_identity()
         db_user = self.user_service._get_user(column='id', value=user_id)
         self._log.debug(f'User with username: {db_user.username} currently logged in.')
+        self.user_service._release_connection()
         return self.validator.serialize(data=db_user)
 
     def _logout(self) -> Response:
@@ -119,7 +125,7 @@ class AuthService(AbstractAuthService):
         response_message = {'message': 'User successfully logged out.'}
         self.validator.serialize(data=response_message)
         STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-        response = ResponseBaseSchema().load(
+        response = get_schema(ResponseBaseSchema).load(
             {
                 'status': {
                     'code': STATUS_CODE,
@@ -0,0 +1,20 @@
+from app.config import TestingSqliteConfig
+from auth.tests import test_auth_1
+
+
+class PostAuthLoginSqliteTestCase(test_auth_1.PostAuthLoginTestCase):
+    """Tests for POST '/auth/login' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetAuthMeSqliteTestCase(test_auth_1.GetAuthMeTestCase):
+    """Tests for POST '/auth/me' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostAuthLogoutSqliteTestCase(test_auth_1.PostAuthLogoutTestCase):
+    """Tests for POST '/auth/logout' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
@@ -2,6 +2,7 @@ from flask import Response, jsonify, make_response
 
 from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
+from utils.schemas import get_schema
 
 
 class AuthUserInvalidPasswordException(Exception):
@@ -11,7 +12,7 @@ class AuthUserInvalidPasswordException(Exception):
 def invalid_user_password_error_handler(error: AuthUserInvalidPasswordException) -> Response:
     """Custom AuthUserInvalidPasswordException handler return http Response with error message."""
     STATUS_CODE = HttpStatusCodeConstants.HTTP_401_UNAUTHORIZED.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
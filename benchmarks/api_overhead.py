@@ -0,0 +1,66 @@
+"""Benchmark of the API overhead on the in-process SQLite db.
+
+Runs the full app with the test client against the in-memory SQLite db, no network and no postgres server involved.
+Reports request time per call and the share of it spent in the db, taken from the statistics response headers,
+what is left is the overhead of routing, validation, serialization and the ORM.
+
+Usage:
+    python -m benchmarks.api_overhead [iterations]
+"""
+from typing import Callable
+import sys
+import time
+
+from flask import url_for
+
+from app import create_app
+from app.config import TestingSqliteConfig
+from common.constants.db import QueryStatisticsConstants
+from common.tests.test_data.users import request_test_user_data
+from db import Base, get_session
+from users.services import UserService
+
+
+def timed(function: Callable, iterations: int) -> tuple[float, float]:
+    """Return average request time and average db time of the requests in microseconds."""
+    db_time_ms = 0.0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        response = function()
+        db_time_ms += float(response.headers[QueryStatisticsConstants.TOTAL_TIME_HEADER.value])
+    total_us = (time.perf_counter() - start) / iterations * 1_000_000
+    return total_us, db_time_ms / iterations * 1000
+
+
+def run(iterations: int) -> None:
+    app = create_app(config_name=TestingSqliteConfig.CONFIG_NAME)
+    context = app.test_request_context()
+    context.push()
+    Base.metadata.create_all(app.db_engine)
+    session = get_session(engine=app.db_engine)
+    try:
+        user_id = UserService(session=session)._save_user_data(user=request_test_user_data.ADD_USER_TEST_DATA).id
+        client = app.test_client()
+        users_url = url_for('users.get_users')
+        user_url = url_for('users.get_user', id=user_id)
+
+        results = []
+        for name, request in [
+            ('GET /users', lambda: client.get(users_url)),
+            ('GET /users/{id}', lambda: client.get(user_url)),
+        ]:
+            total_us, db_us = timed(request, iterations)
+            results.append((name, total_us, db_us))
+    finally:
+        session.remove()
+        context.pop()
+        app.db_engine.dispose()
+
+    print(f'{iterations} requests per endpoint on the in-memory SQLite db')
+    print(f'{"":<20}{"request, us":>14}{"db, us":>14}{"db, %":>10}')
+    for name, total_us, db_us in results:
+        print(f'{name:<20}{total_us:>14.1f}{db_us:>14.1f}{db_us / total_us * 100:>10.1f}')
+
+
+if __name__ == '__main__':
+    run(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
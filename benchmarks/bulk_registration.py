@@ -0,0 +1,91 @@
+"""Benchmark of the students batch registration against the one by one registration.
+
+Registers the batch of users as students with a single POST '/students/bulk' request, and a sample of other users
+with POST '/students' request each. Reports registrations per second and statements per registration of both.
+Runs against the testing config database, which is created and dropped by the benchmark.
+
+Usage:
+    python -m benchmarks.bulk_registration [batch] [sample]
+"""
+from uuid import uuid4
+import sys
+import time
+
+from flask import url_for
+
+from sqlalchemy_utils import create_database, database_exists, drop_database
+
+from app import create_app
+from app.config import TestingConfig
+from common.constants.db import QueryStatisticsConstants
+from common.constants.http import HttpStatusCodeConstants
+from db import Base, create_db_url, get_session
+from users.models import User
+from users.services import UserService
+from users.utils.passwords import hash_password
+
+
+def add_users(session, count: int) -> list[str]:
+    """Insert users sharing a single password hash, return their ids."""
+    password = hash_password(password='12345678')
+    rows = [
+        {
+            'id': uuid4(),
+            'username': f'bench_{number}',
+            'email': f'bench_{number}@bench.com',
+            'password': password,
+            'phone_number': f'+38{number:010d}',
+        }
+        for number in range(count)
+    ]
+    UserService(session=session)._insert_objects(table=User, rows=rows)
+    session.commit()
+    return [str(row['id']) for row in rows]
+
+
+def run(batch: int, sample: int) -> None:
+    app = create_app(config_name=TestingConfig.CONFIG_NAME)
+    db_url = create_db_url(config=app.config)
+    if database_exists(db_url):
+        drop_database(db_url)
+    create_database(db_url)
+    Base.metadata.create_all(app.db_engine)
+    session = get_session(engine=app.db_engine)
+    try:
+        user_ids = add_users(session=session, count=batch + sample)
+        session.remove()
+        client = app.test_client()
+        with app.test_request_context():
+            bulk_url, single_url = url_for('students.post_students_bulk'), url_for('students.post_students')
+        payload = [{'id': id, 'student_since': '2015-05-10'} for id in user_ids[:batch]]
+        start = time.perf_counter()
+        response = client.post(bulk_url, json=payload)
+        bulk_elapsed = time.perf_counter() - start
+        if response.status_code != HttpStatusCodeConstants.HTTP_201_CREATED.value:
+            raise AssertionError(f'Batch registration failed with {response.status_code}.')
+        bulk_statements = int(response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+        single_statements = 0
+        start = time.perf_counter()
+        for id in user_ids[batch:]:
+            response = client.post(single_url, json={'id': id, 'student_since': '2015-05-10'})
+            single_statements += int(response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+        single_elapsed = time.perf_counter() - start
+    finally:
+        session.remove()
+        app.db_engine.dispose()
+        drop_database(db_url)
+
+    print(f'{batch} students registered in a batch, {sample} one by one')
+    print(f'{"registration":<14}{"seconds":>10}{"students/s":>14}{"statements/student":>22}')
+    for name, count, elapsed, statements in (
+        ('batch', batch, bulk_elapsed, bulk_statements),
+        ('one by one', sample, single_elapsed, single_statements),
+    ):
+        print(f'{name:<14}{elapsed:>10.2f}{count / elapsed:>14.1f}{statements / count:>22.4f}')
+
+
+if __name__ == '__main__':
+    run(
+        batch=int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        sample=int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,81 @@
+"""Concurrency benchmark of the card ids allocation from the postgres sequence.
+
+Workers threads allocate student card id numbers at once, each allocation in its own transaction as a request does.
+Reports allocations per second and sequence statements per allocation for the block sizes, and checks that every
+allocated number is unique. Runs against the testing config database, which is created and dropped by the benchmark.
+
+Usage:
+    python -m benchmarks.card_id_allocation [allocations] [workers]
+"""
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import time
+
+from sqlalchemy import event
+from sqlalchemy_utils import create_database, database_exists, drop_database
+
+from app import create_app
+from app.config import TestingConfig
+from db import Base, create_db_url, get_session
+from db.sequences import CardIdAllocator
+from students.models import Student, card_id_sequence
+
+BLOCK_SIZES = (1, 10, 100)
+
+
+class SequenceCallCounter:
+    """Counts statements calling the sequence."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if 'nextval' in statement:
+            self.calls += 1
+
+
+def run(allocations: int, workers: int) -> None:
+    app = create_app(config_name=TestingConfig.CONFIG_NAME)
+    db_url = create_db_url(config=app.config)
+    if database_exists(db_url):
+        drop_database(db_url)
+    create_database(db_url)
+    Base.metadata.create_all(app.db_engine)
+    session = get_session(engine=app.db_engine)
+    try:
+        results = []
+        for block_size in BLOCK_SIZES:
+            allocator = CardIdAllocator(block_size=block_size)
+            counter = SequenceCallCounter()
+            event.listen(app.db_engine, 'before_cursor_execute', counter.before_cursor_execute)
+
+            def allocate(_) -> int:
+                number = allocator.next_number(session=session, sequence=card_id_sequence, table=Student)
+                session.commit()
+                session.remove()
+                return number
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                numbers = list(executor.map(allocate, range(allocations)))
+            elapsed = time.perf_counter() - start
+            event.remove(app.db_engine, 'before_cursor_execute', counter.before_cursor_execute)
+            if len(set(numbers)) != allocations:
+                raise AssertionError(f'Duplicated card id numbers allocated with block size {block_size}.')
+            results.append((block_size, allocations / elapsed, counter.calls / allocations))
+    finally:
+        session.remove()
+        app.db_engine.dispose()
+        drop_database(db_url)
+
+    print(f'{allocations} card id allocations by {workers} workers, all numbers unique')
+    print(f'{"block size":<12}{"allocations/s":>16}{"statements/allocation":>24}')
+    for block_size, rate, statements_per_allocation in results:
+        print(f'{block_size:<12}{rate:>16.1f}{statements_per_allocation:>24.3f}')
+
+
+if __name__ == '__main__':
+    run(
+        allocations=int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        workers=int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+    )
@@ -0,0 +1,106 @@
+"""Micro-benchmark of the dynamic column lookup helpers.
+
+Compares lookups built with the legacy Query API on every call against the prebuilt StatementRegistry statements.
+Reports compiled cache hit rate, statement preparation overhead and full lookup time per call.
+Runs against the testing config database, which is created and dropped by the benchmark.
+
+Usage:
+    python -m benchmarks.lookup_statements [iterations]
+"""
+from typing import Callable
+import sys
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import default
+from sqlalchemy_utils import create_database, database_exists, drop_database
+
+from app import create_app
+from app.config import TestingConfig
+from common.tests.test_data.users import request_test_user_data
+from db import Base, create_db_url, get_session
+from db.statements import statements
+from users.models import User
+from users.services import UserService
+
+
+class CacheHitCounter:
+    """Counts compiled cache hits of executed statements."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.total = 0
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.total += 1
+        if context.cache_hit == default.CACHE_HIT:
+            self.hits += 1
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.total = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.total * 100 if self.total else 0.0
+
+
+def timed(function: Callable, iterations: int) -> float:
+    """Return average function call time in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def run(iterations: int) -> None:
+    app = create_app(config_name=TestingConfig.CONFIG_NAME)
+    db_url = create_db_url(config=app.config)
+    if database_exists(db_url):
+        drop_database(db_url)
+    create_database(db_url)
+    Base.metadata.create_all(app.db_engine)
+    counter = CacheHitCounter()
+    event.listen(app.db_engine, 'before_cursor_execute', counter.before_cursor_execute)
+    session = get_session(engine=app.db_engine)
+    try:
+        user_id = UserService(session=session)._save_user_data(user=request_test_user_data.ADD_USER_TEST_DATA).id
+        column, value = 'id', str(user_id)
+
+        def legacy_prepare() -> None:
+            session.query(User).filter(User.__table__.columns[column] == value)._statement_20()._generate_cache_key()
+
+        def registry_prepare() -> None:
+            statements.select_by(table=User, column=column)._generate_cache_key()
+
+        def legacy_lookup() -> None:
+            q = session.query(User).filter(User.__table__.columns[column] == value)
+            session.query(q.exists()).scalar()
+            q.one()
+
+        def registry_lookup() -> None:
+            session.execute(statements.exists_by(table=User, column=column), {'value': value}).scalar()
+            session.execute(statements.select_by(table=User, column=column), {'value': value}).scalar_one()
+
+        results = []
+        for name, prepare, lookup in [
+            ('legacy Query API', legacy_prepare, legacy_lookup),
+            ('statement registry', registry_prepare, registry_lookup),
+        ]:
+            prepare_us = timed(prepare, iterations)
+            counter.reset()
+            lookup_us = timed(lookup, iterations)
+            results.append((name, prepare_us, lookup_us, counter.hit_rate))
+    finally:
+        session.remove()
+        app.db_engine.dispose()
+        drop_database(db_url)
+
+    print(f'{iterations} lookups (exists + select) of User by {column}')
+    print(f'{"":<20}{"prepare, us":>14}{"lookup, us":>14}{"cache hits, %":>16}')
+    for name, prepare_us, lookup_us, hit_rate in results:
+        print(f'{name:<20}{prepare_us:>14.1f}{lookup_us:>14.1f}{hit_rate:>16.1f}')
+
+
+if __name__ == '__main__':
+    run(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,119 @@
+"""Benchmark of the services and schemas built per request against the ones built once per process.
+
+Sets up what the views need for a request, the services with their serializers, loggers and nested services, the
+input, output and response schemas, both ways: built from scratch and bound to the session from the process wide
+instances. Reports CPU time and allocated memory blocks per setup, then CPU time per request of the views with the
+test client on the in-memory SQLite db, no network and no postgres server involved.
+
+Usage:
+    python -m benchmarks.service_setup [iterations]
+"""
+from typing import Callable
+import logging
+import sys
+import time
+import tracemalloc
+
+from flask import url_for
+
+from app import create_app
+from app.config import TestingSqliteConfig
+from common.schemas.response import ResponseBaseSchema
+from common.tests.test_data.users import request_test_user_data
+from courses.schemas import CourseInputSchema, CourseOutputSchema
+from courses.services import CourseService
+from db import Base, get_session
+from users.schemas import UserOutputSchema
+from users.services import UserService
+from utils.schemas import get_schema
+
+
+def built_per_request(session) -> tuple:
+    return (
+        UserService(session=session, output_schema=UserOutputSchema(many=True)),
+        CourseService(
+            session=session,
+            input_schema=CourseInputSchema(many=False),
+            output_schema=CourseOutputSchema(many=False),
+        ),
+        ResponseBaseSchema(),
+    )
+
+
+def bound_per_request(session) -> tuple:
+    return (
+        UserService.for_session(session=session, output_schema=get_schema(UserOutputSchema, many=True)),
+        CourseService.for_session(
+            session=session,
+            input_schema=get_schema(CourseInputSchema, many=False),
+            output_schema=get_schema(CourseOutputSchema, many=False),
+        ),
+        get_schema(ResponseBaseSchema),
+    )
+
+
+def measure_setup(setup: Callable, session, iterations: int) -> tuple[float, float]:
+    """Return CPU time in microseconds and memory blocks allocated per setup, the setups are kept alive."""
+    setup(session)
+    start = time.process_time()
+    for _ in range(iterations):
+        setup(session)
+    cpu_us = (time.process_time() - start) / iterations * 1_000_000
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [setup(session) for _ in range(iterations)]
+    blocks = sum(stat.count_diff for stat in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    tracemalloc.stop()
+    del kept
+    return cpu_us, blocks / iterations
+
+
+def measure_request(request: Callable, iterations: int) -> float:
+    """Return CPU time of the request in microseconds."""
+    request()
+    start = time.process_time()
+    for _ in range(iterations):
+        request()
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def run(iterations: int) -> None:
+    # Services log every call on DEBUG level, the handlers' output is not what is measured.
+    logging.disable(logging.CRITICAL)
+    app = create_app(config_name=TestingSqliteConfig.CONFIG_NAME)
+    context = app.test_request_context()
+    context.push()
+    Base.metadata.create_all(app.db_engine)
+    session = get_session(engine=app.db_engine)
+    try:
+        setups = [
+            ('built per request', *measure_setup(built_per_request, session, iterations)),
+            ('bound per request', *measure_setup(bound_per_request, session, iterations)),
+        ]
+        user_id = UserService(session=session)._save_user_data(user=request_test_user_data.ADD_USER_TEST_DATA).id
+        session.remove()
+        client = app.test_client()
+        users_url = url_for('users.get_users')
+        user_url = url_for('users.get_user', id=user_id)
+        requests = [
+            ('GET /users', measure_request(lambda: client.get(users_url), iterations)),
+            ('GET /users/{id}', measure_request(lambda: client.get(user_url), iterations)),
+        ]
+    finally:
+        session.remove()
+        context.pop()
+        app.db_engine.dispose()
+        logging.disable(logging.NOTSET)
+
+    print(f'{iterations} setups of 2 services and 3 schemas')
+    print(f'{"":<20}{"CPU, us":>12}{"blocks":>12}')
+    for name, cpu_us, blocks in setups:
+        print(f'{name:<20}{cpu_us:>12.1f}{blocks:>12.1f}')
+    print(f'\n{iterations} requests per endpoint on the in-memory SQLite db')
+    print(f'{"":<20}{"CPU, us":>12}')
+    for name, cpu_us in requests:
+        print(f'{name:<20}{cpu_us:>12.1f}')
+
+
+if __name__ == '__main__':
+    run(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
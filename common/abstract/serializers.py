@@ -1,4 +1,5 @@
-from typing import Type
+from itertools import islice
+from typing import Iterable, Iterator, Type
 import abc
 
 from marshmallow import Schema
@@ -26,6 +27,10 @@ class AbstractSerializer(metaclass=abc.ABCMeta):
         """Return serialized data for self.output_schema."""
         return self._serialize(data=data)
 
+    def serialize_stream(self, data: Iterable[Type[Base]], batch_size: int) -> Iterator[list[dict]]:
+        """Return iterator of data batches serialized for self.output_schema."""
+        return self._serialize_stream(data=data, batch_size=batch_size)
+
     @abc.abstractclassmethod
     def _deserialize(self, data: dict) -> None:
         pass
@@ -34,6 +39,10 @@ class AbstractSerializer(metaclass=abc.ABCMeta):
     def _serialize(self, data: Type[Base]) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _serialize_stream(self, data: Iterable[Type[Base]], batch_size: int) -> None:
+        pass
+
 
 class GenericSerializer(AbstractSerializer):
     """Generic class for serialization."""
@@ -51,3 +60,9 @@ class GenericSerializer(AbstractSerializer):
         except ValidationError as err:
             raise err
         return result
+
+    def _serialize_stream(self, data: Iterable[Type[Base]], batch_size: int) -> Iterator[list[dict]]:
+        """Serialize data in batches of batch_size objects, self.output_schema is expected to be many=True."""
+        data = iter(data)
+        while batch := list(islice(data, batch_size)):
+            yield self._serialize(data=batch)
@@ -1,74 +1,658 @@
-from typing import Type
+from copy import copy
+from functools import lru_cache
+from typing import Any, Iterable, Type
+from uuid import UUID
 import abc
 
-from sqlalchemy import desc
+from marshmallow import Schema, ValidationError, fields, validate
+from sqlalchemy import Sequence, and_, func, insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
+from common.constants.db import BulkInsertConstants
+from common.constants.exceptions import SqlalchemyExceptionConstants
+from common.constants.schemas import BulkSchemaConstants
 from db import Base
+from db.sequences import format_card_id, get_card_id_allocator
+from db.statements import statements
+from utils.exceptions import get_error_code
+
+
+class SessionBoundService:
+    """Service built once per process for its schemas and bound to the request's db session per call.
+
+    Services, their serializers and schemas keep no state between the calls but the session, so the bound service is
+    a shallow copy sharing them with the cached one, nested services listed in nested_services are bound as well.
+    """
+
+    session = None
+    nested_services = ()
+
+    @classmethod
+    def for_session(
+        cls,
+        session: Session,
+        input_schema: Schema | None = None,
+        output_schema: Schema | None = None,
+            ) -> 'SessionBoundService':
+        """Return the service of the schemas bound to the session.
+
+        Args:
+            session: db session of the request.
+            input_schema: schema instance the service deserializes the payloads with.
+            output_schema: schema instance the service serializes the objects with.
+
+        Returns:
+        service bound to the session.
+        """
+        return _build_service(cls, input_schema, output_schema).bind(session=session)
+
+    def bind(self, session: Session) -> 'SessionBoundService':
+        """Return copy of the service working with the session."""
+        service = copy(self)
+        service.session = session
+        for name in self.nested_services:
+            setattr(service, name, getattr(self, name).bind(session=session))
+        return service
+
+
+@lru_cache(maxsize=None)
+def _build_service(
+    service_class: Type[SessionBoundService],
+    input_schema: Schema | None,
+    output_schema: Schema | None,
+        ) -> SessionBoundService:
+    """Return service of the schemas built once per process, not bound to any session."""
+    return service_class(session=None, input_schema=input_schema, output_schema=output_schema)
 
 
 class AbstractService(metaclass=abc.ABCMeta):
     """Abstract class for service."""
 
     @abc.abstractclassmethod
-    def _check_obj_exists(self, able: Type[Base], column: str, value: str) -> None:
+    def _get_object(
+        self,
+        table: Type[Base],
+        column: str,
+        value: Any,
+        not_found_error: Type[Exception],
+        options: Iterable = (),
+            ) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _update_object(
+        self,
+        table: Type[Base],
+        column: str,
+        value: Any,
+        values: dict,
+        not_found_error: Type[Exception],
+            ) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _get_objects(self, table: Type[Base], column: str, values: list, options: Iterable = ()) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _get_objects_by_ids(self, table: Type[Base], ids: list[UUID], options: Iterable = ()) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _delete_object(self, table: Type[Base], id: UUID, not_found_error: Type[Exception]) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _delete_objects(self, table: Type[Base], ids: list[UUID]) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _missing_ids(self, ids: list[UUID], found_ids: list[UUID]) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _deserialize_items(self, items: Any) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _unique_conflicts(self, table: Type[Base], items: dict[int, dict]) -> None:
         pass
 
     @abc.abstractclassmethod
-    def _get_last_column_object(self, table: Type[Base], column: str) -> None:
+    def _normalize_rows(self, table: Type[Base], rows: list[dict]) -> None:
         pass
 
     @abc.abstractclassmethod
-    def _create_card_id(self, card_id: str = None) -> None:
+    def _insert_objects(self, table: Type[Base], rows: list[dict]) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _registration_conflicts(
+        self,
+        table: Type[Base],
+        parent_table: Type[Base],
+        exclusive_table: Type[Base],
+        items: dict[int, dict],
+            ) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _commit_registration(
+        self,
+        table: Type[Base],
+        exclusive_table: Type[Base],
+        id: UUID,
+        exists_error: Type[Exception],
+            ) -> None:
+        pass
 
-class GenericService(AbstractService):
+    @abc.abstractclassmethod
+    def _add_registrations(
+        self,
+        table: Type[Base],
+        parent_table: Type[Base],
+        exclusive_table: Type[Base],
+        card_id_prefix: str,
+        card_id_sequence: Sequence,
+        items: Any,
+            ) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _save_registrations(
+        self,
+        table: Type[Base],
+        card_id_prefix: str,
+        card_id_sequence: Sequence,
+        items: list[dict],
+            ) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _create_card_id(self, prefix: str, sequence: Sequence, table: Type[Base]) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _create_card_ids(self, prefix: str, sequence: Sequence, table: Type[Base], count: int) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _release_connection(self) -> None:
+        pass
+
+
+class GenericService(AbstractService, SessionBoundService):
     """Generic class for services."""
 
-    def _check_obj_exists(self, table: Type[Base], column: str, value: str) -> bool:
-        """Check if object exists in the specified db table.
+    def _get_object(
+        self,
+        table: Type[Base],
+        column: str,
+        value: Any,
+        not_found_error: Type[Exception],
+        options: Iterable = (),
+            ) -> Base:
+        """Return object from the specified db table with a single SELECT, raise not found error if there is none.
 
         Args:
-            table: db table to check.
+            table: db table to look up.
             column: name of table column to look up.
             value: to find in the table.
+            not_found_error: exception raised if the object is not in the table.
+            options: loader options of the object's relationships.
 
         Returns:
-        bool of the object existence.
+        table's object.
         """
-        self._log.debug(f'Checking if {table.__table__.name} object with {column}: {value} exists.')
-        q = self.session.query(table).filter(table.__table__.columns[column] == value)
-        obj_exists = self.session.query(q.exists()).scalar()
-        if not obj_exists:
-            return False
-        return True
+        self._log.debug(f'Getting {table.__name__} with {column}: {value}.')
+        statement = statements.select_by(table=table, column=column)
+        if options:
+            statement = statement.options(*options)
+        db_object = self.session.execute(statement, {'value': value}).scalar_one_or_none()
+        if db_object is None:
+            raise not_found_error(f'{table.__name__} with {column}: {value} not found.')
+        return db_object
+
+    def _update_object(
+        self,
+        table: Type[Base],
+        column: str,
+        value: Any,
+        values: dict,
+        not_found_error: Type[Exception],
+            ) -> Base:
+        """Update object in the specified db table with a single UPDATE ... RETURNING, raise not found error if
+        no object was updated.
 
-    def _get_last_column_object(self, table: Type[Base], column: str) -> str | None:
-        """Return last column's object from the db filtered by 'created_at' column.
+        SQLite dialect doesn't support RETURNING, the updated object is selected after the UPDATE there.
 
         Args:
-            table: db table to check.
+            table: db table to update.
             column: name of table column to look up.
             value: to find in the table.
+            values: dict of the updated columns and their new values.
+            not_found_error: exception raised if the object is not in the table.
+
+        Returns:
+        Updated table's object.
+        """
+        self._log.debug(f'Updating {table.__name__} with {column}: {value}.')
+        statement = statements.update_by(table=table, column=column).values(**values)
+        if not self.session.get_bind().dialect.full_returning:
+            if not self.session.execute(statement, {'value': value}).rowcount:
+                raise not_found_error(f'{table.__name__} with {column}: {value} not found.')
+            return self._get_object(table=table, column=column, value=value, not_found_error=not_found_error)
+        statement = select(table).from_statement(statement.returning(*table.__table__.columns))
+        db_object = self.session.execute(
+            statement, {'value': value}, execution_options={'populate_existing': True},
+        ).scalar_one_or_none()
+        if db_object is None:
+            raise not_found_error(f'{table.__name__} with {column}: {value} not found.')
+        return db_object
+
+    def _get_objects(self, table: Type[Base], column: str, values: list, options: Iterable = ()) -> list[Base]:
+        """Return objects from the specified db table with column value in the list of values with a single SELECT.
+
+        Args:
+            table: db table to look up.
+            column: name of table column to look up.
+            values: list of values to find in the table.
+            options: loader options of the objects' relationships.
 
         Returns:
-        table's object if it is in the table or None if it is not.
+        list of table's objects found, in no particular order.
         """
-        object = self.session.query(
-            table.__table__.columns[column],
-        ).order_by(desc(table.created_at)).limit(1).scalar()
-        self._log.debug(f'Getting last value: "{object}" from column: "{column}" in {table.__table__.name} table.')
-        return object
+        self._log.debug(f'Getting {len(values)} {table.__name__} objects by {column}.')
+        statement = statements.select_in(table=table, column=column)
+        if options:
+            statement = statement.options(*options)
+        return self.session.execute(statement, {'values': values}).scalars().all()
 
-    def _create_card_id(self, card_id: str = None) -> str:
-        """Get card_id number and increment its value by +1.
+    def _get_objects_by_ids(
+        self,
+        table: Type[Base],
+        ids: list[UUID],
+        options: Iterable = (),
+            ) -> tuple[list[Base], list[dict]]:
+        """Return objects from the specified db table by ids with a single SELECT, in the order of ids.
 
         Args:
-            card_id: string contains card_id, PREFIX-NUMBER.
+            table: db table to look up.
+            ids: list of UUIDs of the objects.
+            options: loader options of the objects' relationships.
 
         Returns:
-        Incremented by +1 card_id string.
+        tuple of lists: objects found and not found errors of the missing ids.
+        """
+        db_objects = {
+            db_object.id: db_object
+            for db_object in self._get_objects(table=table, column='id', values=ids, options=options)
+        }
+        errors = [
+            {'id': id, 'message': f'{table.__name__} with id: {id} not found.'}
+            for id in self._missing_ids(ids=ids, found_ids=list(db_objects))
+        ]
+        return [db_objects[id] for id in ids if id in db_objects], errors
+
+    def _delete_object(self, table: Type[Base], id: UUID, not_found_error: Type[Exception]) -> None:
+        """Soft delete object from the specified db table with a single UPDATE, raise not found error if there is none.
+
+        Args:
+            table: db table to delete the object from.
+            id: UUID of the object.
+            not_found_error: exception raised if the object is not in the table.
+
+        Returns:
+        Nothing.
+        """
+        if not self._delete_objects(table=table, ids=[id]):
+            raise not_found_error(f'{table.__name__} with id: {id} not found.')
+
+    def _delete_objects(self, table: Type[Base], ids: list[UUID]) -> list[UUID]:
+        """Soft delete objects from the specified db table with a single UPDATE ... RETURNING.
+
+        SQLite dialect doesn't support RETURNING, the objects ids are selected before the UPDATE there.
+
+        Args:
+            table: db table to delete the objects from.
+            ids: list of UUIDs of the objects.
+
+        Returns:
+        list of UUIDs of the deleted objects in the order of ids, already deleted and missing objects are left out.
+        """
+        self._log.debug(f'Deleting {len(ids)} {table.__name__} objects.')
+        statement = statements.update_in(table=table, column='id').values(deleted_at=func.now())
+        if not self.session.get_bind().dialect.full_returning:
+            deleted_ids = {db_object.id for db_object in self._get_objects(table=table, column='id', values=ids)}
+            if deleted_ids:
+                self.session.execute(
+                    statement, {'values': list(deleted_ids)}, execution_options={'synchronize_session': False},
+                )
+        else:
+            deleted_ids = set(self.session.execute(
+                statement.returning(table.id), {'values': ids}, execution_options={'synchronize_session': False},
+            ).scalars())
+        return [id for id in ids if id in deleted_ids]
+
+    def _missing_ids(self, ids: list[UUID], found_ids: list[UUID]) -> list[UUID]:
+        """Return ids of the request not found in the db, in the order of the request."""
+        found_ids = set(found_ids)
+        return [id for id in ids if id not in found_ids]
+
+    def _deserialize_items(self, items: Any) -> tuple[dict[int, dict], dict[int, Any]]:
+        """Deserialize items of the bulk request one by one with the validator's input schema.
+
+        Args:
+            items: bulk request's payload, list of items.
+
+        Raises:
+        marshmallow ValidationError if items is not a list of 1 to ITEMS_MAX_COUNT items.
+
+        Returns:
+        tuple of dicts by the item's index: deserialized items and validation errors of the invalid ones.
+        """
+        items = fields.List(
+            fields.Raw(),
+            validate=validate.Length(min=1, max=BulkSchemaConstants.ITEMS_MAX_COUNT.value),
+        ).deserialize(items)
+        valid, errors = {}, {}
+        for index, item in enumerate(items):
+            try:
+                valid[index] = self.validator.deserialize(data=item)
+            except ValidationError as err:
+                errors[index] = err.messages
+        return valid, errors
+
+    def _unique_conflicts(self, table: Type[Base], items: dict[int, dict]) -> dict[int, str]:
+        """Return error messages of the items conflicting on the table's unique columns with a single SELECT.
+
+        Items conflict with the table's rows, soft deleted ones included as they keep their unique values,
+        and with the items of lower index.
+
+        Args:
+            table: db table the items are inserted to.
+            items: deserialized items by the item's index.
+
+        Returns:
+        dict of error messages by the conflicting item's index.
+        """
+        if not items:
+            return {}
+        columns = [column.name for column in table.__table__.columns if column.unique]
+        values = {
+            column: [item[column] for item in items.values() if item.get(column) is not None] for column in columns
+        }
+        self._log.debug(f'Checking {len(items)} {table.__name__} objects for unique values of {columns}.')
+        statement = select(*(getattr(table, column) for column in columns)).where(
+            or_(*(getattr(table, column).in_(values[column]) for column in columns)),
+        )
+        taken = {pair for row in self.session.execute(statement) for pair in zip(columns, row)}
+        conflicts = {}
+        for index, item in items.items():
+            pairs = [(column, item[column]) for column in columns if item.get(column) is not None]
+            conflict = next((pair for pair in pairs if pair in taken), None)
+            if conflict:
+                conflicts[index] = f'{table.__name__} with {conflict[0]}: {conflict[1]} already exists.'
+                continue
+            taken.update(pairs)
+        return conflicts
+
+    def _normalize_rows(self, table: Type[Base], rows: list[dict]) -> list[dict]:
+        """Return rows with the same columns, multi-row INSERT takes its columns from the first row.
+
+        Columns are the ones given by any of the rows and the ones with the python side default, the row's missing
+        values are the column's default or None. Columns of the server side defaults given by none of the rows are
+        left to the db.
+
+        Args:
+            table: db table the rows are inserted to.
+            rows: list of column values of the rows.
+
+        Returns:
+        list of the rows' column values.
+        """
+        given = {key for row in rows for key in row}
+        columns = [
+            column for column in table.__table__.columns
+            if column.key in given or (column.default is not None and not column.default.is_sequence)
+        ]
+        normalized = []
+        for row in rows:
+            values = {}
+            for column in columns:
+                if column.key in row:
+                    values[column.key] = row[column.key]
+                elif column.default is None or column.default.is_sequence:
+                    values[column.key] = None
+                elif column.default.is_callable:
+                    values[column.key] = column.default.arg(None)
+                else:
+                    values[column.key] = column.default.arg
+            normalized.append(values)
+        return normalized
+
+    def _insert_objects(self, table: Type[Base], rows: list[dict]) -> list[dict]:
+        """Insert rows to the specified db table with a single multi-row INSERT.
+
+        Objects aren't loaded to the session, rows have to carry the values the caller returns, the primary key
+        included. Rows are normalized to the same columns first. Drivers binding the parameters on the server get
+        the rows in as few INSERTs as their parameters limit allows.
+
+        Args:
+            table: db table to insert to.
+            rows: list of column values of the rows.
+
+        Returns:
+        list of the inserted rows' column values.
+        """
+        self._log.debug(f'Inserting {len(rows)} {table.__name__} objects.')
+        rows = self._normalize_rows(table=table, rows=rows)
+        rows_per_statement = len(rows)
+        if self.session.get_bind().dialect.driver in BulkInsertConstants.PARAMETERS_LIMITED_DRIVERS.value:
+            rows_per_statement = BulkInsertConstants.MAX_PARAMETERS.value // len(table.__table__.columns)
+        for start in range(0, len(rows), rows_per_statement):
+            self.session.execute(insert(table).values(rows[start:start + rows_per_statement]))
+        return rows
+
+    def _registration_conflicts(
+        self,
+        table: Type[Base],
+        parent_table: Type[Base],
+        exclusive_table: Type[Base],
+        items: dict[int, dict],
+            ) -> dict[int, str]:
+        """Return error messages of the items which can't be registered in the table, with a single SELECT.
+
+        Item's id has to be the id of the parent table's object, not registered in the table yet, soft deleted
+        objects included as they keep their primary key, and not registered in the exclusive table, nor by the
+        item of lower index. The exclusive role trigger rejects the whole INSERT if a concurrent request registers
+        the item's id in the exclusive table after the check.
+
+        Args:
+            table: db table the items are inserted to.
+            parent_table: db table the items' ids refer to.
+            exclusive_table: db table the items' ids can't be registered in.
+            items: deserialized items by the item's index.
+
+        Returns:
+        dict of error messages by the conflicting item's index.
+        """
+        if not items:
+            return {}
+        ids = list({item['id'] for item in items.values()})
+        self._log.debug(f'Checking {len(ids)} ids for {table.__name__} registration.')
+        statement = (
+            select(parent_table.id, table.id.is_not(None), exclusive_table.id.is_not(None))
+            .outerjoin(table, table.id == parent_table.id)
+            .outerjoin(
+                exclusive_table,
+                and_(exclusive_table.id == parent_table.id, exclusive_table.deleted_at.is_(None)),
+            )
+            .where(parent_table.id.in_(ids))
+        )
+        found = {id: (registered, exclusive) for id, registered, exclusive in self.session.execute(statement)}
+        conflicts, taken = {}, set()
+        for index, item in items.items():
+            id = item['id']
+            if id not in found:
+                conflicts[index] = f'Foreign key violation id: {id} is not present in table.'
+            elif found[id][1]:
+                conflicts[index] = (
+                    f'{table.__name__} with id: {id} can not be created, '
+                    f'because a {exclusive_table.__name__} with id: {id} already exists.'
+                )
+            elif found[id][0] or id in taken:
+                conflicts[index] = f'{table.__name__} with id: {id} already exists.'
+            taken.add(id)
+        return conflicts
+
+    def _commit_registration(
+        self,
+        table: Type[Base],
+        exclusive_table: Type[Base],
+        id: UUID,
+        exists_error: Type[Exception],
+            ) -> None:
+        """Commit the object registered in the table, raise exists error if the db rejected it.
+
+        The table's exclusive role trigger rejects the object of the user registered in the exclusive table within
+        the INSERT, concurrent registrations of the user can't both pass it.
+
+        Args:
+            table: db table the object is inserted to.
+            exclusive_table: db table the object's id can't be registered in.
+            id: id of the inserted object.
+            exists_error: exception raised if the id is registered in the exclusive table.
+        """
+        try:
+            self.session.commit()
+        except IntegrityError as err:
+            if get_error_code(error=err) != SqlalchemyExceptionConstants.EXCLUSION_VIOLATION_CODE.value:
+                raise
+            self.session.rollback()
+            raise exists_error(
+                f'{table.__name__} with id: {id} can not be created, '
+                f'because a {exclusive_table.__name__} with id: {id} already exists.'
+            ) from err
+
+    def _add_registrations(
+        self,
+        table: Type[Base],
+        parent_table: Type[Base],
+        exclusive_table: Type[Base],
+        card_id_prefix: str,
+        card_id_sequence: Sequence,
+        items: Any,
+            ) -> tuple[list[dict], list[dict]]:
+        """Register the bulk request's items in the table, the valid ones are inserted and the invalid ones reported.
+
+        Args:
+            table: db table the items are inserted to.
+            parent_table: db table the items' ids refer to.
+            exclusive_table: db table the items' ids can't be registered in.
+            card_id_prefix: card_id prefix of the table's objects.
+            card_id_sequence: postgres sequence of the table's card ids.
+            items: bulk request's payload, list of items.
+
+        Returns:
+        tuple of lists: created objects serialized with the output schema and error messages, by the item's index.
+        """
+        valid, errors = self._deserialize_items(items=items)
+        for index, item in valid.items():
+            if 'id' not in item:
+                errors[index] = {'id': ['Missing data for required field.']}
+        valid = {index: item for index, item in valid.items() if index not in errors}
+        errors.update(
+            self._registration_conflicts(
+                table=table, parent_table=parent_table, exclusive_table=exclusive_table, items=valid,
+            ),
+        )
+        valid = {index: item for index, item in valid.items() if index not in errors}
+        rows = self._save_registrations(
+            table=table,
+            card_id_prefix=card_id_prefix,
+            card_id_sequence=card_id_sequence,
+            items=list(valid.values()),
+        )
+        self._release_connection()
+        created = zip(valid, self.validator.serialize(data=rows))
+        return (
+            [{'index': index, 'data': item} for index, item in created],
+            [{'index': index, 'message': errors[index]} for index in sorted(errors)],
+        )
+
+    def _save_registrations(
+        self,
+        table: Type[Base],
+        card_id_prefix: str,
+        card_id_sequence: Sequence,
+        items: list[dict],
+            ) -> list[dict]:
+        """Save the items in the table with a single INSERT, card_ids are reserved for the whole batch at once.
+
+        Args:
+            table: db table the items are inserted to.
+            card_id_prefix: card_id prefix of the table's objects.
+            card_id_sequence: postgres sequence of the table's card ids.
+            items: list of dicts of deserialized items.
+
+        Returns:
+        list of inserted rows.
+        """
+        if not items:
+            return []
+        card_ids = self._create_card_ids(
+            prefix=card_id_prefix, sequence=card_id_sequence, table=table, count=len(items),
+        )
+        rows = self._insert_objects(
+            table=table, rows=[{**item, 'card_id': card_id} for item, card_id in zip(items, card_ids)],
+        )
+        self.session.commit()
+        self._log.debug(
+            f'Created {len(rows)} {table.__name__} objects with card_ids from {card_ids[0]} to {card_ids[-1]}.'
+        )
+        return rows
+
+    def _create_card_id(self, prefix: str, sequence: Sequence, table: Type[Base]) -> str:
+        """Create card_id with the number allocated from the table's sequence.
+
+        Args:
+            prefix: card_id prefix, PREFIX-NUMBER.
+            sequence: postgres sequence of the table's card ids.
+            table: db table with the card_id column.
+
+        Returns:
+        Formatted card_id string.
+        """
+        number = get_card_id_allocator().next_number(session=self.session, sequence=sequence, table=table)
+        card_id = format_card_id(prefix=prefix, number=number)
+        self._log.debug(f'Allocated card_id: "{card_id}" for {table.__table__.name} table.')
+        return card_id
+
+    def _create_card_ids(self, prefix: str, sequence: Sequence, table: Type[Base], count: int) -> list[str]:
+        """Create count of card_ids with the numbers reserved from the table's sequence with a single statement.
+
+        Args:
+            prefix: card_id prefix, PREFIX-NUMBER.
+            sequence: postgres sequence of the table's card ids.
+            table: db table with the card_id column.
+            count: number of card_ids.
+
+        Returns:
+        list of formatted card_id strings.
+        """
+        numbers = get_card_id_allocator().next_numbers(
+            session=self.session, sequence=sequence, table=table, count=count,
+        )
+        self._log.debug(f'Allocated {count} card_ids for {table.__table__.name} table.')
+        return [format_card_id(prefix=prefix, number=number) for number in numbers]
+
+    def _release_connection(self) -> None:
+        """End the session's transaction and return its connection to the pool before the serialization.
+
+        Session's objects are detached with their loaded state, relationships to serialize have to be loaded
+        before, the serialization doesn't hold the pool's connection and doesn't emit lazy loading statements.
         """
-        prefix, number = card_id.split('-')
-        number = int(number) + 1
-        return f'{prefix}-{number:07d}'
+        self._log.debug('Releasing db connection before the serialization.')
+        self.session.close()
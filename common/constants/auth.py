@@ -16,3 +16,10 @@ class AuthJWTConstants(enum.Enum):
     TOKEN_EXPIRE_7 = 7
     TOKEN_EXPIRE_30 = 30
     TOKEN_EXPIRE_60 = 60
+
+
+class PasswordHashConstants(enum.Enum):
+    """Password hashing constants."""
+    ARGON2_ROUNDS = 4
+    # Chunks of the batch handed to each worker process, evens out the workers load.
+    CHUNKS_PER_WORKER = 4
@@ -0,0 +1,71 @@
+import enum
+
+from common.constants.exceptions import SqlalchemyExceptionConstants
+
+
+class DatabaseBackendConstants(enum.Enum):
+    """DB backends constants."""
+    POSTGRESQL = 'postgresql'
+    SQLITE = 'sqlite'
+    SQLITE_MEMORY_PATH = ':memory:'
+
+
+class DatabaseRoutingConstants(enum.Enum):
+    """Read replicas routing constants."""
+    ROUND_ROBIN = 'round_robin'
+    LEAST_LOADED = 'least_loaded'
+    PRIMARY_STICKINESS_COOKIE_NAME = 'db_primary_until'
+    SESSION_READ_ONLY_KEY = 'read_only'
+    SESSION_REPLICA_KEY = 'replica'
+
+
+class QueryStatisticsConstants(enum.Enum):
+    """Per-request statements statistics constants."""
+    STATEMENT_COUNT_HEADER = 'X-DB-Statement-Count'
+    TOTAL_TIME_HEADER = 'X-DB-Time-Ms'
+    REPEATED_STATEMENTS_HEADER = 'X-DB-Repeated-Statements'
+
+
+class StatementCommentConstants(enum.Enum):
+    """Statements comments attribution constants."""
+    REQUEST_ID_HEADER = 'X-Request-ID'
+    REQUEST_ID_MAX_LENGTH = 64
+    UNATTRIBUTED_ENDPOINT = 'unattributed'
+
+
+class TransactionRetryConstants(enum.Enum):
+    """Serialization failures and deadlocks retry constants."""
+    RETRYABLE_CODES = (
+        SqlalchemyExceptionConstants.SERIALIZATION_FAILURE_CODE.value,
+        SqlalchemyExceptionConstants.DEADLOCK_DETECTED_CODE.value,
+    )
+    MAX_ATTEMPTS = 5
+    BASE_BACKOFF_MS = 10
+    MAX_BACKOFF_MS = 500
+    SESSION_RETRY_SCOPE_KEY = 'retry_scope'
+
+
+class RequestDeadlineConstants(enum.Enum):
+    """Request deadline propagation constants."""
+    DEADLINE_HEADER = 'X-Request-Timeout'
+    SESSION_DEADLINE_KEY = 'deadline'
+
+
+class CardIdConstants(enum.Enum):
+    """Students and teachers card ids allocation constants."""
+    BLOCK_SIZE = 1
+    NUMBER_WIDTH = 7
+
+
+class BulkInsertConstants(enum.Enum):
+    """Multi-row INSERT constants."""
+    # Drivers limiting the number of the statement's parameters, psycopg2 inlines them.
+    PARAMETERS_LIMITED_DRIVERS = ('pysqlite',)
+    MAX_PARAMETERS = 32766
+
+
+class ExclusiveRoleConstants(enum.Enum):
+    """Constants of the triggers keeping a user registered either as a student or as a teacher."""
+    FUNCTION_NAME = 'check_exclusive_role'
+    TRIGGER_SUFFIX = 'exclusive_role'
+    INSERTED_ROWS = 'inserted_rows'
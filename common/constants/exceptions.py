@@ -5,3 +5,19 @@ class SqlalchemyExceptionConstants(enum.Enum):
     """sqlalchemy exceptions constants."""
     INTEGRITY_ERROR_TABLE_NAME_REGEX = r'"(.*?)"'
     INTEGRITY_ERROR_FIELD_VALUE_REGEX = r'\((.*?)\)'
+    # SQLite integrity error message: constraint type, table and column of the failed unique constraint.
+    SQLITE_INTEGRITY_ERROR_REGEX = r'(UNIQUE|FOREIGN KEY) constraint failed(?:: (\w+)\.(\w+))?'
+    SQLITE_UNIQUE_CONSTRAINT = 'UNIQUE'
+    # Message of the user registered as a student and as a teacher, rejected by the exclusive role trigger.
+    EXCLUSIVE_ROLE_ERROR_REGEX = r'(\w+ (?:with id: \S+ )?can not be created, because a \w+ with .*?already exists\.)'
+    # Column names of the SQLite INSERT and UPDATE statements, in order of their positional parameters.
+    SQLITE_INSERT_COLUMNS_REGEX = r'\(([^)]*)\) VALUES'
+    SQLITE_UPDATE_COLUMNS_REGEX = r'(\w+)=\?'
+    # SQLSTATE codes of the integrity errors, the same for every postgres driver.
+    UNIQUE_VIOLATION_CODE = '23505'
+    FOREIGN_KEY_VIOLATION_CODE = '23503'
+    EXCLUSION_VIOLATION_CODE = '23P01'
+    SERIALIZATION_FAILURE_CODE = '40001'
+    DEADLOCK_DETECTED_CODE = '40P01'
+    # SQLSTATE code of the statement cancelled by statement_timeout.
+    QUERY_CANCELED_CODE = '57014'
@@ -18,7 +18,8 @@ class TeacherModelConstants(enum.Enum):
     CHAR_SIZE_64 = 64
     CHAR_SIZE_256 = 256
 
-    CARD_ID_DEFAULT_NUMBER = 'UNI-0000000'
+    CARD_ID_PREFIX = 'UNI'
+    CARD_ID_SEQUENCE = 'teachers_card_id_seq'
 
     # Booleans.
     TRUE = True
@@ -31,7 +32,8 @@ class StudentsModelConstants(enum.Enum):
     CHAR_SIZE_64 = 64
     CHAR_SIZE_256 = 256
 
-    CARD_ID_DEFAULT_NUMBER = 'STU-0000000'
+    CARD_ID_PREFIX = 'STU'
+    CARD_ID_SEQUENCE = 'students_card_id_seq'
 
     # Booleans.
     TRUE = True
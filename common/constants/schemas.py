@@ -54,3 +54,14 @@ class SubjectSchemaConstants(enum.Enum):
     CHAR_SIZE_16 = 16
     CHAR_SIZE_64 = 64
     CHAR_SIZE_256 = 256
+
+
+class IdsQuerySchemaConstants(enum.Enum):
+    """Ids query string schema constants."""
+    IDS_DELIMITER = ','
+    IDS_MAX_COUNT = 1000
+
+
+class BulkSchemaConstants(enum.Enum):
+    """Bulk requests payload constants."""
+    ITEMS_MAX_COUNT = 5000
@@ -0,0 +1,28 @@
+from marshmallow import Schema, fields, validate
+
+from common.constants.schemas import IdsQuerySchemaConstants
+
+
+class DelimitedList(fields.List):
+    """List field loaded from the delimited string of the query string parameter."""
+
+    def _deserialize(self, value, attr, data, **kwargs) -> list:
+        if not isinstance(value, str):
+            raise self.make_error('invalid')
+        items = [item for item in value.split(IdsQuerySchemaConstants.IDS_DELIMITER.value) if item]
+        return super()._deserialize(items, attr, data, **kwargs)
+
+
+class IdsQuerySchema(Schema):
+    """Schema of the bulk requests query string, 'ids' parameter of comma separated UUIDs."""
+
+    ids = DelimitedList(
+        fields.UUID(),
+        required=True,
+        validate=[
+            validate.Length(
+                min=1,
+                max=IdsQuerySchemaConstants.IDS_MAX_COUNT.value,
+            ),
+        ],
+    )
@@ -4,6 +4,7 @@ import random
 from flask import Config
 
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm import DeclarativeMeta
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
@@ -11,6 +12,7 @@ from app import create_app
 from app.config import TestingConfig
 from auth.services import AuthService
 from common.constants.auth import AuthJWTConstants
+from common.constants.db import DatabaseBackendConstants
 from common.tests.test_data.courses import request_test_course_data
 from common.tests.test_data.students import request_test_student_data
 from common.tests.test_data.subjects import request_test_subject_data
@@ -18,7 +20,7 @@ from common.tests.test_data.teachers import request_test_teacher_data
 from common.tests.test_data.users import request_test_user_data
 from courses.models import Course
 from courses.services import CourseService
-from db import Base, get_session
+from db import Base, create_db_url, get_session
 from students.models import Student
 from students.services import StudentService
 from subjects.models import Subject
@@ -32,8 +34,10 @@ from users.services import UserService
 class TestMixin:
     """Generic test helper class."""
 
+    config_name = TestingConfig.CONFIG_NAME
+
     def setUp(self) -> None:
-        self.app = create_app(config_name=TestingConfig.CONFIG_NAME)
+        self.app = create_app(config_name=self.config_name)
         self.context = self.app.test_request_context()
         self.context.push()
         # Database creation.
@@ -46,28 +50,40 @@ class TestMixin:
         self.client = self.app.test_client()
 
     def tearDown(self) -> None:
+        self.app.password_hasher.shutdown()
         self.context.pop()
         self.db_session.remove()
         self.drop_db(url=self.db_url)
 
     def create_db(self, url: str) -> None:
-        """Create test database in postgres server."""
+        """Create test database in postgres server, in-memory SQLite db is created with its connection."""
+        if self.is_memory_db(url=url):
+            return
         if database_exists(url):
             drop_database(url)
         create_database(url)
 
     def drop_db(self, url) -> None:
-        """Delete test database from postgres server."""
+        """Delete test database from postgres server, in-memory SQLite db is gone with its connection."""
+        if self.is_memory_db(url=url):
+            return
         if database_exists(url):
             drop_database(url)
 
+    def is_memory_db(self, url: str) -> bool:
+        """Return bool of the url pointing to in-memory SQLite db."""
+        return make_url(url).database == DatabaseBackendConstants.SQLITE_MEMORY_PATH.value
+
+    def returning_statement_count(self, statements: int) -> str:
+        """Return statement count header of the request writing a single object.
+
+        SQLite has no RETURNING, the written object's columns are selected after the INSERT or UPDATE there.
+        """
+        return str(statements if self.app.db_engine.dialect.full_returning else statements + 1)
+
     def create_db_url(self, config: Config) -> str:
-        """Return formatted postgres db url."""
-        return (
-            f'{config["POSTGRES_DIALECT_DRIVER"]}://{config["POSTGRES_DB_USERNAME"]}:'
-            f'{config["POSTGRES_DB_PASSWORD"]}@{config["POSTGRES_DB_HOST"]}:'
-            f'{config["POSTGRES_DB_PORT"]}/{config["POSTGRES_DB_NAME"]}'
-        )
+        """Return formatted db url."""
+        return create_db_url(config=config)
 
     def create_tables(self, engine: Engine, Base: DeclarativeMeta) -> None:
         """Create db tables in test database."""
@@ -15,3 +15,24 @@ UPDATE_USER_TEST_DATA = {
     'email': 'updated_john@john.com',
     'phone_number': '+380994445566',
 }
+ADD_USERS_BULK_TEST_DATA = [
+    ADD_USER_TEST_DATA,
+    {
+        'username': 'test_jane',
+        'first_name': 'jane',
+        'last_name': 'bar',
+        'email': 'test_jane@jane.com',
+        'password': '87654321',
+        'phone_number': '+380997778899',
+    },
+]
+ADD_USERS_BULK_MIXED_TEST_DATA = [
+    # Valid user.
+    ADD_USERS_BULK_TEST_DATA[1],
+    # Invalid user.
+    ADD_USER_EMPTY_TEST_DATA,
+    # User with the username already in the db.
+    ADD_USER_TEST_DATA,
+    # User with the email of the first user in the payload.
+    {**ADD_USERS_BULK_TEST_DATA[1], 'username': 'test_jane_2', 'phone_number': '+380990000000'},
+]
@@ -1,13 +1,13 @@
 import uuid
 
 from sqla_softdelete import SoftDeleteMixin
-from sqlalchemy import Column, Date, DateTime, ForeignKey, String, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint, func
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from common.constants.models import CourseModelConstants
 from db import Base
+from db.types import GUID, ISODate
 
 
 class CourseStudentAssociation(Base):
@@ -17,10 +17,11 @@ class CourseStudentAssociation(Base):
     __table_args__ = (
         UniqueConstraint('course_id', 'student_id', name='_course_student_uc'),
     )
+    __mapper_args__ = {'eager_defaults': True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    course_id = Column(UUID(as_uuid=True), ForeignKey('courses.id'), nullable=False)
-    student_id = Column(UUID(as_uuid=True), ForeignKey('students.id'), nullable=False)
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
+    course_id = Column(GUID(), ForeignKey('courses.id'), nullable=False)
+    student_id = Column(GUID(), ForeignKey('students.id'), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     course = relationship('Course', back_populates='students_association')
     student = relationship('Student', back_populates='courses')
@@ -33,20 +34,21 @@ class Course(SoftDeleteMixin, Base):
     """A model representing a course."""
 
     __tablename__ = 'courses'
+    __mapper_args__ = {'eager_defaults': True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
 
-    teacher_id = Column(UUID(as_uuid=True), ForeignKey('teachers.id'), nullable=False)
+    teacher_id = Column(GUID(), ForeignKey('teachers.id'), nullable=False)
     teacher = relationship('Teacher', back_populates='courses')
 
     students_association = relationship('CourseStudentAssociation', back_populates='course')
     students = association_proxy('students_association', 'student')
 
-    subject_id = Column(UUID(as_uuid=True), ForeignKey('subjects.id'), nullable=False, unique=True)
+    subject_id = Column(GUID(), ForeignKey('subjects.id'), nullable=False, unique=True)
     subject = relationship('Subject', back_populates='course')
 
-    start_date = Column(Date, nullable=False)
-    end_date = Column(Date, nullable=False)
+    start_date = Column(ISODate(), nullable=False)
+    end_date = Column(ISODate(), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
 
     def __repr__(self):
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from flask import Blueprint, Response, g, jsonify, make_response, request
+from flask import Blueprint, Response, current_app, g, jsonify, make_response, request
 
 from flask_jwt_extended import jwt_required
 
@@ -9,6 +9,9 @@ from common.schemas.response import ResponseBaseSchema
 from courses.schemas import CourseInputSchema, CourseOutputSchema, CourseStudentInputSchema, CourseUpdateSchema
 from courses.services import CourseService
 from students.schemas import StudentOutputSchema
+from utils.requests import get_request_ids
+from utils.responses import stream_response
+from utils.schemas import get_schema
 
 courses_bp = Blueprint('courses', __name__, url_prefix='/courses')
 course_students_bp = Blueprint('course_students', __name__, '/students')
@@ -17,23 +20,31 @@ courses_bp.register_blueprint(course_students_bp)
 
 @courses_bp.get('/')
 def get_courses() -> Response:
-    """GET '/courses' endpoint view function.
+    """GET '/courses' and '/courses?ids={id},{id}' endpoint view function.
 
     Returns:
     http response with json data: list of Course model objects serialized with CourseOutputSchema.
     """
-    courses = CourseService(
-        session=g.db_session,
-        output_schema=CourseOutputSchema(many=True),
-    ).get_courses()
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    service = CourseService.for_session(
+        session=g.db_session,
+        output_schema=get_schema(CourseOutputSchema, many=True),
+    )
+    errors = []
+    if 'ids' in request.args:
+        courses, errors = service.get_courses_by_ids(ids=get_request_ids())
+    elif current_app.config['LIST_STREAMING_ENABLED']:
+        courses = service.stream_courses(batch_size=current_app.config['LIST_STREAMING_BATCH_SIZE'])
+        return stream_response(data=courses, status_code=STATUS_CODE)
+    else:
+        courses = service.get_courses()
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
             },
             'data': courses,
-            'errors': [],
+            'errors': errors,
         }
     )
     return make_response(jsonify(response), STATUS_CODE)
@@ -46,13 +57,13 @@ def post_courses() -> Response:
     Returns:
     http response with json data: newly created Course model object serialized with CourseOutputSchema.
     """
-    course = CourseService(
+    course = CourseService.for_session(
         session=g.db_session,
-        input_schema=CourseInputSchema(many=False),
-        output_schema=CourseOutputSchema(many=False),
+        input_schema=get_schema(CourseInputSchema, many=False),
+        output_schema=get_schema(CourseOutputSchema, many=False),
     ).add_course(data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_201_CREATED.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -74,12 +85,12 @@ def get_course(id: UUID) -> Response:
     Returns:
     http response with json data: single Course model objects serialized with CourseOutputSchema.
     """
-    course = CourseService(
+    course = CourseService.for_session(
         session=g.db_session,
-        output_schema=CourseOutputSchema(many=False),
+        output_schema=get_schema(CourseOutputSchema, many=False),
     ).get_course_by_id(id=id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -102,13 +113,13 @@ def put_course(id: UUID) -> Response:
     Returns:
     http response with json data: single updated Course model objects serialized with CourseOutputSchema.
     """
-    course = CourseService(
+    course = CourseService.for_session(
         session=g.db_session,
-        input_schema=CourseUpdateSchema(many=False),
-        output_schema=CourseOutputSchema(many=False),
+        input_schema=get_schema(CourseUpdateSchema, many=False),
+        output_schema=get_schema(CourseOutputSchema, many=False),
     ).update_course(id=id, data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -131,10 +142,32 @@ def delete_course(id: UUID) -> Response:
     Returns:
     http response with no data and 204 status code.
     """
-    CourseService(session=g.db_session).delete_course(id=id)
+    CourseService.for_session(session=g.db_session).delete_course(id=id)
     return make_response('', HttpStatusCodeConstants.HTTP_204_NO_CONTENT.value)
 
 
+@courses_bp.delete('/')
+@jwt_required()
+def delete_courses() -> Response:
+    """DELETE '/courses?ids={id},{id}' endpoint view function.
+
+    Returns:
+    http response with json data: ids of deleted and missing Course objects.
+    """
+    result = CourseService.for_session(session=g.db_session).delete_courses(ids=get_request_ids())
+    STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': result,
+            'errors': [],
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
+
+
 @course_students_bp.get('/<uuid:id>/students')
 def get_course_students(id: UUID) -> Response:
     """GET '/courses/{id}/students' endpoint view function.
@@ -142,12 +175,12 @@ def get_course_students(id: UUID) -> Response:
     Returns:
     http response with json data: list of Course model Student objects serialized with StudentOutputSchema.
     """
-    course_students = CourseService(
+    course_students = CourseService.for_session(
         session=g.db_session,
-        output_schema=StudentOutputSchema(many=True),
+        output_schema=get_schema(StudentOutputSchema, many=True),
     ).get_course_students(id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -166,13 +199,13 @@ def post_course_students(id: UUID) -> Response:
     Returns:
     http response with json data: Course model Student object serialized with StudentOutputSchema.
     """
-    course_student = CourseService(
+    course_student = CourseService.for_session(
         session=g.db_session,
-        input_schema=CourseStudentInputSchema(many=False),
-        output_schema=StudentOutputSchema(many=False),
+        input_schema=get_schema(CourseStudentInputSchema, many=False),
+        output_schema=get_schema(StudentOutputSchema, many=False),
     ).add_course_student(id=id, data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_201_CREATED.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -191,12 +224,12 @@ def get_course_student(id: UUID, student_id: UUID) -> Response:
     Returns:
     http response with json data: Course model Student object serialized with StudentOutputSchema.
     """
-    course_student = CourseService(
+    course_student = CourseService.for_session(
         session=g.db_session,
-        output_schema=StudentOutputSchema(many=False),
+        output_schema=get_schema(StudentOutputSchema, many=False),
     ).get_course_student_by_id(id, student_id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -216,12 +249,12 @@ def delete_course_student(id: UUID, student_id: UUID) -> Response:
     Returns:
     http response with json data: single Course model objects serialized with CourseOutputSchema.
     """
-    course = CourseService(
+    course = CourseService.for_session(
         session=g.db_session,
-        output_schema=CourseOutputSchema(many=False),
+        output_schema=get_schema(CourseOutputSchema, many=False),
     ).delete_course_student(id, student_id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
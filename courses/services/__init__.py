@@ -1,15 +1,17 @@
 from copy import deepcopy
-from typing import Type
+from typing import Iterator, Type
 from uuid import UUID
 import abc
 
-from sqlalchemy.orm import scoped_session
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, scoped_session, selectinload
 
 from common.abstract.services import GenericService
 from courses.models import Course, CourseStudentAssociation
 from courses.schemas import CourseBaseSchema
 from courses.services.serializers import CourseSerializer
 from courses.utils.exceptions import CourseNotFoundError
+from db.retry import retry_transaction
 from students.services import StudentService
 from students.utils.exceptions import StudentNotFoundError
 from utils.logging import setup_logging
@@ -17,6 +19,8 @@ from utils.logging import setup_logging
 
 class AbstractCourseService(metaclass=abc.ABCMeta):
 
+    nested_services = ('student_service',)
+
     def __init__(
         self, session: scoped_session,
         validator: CourseSerializer = CourseSerializer,
@@ -26,7 +30,7 @@ class AbstractCourseService(metaclass=abc.ABCMeta):
         self._log = setup_logging(self.__class__.__name__)
         self.session = session
         self.validator = validator(input_schema, output_schema)
-        self.student_service = StudentService(session=self.session)
+        self.student_service = StudentService.for_session(session=self.session)
 
     def get_courses(self) -> list[dict]:
         """Query database and return list Course objects from the db.
@@ -36,6 +40,29 @@ class AbstractCourseService(metaclass=abc.ABCMeta):
         """
         return self._get_courses()
 
+    def get_courses_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        """Query database with a single statement and return Course objects from the db filtered by ids.
+
+        Args:
+            ids: list of UUIDs of Course objects.
+
+        Returns:
+        tuple of lists: Course objects serialized with CourseOutputSchema in the order of ids and not found errors
+        of the missing ones.
+        """
+        return self._get_courses_by_ids(ids)
+
+    def stream_courses(self, batch_size: int) -> Iterator[list[dict]]:
+        """Query database with server-side cursor and return Course objects in batches.
+
+        Args:
+            batch_size: number of Course objects read from the db and serialized at once.
+
+        Returns:
+        Iterator of Course objects batches serialized with CourseOutputSchema.
+        """
+        return self._stream_courses(batch_size)
+
     def add_course(self, data: dict) -> dict:
         """Getting course dict payload and saving it in the Course table.
 
@@ -81,6 +108,17 @@ class AbstractCourseService(metaclass=abc.ABCMeta):
         """
         return self._delete_course(id)
 
+    def delete_courses(self, ids: list[UUID]) -> dict:
+        """Delete Course objects from the database with a single statement.
+
+        Args:
+            ids: list of UUIDs of Course objects.
+
+        Returns:
+        dict with lists of deleted ids and of missing ids, already deleted objects are missing.
+        """
+        return self._delete_courses(ids)
+
     def get_course_students(self, id: UUID) -> list[dict]:
         """Query database and return list Course object students from the db.
 
@@ -128,6 +166,14 @@ class AbstractCourseService(metaclass=abc.ABCMeta):
     def _get_courses(self) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _stream_courses(self, batch_size: int) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _get_courses_by_ids(self, ids: list[UUID]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _add_course(self, data: dict) -> None:
         pass
@@ -144,6 +190,10 @@ class AbstractCourseService(metaclass=abc.ABCMeta):
     def _delete_course(self, id: UUID) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _delete_courses(self, ids: list[UUID]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _get_course_students(self, id: UUID) -> None:
         pass
@@ -166,14 +216,41 @@ class CourseService(AbstractCourseService, GenericService):
 
     def _get_courses(self) -> list[dict]:
         self._log.debug('Getting all courses from the db.')
-        courses = self.session.query(Course).all()
+        courses = self.session.query(Course).options(*self._relationships_load_options()).all()
+        self._release_connection()
         return self.validator.serialize(courses)
 
+    def _relationships_load_options(self) -> list:
+        """Return loader options of the Course relationships serialized with the CourseOutputSchema."""
+        return [
+            joinedload(Course.subject),
+            joinedload(Course.teacher),
+            selectinload(Course.students_association).joinedload(CourseStudentAssociation.student),
+        ]
+
+    def _get_courses_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        courses, errors = self._get_objects_by_ids(table=Course, ids=ids, options=self._relationships_load_options())
+        self._release_connection()
+        return self.validator.serialize(courses), errors
+
+    def _stream_courses(self, batch_size: int) -> Iterator[list[dict]]:
+        self._log.debug('Streaming all courses from the db.')
+        # Relationships are loaded per batch of yield_per, joined eager loading of the collection can't be batched.
+        courses = self.session.query(Course).options(
+            selectinload(Course.subject),
+            selectinload(Course.teacher),
+            selectinload(Course.students_association).selectinload(CourseStudentAssociation.student),
+        ).yield_per(batch_size)
+        return self.validator.serialize_stream(data=courses, batch_size=batch_size)
+
     def _add_course(self, data: dict) -> dict:
         course = self.validator.deserialize(data=data)
         db_course = self._save_course_data(data=course)
+        db_course = self._get_course(column='id', value=db_course.id)
+        self._release_connection()
         return self.validator.serialize(data=db_course)
 
+    @retry_transaction
     def _save_course_data(self, data: dict) -> Course:
         """Saves course data in the Course model.
 
@@ -188,60 +265,59 @@ class CourseService(AbstractCourseService, GenericService):
         self._log.debug(f'Creating course with subject id: {course["subject_id"]}')
         self.session.add(db_course)
         self.session.commit()
-        self.session.refresh(db_course)
         return db_course
 
     def _get_course_by_id(self, id: UUID) -> dict:
         course = self._get_course(column='id', value=id)
+        self._release_connection()
         return self.validator.serialize(data=course)
 
-    def _get_course(self, column: str, value: UUID | str) -> Course:
-        if self._course_exists(column=column, value=value):
-            self._log.debug(f'Getting Course with {column}: {value}.')
-            return self.session.query(Course).filter(Course.__table__.columns[column] == value).one()
-
-    def _course_exists(self, column: str, value: str) -> bool:
-        """Check if Course object exists in the db.
-
-        Args:
-            column: name of column in the Course model.
-            value: to find in the Course model.
-        Raises:
-        CourseNotFoundError exception if object not present in Course model.
-
-        Returns:
-        bool of Course object existence.
-        """
-        self._log.debug(f'Checking if Course with {column}: {value} exists.')
-        q = self.session.query(Course).filter(Course.__table__.columns[column] == value)
-        obj_exists = self.session.query(q.exists()).scalar()
-        if not obj_exists:
-            raise CourseNotFoundError(f'Course with {column}: {value} not found.')
-        return True
+    def _get_course(self, column: str, value: UUID | str, load_relationships: bool = True) -> Course:
+        return self._get_object(
+            table=Course,
+            column=column,
+            value=value,
+            not_found_error=CourseNotFoundError,
+            options=self._relationships_load_options() if load_relationships else (),
+        )
 
+    @retry_transaction
     def _update_course(self, id: UUID, data: dict) -> dict:
         course = self.validator.deserialize(data=data)
-        db_course = self._get_course(column='id', value=id)
-        db_course.start_date = course['start_date']
-        db_course.end_date = course['end_date']
+        self._update_object(
+            table=Course,
+            column='id',
+            value=id,
+            values={'start_date': course['start_date'], 'end_date': course['end_date']},
+            not_found_error=CourseNotFoundError,
+        )
         self.session.commit()
-        self.session.refresh(db_course)
+        # Relationships of the updated Course are loaded for the serialization.
+        db_course = self._get_course(column='id', value=id)
         self._log.debug(f'Course with id: {id} updated.')
+        self._release_connection()
         return self.validator.serialize(data=db_course)
 
+    @retry_transaction
     def _delete_course(self, id: UUID) -> None:
-        if self._course_exists(column='id', value=id):
-            course = self.session.query(Course).filter(Course.id == id).one()
-            # Soft deleting Course object.
-            course.delete()
-            self.session.commit()
-            self._log.debug(f'Course with id: {id} deleted.')
+        self._delete_object(table=Course, id=id, not_found_error=CourseNotFoundError)
+        self.session.commit()
+        self._log.debug(f'Course with id: {id} deleted.')
+
+    @retry_transaction
+    def _delete_courses(self, ids: list[UUID]) -> dict:
+        deleted_ids = self._delete_objects(table=Course, ids=ids)
+        self.session.commit()
+        self._log.debug(f'{len(deleted_ids)} Course objects deleted.')
+        return {'deleted': deleted_ids, 'missing': self._missing_ids(ids=ids, found_ids=deleted_ids)}
 
     def _get_course_students(self, id: UUID) -> list[dict]:
         self._log.debug('Getting all Course students from the db.')
         course = self._get_course(column='id', value=id)
+        self._release_connection()
         return self.validator.serialize(course.students)
 
+    @retry_transaction
     def _save_course_student_data(self, id: UUID, data: dict) -> Course:
         """Saves course student data in the CourseStudentAssociation model.
 
@@ -259,54 +335,54 @@ class CourseService(AbstractCourseService, GenericService):
         db_course.students_association.append(course_student_association)
         self.session.add(db_course)
         self.session.commit()
-        self.session.refresh(db_course)
         self._log.debug(f'Student object with id: {str(data["id"])} added to Course with id: {id}.')
         return db_course
 
     def _add_course_student(self, id: UUID, data: dict) -> dict:
         student_id = self.validator.deserialize(data=data)
+        # The saved course keeps its loaded students with the added one, the session doesn't expire them on commit.
         db_course = self._save_course_student_data(id, student_id)
+        self._release_connection()
         return self.validator.serialize(data=db_course.students[-1])
 
     def _get_course_student(self, id: UUID, student_id: UUID) -> CourseStudentAssociation:
-        id = str(id)
-        student_id = str(student_id)
-        if self._course_student_exists(course_id=id, student_id=student_id):
-            association = self.session.query(CourseStudentAssociation).filter_by(
-                course_id=id,
-                student_id=student_id,
-            ).one()
-            return association
-
-    def _get_course_student_by_id(self, id: UUID, student_id: UUID) -> dict:
-        association = self._get_course_student(id, student_id)
-        return self.validator.serialize(association.student)
-
-    def _course_student_exists(self, course_id: str, student_id: str) -> bool:
-        """Checks if Course and Student objects were added to association table CourseStudentAssociation.
+        """Return association of the Student with the Course and the Student loaded, with a single SELECT.
 
         Args:
-            course_id: Course object UUID.
+            id: Course object UUID.
             student_id: Student object UUID.
+        Raises:
+        CourseNotFoundError if Course is not in the db, StudentNotFoundError if Student was not added to the Course.
 
         Returns:
-        book of objects existence in CourseStudentAssociation table.
+        CourseStudentAssociation object.
         """
-        if self._course_exists(column='id', value=course_id):
-            q = self.session.query(CourseStudentAssociation).filter_by(
-                course_id=course_id,
-                student_id=student_id,
+        association = self.session.execute(
+            select(CourseStudentAssociation).join(CourseStudentAssociation.course).options(
+                joinedload(CourseStudentAssociation.student),
+            ).where(
+                CourseStudentAssociation.course_id == id,
+                CourseStudentAssociation.student_id == student_id,
+                Course.deleted_at.is_(None),
             )
-            obj_exists = self.session.query(q.exists()).scalar()
-            if not obj_exists:
-                raise StudentNotFoundError(f'Student with id: {student_id} not found in Course with id: {course_id}.')
-            return True
+        ).scalar_one_or_none()
+        if association is None:
+            # Looking the Course up only on the miss, to tell the missing Course from the missing Student.
+            self._get_course(column='id', value=id, load_relationships=False)
+            raise StudentNotFoundError(f'Student with id: {student_id} not found in Course with id: {id}.')
+        return association
 
+    def _get_course_student_by_id(self, id: UUID, student_id: UUID) -> dict:
+        association = self._get_course_student(id, student_id)
+        self._release_connection()
+        return self.validator.serialize(association.student)
+
+    @retry_transaction
     def _delete_course_student(self, id: UUID, student_id: UUID) -> dict:
-        if self._course_student_exists(course_id=id, student_id=student_id):
-            association = self._get_course_student(id, student_id)
-            # Hard deleting CourseStudentAssociation object.
-            self.session.delete(association)
-            self.session.commit()
-            db_course = self._get_course(column='id', value=id)
-            return self.validator.serialize(db_course)
+        association = self._get_course_student(id, student_id)
+        # Hard deleting CourseStudentAssociation object.
+        self.session.delete(association)
+        self.session.commit()
+        db_course = self._get_course(column='id', value=id)
+        self._release_connection()
+        return self.validator.serialize(db_course)
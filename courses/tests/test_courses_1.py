@@ -1,7 +1,11 @@
 from unittest import TestCase
+from uuid import uuid4
 
 from flask import url_for
 
+from sqlalchemy import event
+
+from common.constants.db import QueryStatisticsConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.tests.generic import TestMixin
 from common.tests.test_data.courses import request_test_course_data
@@ -36,6 +40,36 @@ class GetCoursesTestCase(TestMixin, TestCase):
         self.assertEqual(1, self.db_session.query(Course).count())
 
 
+class GetCoursesStreamingTestCase(GetCoursesTestCase):
+    """Tests for GET '/courses' endpoint with list streaming enabled."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['LIST_STREAMING_ENABLED'] = True
+
+    def test_get_courses_streamed_relationships_loaded_per_batch(self) -> None:
+        """Test GET '/courses' endpoint loads the streamed courses' relationships once per batch."""
+        self.app.config['LIST_STREAMING_BATCH_SIZE'] = 2
+        for _ in range(6):
+            self.add_random_student_to_course()
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+
+        event.listen(self.app.db_engine, 'after_cursor_execute', record_statement)
+        try:
+            response = self.client.get(self.url)
+            response_data = response.get_json()
+        finally:
+            event.remove(self.app.db_engine, 'after_cursor_execute', record_statement)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(6, len(response_data['data']))
+        self.assertTrue(all(len(course['students']) == 1 for course in response_data['data']))
+        # Courses' query and the subjects, teachers, students' associations and students per each of 3 batches.
+        self.assertEqual(1 + 4 * 3, len(statements))
+
+
 class GetCourseTestCase(TestMixin, TestCase):
     """Tests for GET '/courses/{id}' endpoint."""
 
@@ -47,6 +81,7 @@ class GetCourseTestCase(TestMixin, TestCase):
         expected_result = response_test_course_data.RESPONSE_COURSE_NOT_FOUND
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(0, self.db_session.query(Course).count())
 
     def test_get_course_test_data_in_db(self) -> None:
@@ -58,9 +93,41 @@ class GetCourseTestCase(TestMixin, TestCase):
         expected_result = response_test_course_data.RESPONSE_GET_COURSE
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('2', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(1, self.db_session.query(Course).count())
 
 
+class GetCoursesByIdsTestCase(TestMixin, TestCase):
+    """Tests for GET '/courses?ids={id},{id}' endpoint."""
+
+    def test_get_courses_by_ids_in_requested_order(self) -> None:
+        """Test GET '/courses?ids={id},{id}' endpoint returns courses in the ids order and missing ids."""
+        db_course = self.add_course_to_db()
+        random_db_course = self.add_random_course_to_db()
+        missing_id = str(uuid4())
+        url = url_for('courses.get_courses', ids=f'{random_db_course.id},{missing_id},{db_course.id}')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertEqual(
+            [str(random_db_course.id), str(db_course.id)],
+            [course['id'] for course in response_data['data']],
+        )
+        self.assertEqual(
+            [{'id': missing_id, 'message': f'Course with id: {missing_id} not found.'}],
+            response_data['errors'],
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('2', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+
+    def test_get_courses_by_ids_invalid_ids(self) -> None:
+        """Test GET '/courses?ids={id}' endpoint with invalid UUID in the ids."""
+        url = url_for('courses.get_courses', ids='not-a-uuid')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertIn('ids', response_data['errors']['message'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+
+
 class PostCoursesTestCase(TestMixin, TestCase):
     """Tests for POST '/courses' endpoint."""
 
@@ -79,6 +146,10 @@ class PostCoursesTestCase(TestMixin, TestCase):
         expected_result = response_test_course_data.RESPONSE_POST_COURSE
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=3),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Course).count())
 
     def test_post_courses_invalid_json_payload(self) -> None:
@@ -104,6 +175,10 @@ class PutCourseTestCase(TestMixin, TestCase):
         expected_result = response_test_course_data.RESPONSE_COURSE_UPDATE_TEST_DATA
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=4),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Course).count())
 
     def test_put_course_updating_other_course_data(self) -> None:
@@ -145,3 +220,56 @@ class DeleteCourseTestCase(TestMixin, TestCase):
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
         self.assertEqual(2, self.db_session.query(Course).count())
+
+
+class DeleteCoursesBulkTestCase(TestMixin, TestCase):
+    """Tests for DELETE '/courses?ids={id},{id}' endpoint."""
+
+    def test_delete_courses_bulk_teacher_deleting_own_courses(self) -> None:
+        """Test DELETE '/courses?ids={id},{id}' endpoint, teacher deleting own courses and a missing one."""
+        db_course = self.add_course_to_db()
+        other_db_subject = self._add_subject_to_db(
+            data={'title': f'test_title_{uuid4()}', 'code': 'BIO_1000', 'teacher_id': db_course.teacher_id},
+        )
+        other_db_course = self._add_course_to_db(
+            data={
+                'start_date': '2015-01-09',
+                'end_date': '2021-01-06',
+                'teacher_id': db_course.teacher_id,
+                'subject_id': other_db_subject.id,
+            },
+        )
+        missing_id = uuid4()
+        url = url_for('courses.delete_courses', ids=f'{other_db_course.id},{missing_id},{db_course.id}')
+        response = self.client.delete(url)
+        response_data = response.get_json()
+        expected_result = {'deleted': [str(other_db_course.id), str(db_course.id)], 'missing': [str(missing_id)]}
+        self.assertEqual(expected_result, response_data['data'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=2),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
+        self.assertEqual(0, self.db_session.query(Course).count())
+
+    def test_delete_courses_bulk_deleting_other_course_data(self) -> None:
+        """Test DELETE '/courses?ids={id},{id}' endpoint with other's course id in the ids."""
+        db_course = self.add_course_to_db()
+        random_db_course = self.add_random_course_to_db()
+        url = url_for('courses.delete_courses', ids=f'{db_course.id},{random_db_course.id}')
+        response = self.client.delete(url)
+        response_data = response.get_json()
+        expected_result = response_test_course_data.RESPONSE_COURSE_UNAUTHORIZED_DELETE
+        self.assertEqual(expected_result, response_data)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(2, self.db_session.query(Course).count())
+
+    def test_delete_courses_bulk_without_ids(self) -> None:
+        """Test DELETE '/courses' endpoint without the ids query string."""
+        self.add_course_to_db()
+        url = url_for('courses.delete_courses')
+        response = self.client.delete(url)
+        response_data = response.get_json()
+        self.assertIn('ids', response_data['errors']['message'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(1, self.db_session.query(Course).count())
@@ -0,0 +1,50 @@
+from app.config import TestingSqliteConfig
+from courses.tests import test_courses_1
+
+
+class GetCoursesSqliteTestCase(test_courses_1.GetCoursesTestCase):
+    """Tests for GET '/courses' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetCoursesStreamingSqliteTestCase(test_courses_1.GetCoursesStreamingTestCase):
+    """Tests for GET '/courses' endpoint with list streaming enabled on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetCourseSqliteTestCase(test_courses_1.GetCourseTestCase):
+    """Tests for GET '/courses/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostCoursesSqliteTestCase(test_courses_1.PostCoursesTestCase):
+    """Tests for POST '/courses' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PutCourseSqliteTestCase(test_courses_1.PutCourseTestCase):
+    """Tests for PUT '/courses/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteCourseSqliteTestCase(test_courses_1.DeleteCourseTestCase):
+    """Tests for DELETE '/courses/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteCoursesBulkSqliteTestCase(test_courses_1.DeleteCoursesBulkTestCase):
+    """Tests for DELETE '/courses?ids={id},{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetCoursesByIdsSqliteTestCase(test_courses_1.GetCoursesByIdsTestCase):
+    """Tests for GET '/courses?ids={id},{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
@@ -1,7 +1,9 @@
+from copy import deepcopy
 from unittest import TestCase
 
 from flask import url_for
 
+from common.constants.db import QueryStatisticsConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.tests.generic import TestMixin
 from common.tests.test_data.students import request_test_student_data
@@ -48,14 +50,15 @@ class GetCourseStudentTestCase(TestMixin, TestCase):
         )
         response = self.client.get(url)
         response_data = response.get_json()
-        expected_result = response_test_course_students_data.RESPONSE_COURSE_STUDENT_NOT_FOUND
-        response_test_course_students_data.RESPONSE_COURSE_STUDENT_NOT_FOUND['errors']['message'] = (
-            response_test_course_students_data.RESPONSE_COURSE_STUDENT_NOT_FOUND['errors']['message'].format(
+        expected_result = deepcopy(response_test_course_students_data.RESPONSE_COURSE_STUDENT_NOT_FOUND)
+        expected_result['errors']['message'] = (
+            expected_result['errors']['message'].format(
                 student_id=request_test_student_data.DUMMY_STUDENT_UUID, course_id=db_course.id,
             )
         )
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value, response.status_code)
+        self.assertEqual('2', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(0, self.db_session.query(CourseStudentAssociation).count())
 
     def test_get_course_student_test_data_in_db(self) -> None:
@@ -71,6 +74,7 @@ class GetCourseStudentTestCase(TestMixin, TestCase):
         expected_result = response_test_course_students_data.response_test_student_data.RESPONSE_GET_STUDENT
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(1, self.db_session.query(CourseStudentAssociation).count())
 
 
@@ -93,6 +97,10 @@ class PostCourseStudentsTestCase(TestMixin, TestCase):
         expected_result = response_test_course_students_data.response_test_student_data.RESPONSE_POST_STUDENT
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=4),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(CourseStudentAssociation).count())
 
     def test_post_course_students_invalid_json_payload(self) -> None:
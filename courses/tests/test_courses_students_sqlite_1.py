@@ -0,0 +1,26 @@
+from app.config import TestingSqliteConfig
+from courses.tests import test_courses_students_1
+
+
+class GetCourseStudentsSqliteTestCase(test_courses_students_1.GetCourseStudentsTestCase):
+    """Tests for GET '/courses/{id}/students' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetCourseStudentSqliteTestCase(test_courses_students_1.GetCourseStudentTestCase):
+    """Tests for GET '/courses/{id}/students/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostCourseStudentsSqliteTestCase(test_courses_students_1.PostCourseStudentsTestCase):
+    """Tests for POST '/courses/{id}/students' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteCourseStudentSqliteTestCase(test_courses_students_1.DeleteCourseStudentTestCase):
+    """Tests for DELETE '/courses/{id}/students/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
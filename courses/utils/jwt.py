@@ -1,10 +1,14 @@
 from flask import g, request
 
+from courses.models import Course
 from courses.services import CourseService
+from utils.requests import get_request_ids
 
 
 def course_token_verifier(jwt_header: dict, jwt_payload: dict) -> bool:
-    """Checks if Course.teacher_id from JWT matches the id from jwt_payload.
+    """Checks if Course.teacher_id of the request's courses matches the id from jwt_payload.
+
+    Courses of the bulk request are looked up with a single query, missing courses are left to the view.
 
     Args:
         jwt_header: JWT headers dict.
@@ -13,10 +17,12 @@ def course_token_verifier(jwt_header: dict, jwt_payload: dict) -> bool:
     Returns:
     bool of comparison Course.teacher_id and decoded jwt data.
     """
-    course = CourseService(session=g.db_session)._get_course(column='id', value=str(request.view_args['id']))
-    if jwt_payload['sub'] == str(course.teacher_id):
-        return True
-    return False
+    service = CourseService.for_session(session=g.db_session)
+    if 'id' in request.view_args:
+        courses = [service._get_course(column='id', value=str(request.view_args['id']), load_relationships=False)]
+    else:
+        courses = service._get_objects(table=Course, column='id', values=get_request_ids())
+    return all(jwt_payload['sub'] == str(course.teacher_id) for course in courses)
 
 
 def course_students_token_verifier(jwt_header: dict, jwt_payload: dict) -> bool:
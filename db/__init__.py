@@ -1,23 +1,162 @@
 from flask import Config
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+from common.constants.db import DatabaseBackendConstants
+from db.deadlines import set_statement_timeout
+from db.pool import InstrumentedQueuePool
+from db.routing import ReplicaSelector, RoutingSession
 
 Base = declarative_base()
+# Registered after the replica's READ ONLY listener, SET TRANSACTION has to be the first statement of a transaction.
+event.listen(RoutingSession, 'after_begin', set_statement_timeout)
 
 
-def create_db_engine(config: Config, echo: bool) -> Engine:
-    """Return sqlalchemy engine instance."""
-    POSTGRES_DB_URL = (
+def create_db_url(config: Config) -> str:
+    """Return primary db url, postgres one with the config's dialect driver."""
+    if config['DB_BACKEND'] == DatabaseBackendConstants.SQLITE.value:
+        return f'sqlite:///{config["SQLITE_DB_PATH"]}'
+    return (
         f'{config["POSTGRES_DIALECT_DRIVER"]}://{config["POSTGRES_DB_USERNAME"]}:'
         f'{config["POSTGRES_DB_PASSWORD"]}@{config["POSTGRES_DB_HOST"]}:'
         f'{config["POSTGRES_DB_PORT"]}/{config["POSTGRES_DB_NAME"]}'
     )
-    return create_engine(url=POSTGRES_DB_URL, echo=echo)
 
 
-def get_session(engine: Engine) -> scoped_session:
-    """Return scoped sqlalchemy session."""
-    return scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+def create_db_engine(config: Config, echo: bool, url: str | None = None) -> Engine:
+    """Return sqlalchemy engine instance with connection pool configured from the app config.
+
+    Behind an external transaction-mode pooler the engine doesn't pool connections, the pooler does.
+    SQLite engines are created with create_sqlite_engine.
+
+    Args:
+        config: flask app config.
+        echo: log all statements.
+        url: db url, the primary db url if not set.
+
+    Returns:
+    sqlalchemy engine instance.
+    """
+    url = url or create_db_url(config=config)
+    if make_url(url).get_backend_name() == DatabaseBackendConstants.SQLITE.value:
+        return create_sqlite_engine(config=config, echo=echo, url=url)
+    if config['DB_EXTERNAL_POOLER']:
+        return create_engine(
+            url=url, echo=echo, poolclass=NullPool, isolation_level=config['POSTGRES_ISOLATION_LEVEL'],
+        )
+    return create_engine(
+        url=url,
+        echo=echo,
+        isolation_level=config['POSTGRES_ISOLATION_LEVEL'],
+        poolclass=InstrumentedQueuePool,
+        pool_size=config['SQLALCHEMY_POOL_SIZE'],
+        max_overflow=config['SQLALCHEMY_MAX_OVERFLOW'],
+        pool_timeout=config['SQLALCHEMY_POOL_TIMEOUT'],
+        pool_recycle=config['SQLALCHEMY_POOL_RECYCLE'],
+        pool_pre_ping=config['SQLALCHEMY_POOL_PRE_PING'],
+        pool_use_lifo=config['SQLALCHEMY_POOL_USE_LIFO'],
+    )
+
+
+def create_sqlite_engine(config: Config, echo: bool, url: str) -> Engine:
+    """Return sqlalchemy engine instance for the SQLite db.
+
+    In-memory db lives in a single connection shared by all threads, file db runs in WAL mode,
+    so readers don't block the writer. Foreign keys are enforced the same way postgres does.
+
+    Args:
+        config: flask app config.
+        echo: log all statements.
+        url: SQLite db url.
+
+    Returns:
+    sqlalchemy engine instance.
+    """
+    connect_args = {'check_same_thread': False}
+    if make_url(url).database in (None, '', DatabaseBackendConstants.SQLITE_MEMORY_PATH.value):
+        engine = create_engine(url=url, echo=echo, poolclass=StaticPool, connect_args=connect_args)
+    else:
+        engine = create_engine(
+            url=url,
+            echo=echo,
+            poolclass=InstrumentedQueuePool,
+            pool_size=config['SQLALCHEMY_POOL_SIZE'],
+            max_overflow=config['SQLALCHEMY_MAX_OVERFLOW'],
+            pool_timeout=config['SQLALCHEMY_POOL_TIMEOUT'],
+            connect_args=connect_args,
+        )
+    event.listen(engine, 'connect', set_sqlite_pragmas)
+    return engine
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Enable foreign keys and WAL journal mode on the new SQLite connection, in-memory db ignores WAL."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.close()
+
+
+def create_replica_engines(config: Config, echo: bool) -> list[Engine]:
+    """Return list of sqlalchemy engines for the read replicas from the app config."""
+    return [create_db_engine(config=config, echo=echo, url=url) for url in config['POSTGRES_REPLICA_URLS']]
+
+
+def get_session(
+    engine: Engine,
+    replica_engines: list[Engine] | None = None,
+    balancing: str | None = None,
+        ) -> scoped_session:
+    """Return scoped sqlalchemy session registry.
+
+    The registry is meant to be created once per engine, each thread gets its own session from it.
+    Sessions with request's deadline in their info dict limit their statements with statement_timeout.
+    Commit doesn't expire the objects, they keep the state written or returned by the transaction's statements.
+
+    Args:
+        engine: primary db engine.
+        replica_engines: read replica engines for read-only sessions.
+        balancing: read replicas balancing strategy, 'round_robin' or 'least_loaded'.
+
+    Returns:
+    scoped sqlalchemy session registry.
+    """
+    replica_selector = ReplicaSelector(engines=replica_engines, balancing=balancing) if replica_engines else None
+    return scoped_session(
+        sessionmaker(
+            class_=RoutingSession,
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=engine,
+            replica_selector=replica_selector,
+        )
+    )
+
+
+class LazySession:
+    """Proxy of the scoped session registry which creates the session only on its first use.
+
+    Requests which never touch the database don't create a session and don't check out a connection.
+    """
+
+    def __init__(self, registry: scoped_session, info: dict | None = None) -> None:
+        self._registry = registry
+        self._info = info or {}
+        self.used = False
+
+    def __getattr__(self, name: str):
+        if not self.used:
+            self.used = True
+            self._registry.info.update(self._info)
+        return getattr(self._registry, name)
+
+    def remove(self) -> None:
+        """Remove the session from the registry, if it was used."""
+        if self.used:
+            self._registry.remove()
@@ -0,0 +1,32 @@
+from flask import current_app
+from flask.cli import with_appcontext
+
+import click
+
+from db.monitoring import summarize_endpoints_load
+
+
+@click.command('sql-endpoints-report')
+@click.option('--limit', default=20, show_default=True, help='Number of the most time consuming endpoints to show.')
+@with_appcontext
+def sql_endpoints_report(limit: int) -> None:
+    """Print db load of the slow query log's statements executions grouped by their endpoint.
+
+    Every logged execution names its own endpoint, unlike pg_stat_statements, which counts a statement under the
+    endpoint of its first execution whatever endpoints execute it later. Only the statements slower than the slow
+    query log threshold are counted, SLOW_QUERY_THRESHOLD_MS=0 logs every statement.
+    """
+    slow_query_log = current_app.slow_query_log
+    loads = summarize_endpoints_load(entries=slow_query_log.read_entries())
+    click.echo(
+        f'Statements executions of at least {slow_query_log.threshold_ms} ms logged to {slow_query_log.log_file}, '
+        f'faster ones are not counted.'
+    )
+    click.echo(
+        f'{"endpoint":<40}{"statements":>12}{"calls":>12}{"total, ms":>14}{"mean, ms":>12}{"rows":>12}'
+    )
+    for load in loads[:limit]:
+        click.echo(
+            f'{load["endpoint"]:<40}{load["statements"]:>12}{load["calls"]:>12}'
+            f'{load["total_time_ms"]:>14.3f}{load["mean_time_ms"]:>12.3f}{load["rows"]:>12}'
+        )
@@ -0,0 +1,37 @@
+import time
+
+from sqlalchemy.engine.base import Connection
+from sqlalchemy.orm import Session, SessionTransaction
+
+from common.constants.db import DatabaseBackendConstants, RequestDeadlineConstants
+from utils.exceptions import RequestDeadlineExceededError
+
+
+def remaining_time_ms(deadline: float) -> int:
+    """Return milliseconds left until the deadline, a time.monotonic() timestamp."""
+    return int((deadline - time.monotonic()) * 1000)
+
+
+def set_statement_timeout(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection,
+        ) -> None:
+    """Limit transaction's statements with the rest of the request's budget.
+
+    Runs once the connection is checked out, so the time spent waiting for the pool is already spent,
+    requests with no budget left are rejected before any statement is sent.
+    SET LOCAL goes straight to the DBAPI cursor, it is not counted in the request's statements statistics.
+    """
+    deadline = session.info.get(RequestDeadlineConstants.SESSION_DEADLINE_KEY.value)
+    if deadline is None:
+        return
+    remaining_ms = remaining_time_ms(deadline=deadline)
+    if remaining_ms <= 0:
+        raise RequestDeadlineExceededError(f'Request deadline exceeded by {-remaining_ms} ms before db access.')
+    if connection.dialect.name == DatabaseBackendConstants.POSTGRESQL.value:
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(f'SET LOCAL statement_timeout = {remaining_ms}')
+        finally:
+            cursor.close()
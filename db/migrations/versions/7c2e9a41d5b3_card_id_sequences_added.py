@@ -0,0 +1,35 @@
+"""Card id sequences added for Student and Teacher tables.
+
+Revision ID: 7c2e9a41d5b3
+Revises: ecac4447ad5f
+Create Date: 2026-10-16 10:12:37.415208
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '7c2e9a41d5b3'
+down_revision = 'ecac4447ad5f'
+branch_labels = None
+depends_on = None
+
+CARD_ID_SEQUENCES = {
+    'students': 'students_card_id_seq',
+    'teachers': 'teachers_card_id_seq',
+}
+
+
+def upgrade():
+    for table, sequence in CARD_ID_SEQUENCES.items():
+        op.execute(sa.schema.CreateSequence(sa.Sequence(sequence)))
+        # Sequence continues from the greatest card id number already issued.
+        op.execute(
+            f"SELECT setval('{sequence}', COALESCE(MAX(substring(card_id FROM '[0-9]+$')::bigint), 0) + 1, false) "
+            f'FROM {table}'
+        )
+
+
+def downgrade():
+    for sequence in CARD_ID_SEQUENCES.values():
+        op.execute(sa.schema.DropSequence(sa.Sequence(sequence)))
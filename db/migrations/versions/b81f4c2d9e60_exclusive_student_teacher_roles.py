@@ -0,0 +1,39 @@
+"""Exclusive role triggers added for Student and Teacher tables.
+
+Revision ID: b81f4c2d9e60
+Revises: 7c2e9a41d5b3
+Create Date: 2026-10-17 09:41:12.508316
+
+"""
+from alembic import op
+
+from common.constants.db import ExclusiveRoleConstants
+from db.triggers import EXCLUSIVE_ROLE_FUNCTION_SQL, exclusive_role_trigger_sql
+
+# revision identifiers, used by Alembic.
+revision = 'b81f4c2d9e60'
+down_revision = '7c2e9a41d5b3'
+branch_labels = None
+depends_on = None
+
+# Exclusive table and the model names of the error message by the table the trigger checks the inserts of.
+EXCLUSIVE_ROLES = {
+    'students': ('teachers', 'Student', 'Teacher'),
+    'teachers': ('students', 'Teacher', 'Student'),
+}
+
+
+def upgrade():
+    op.execute(EXCLUSIVE_ROLE_FUNCTION_SQL)
+    for table, (exclusive_table, model, exclusive_model) in EXCLUSIVE_ROLES.items():
+        op.execute(
+            exclusive_role_trigger_sql(
+                table=table, exclusive_table=exclusive_table, model=model, exclusive_model=exclusive_model,
+            )
+        )
+
+
+def downgrade():
+    for table in EXCLUSIVE_ROLES:
+        op.execute(f'DROP TRIGGER {table}_{ExclusiveRoleConstants.TRIGGER_SUFFIX.value} ON {table}')
+    op.execute(f'DROP FUNCTION {ExclusiveRoleConstants.FUNCTION_NAME.value}()')
@@ -0,0 +1,288 @@
+from collections import Counter
+from hashlib import sha1
+from logging.handlers import RotatingFileHandler
+from typing import Iterable, Iterator
+import json
+import logging
+import os
+import random
+import re
+import time
+
+from flask import g, has_request_context, request
+
+from sqlalchemy import event
+from sqlalchemy.engine.base import Connection, Engine
+from sqlalchemy.engine.default import DefaultExecutionContext
+
+from common.constants.db import DatabaseBackendConstants, StatementCommentConstants
+
+COMMENT_REGEX = re.compile(r'/\*.*?\*/', re.DOTALL)
+STRING_LITERAL_REGEX = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL_REGEX = re.compile(r'\b\d+(?:\.\d+)?\b')
+BIND_PARAMETER_REGEX = re.compile(r'%\(\w+\)s|\?|:\w+')
+PARAMETERS_LIST_REGEX = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+WHITESPACE_REGEX = re.compile(r'\s+')
+STATEMENT_COMMENT_REGEX = re.compile(r'/\*((?:\w+=\'[\w.\-]*\',?)+)\*/')
+STATEMENT_TAG_REGEX = re.compile(r"(\w+)='([\w.\-]*)'")
+UNSAFE_TAG_CHARACTERS_REGEX = re.compile(r'[^\w.\-]')
+# SELECT statements with side effects, sequence and advisory lock functions and row locking clauses.
+SIDE_EFFECTS_REGEX = re.compile(
+    r'\b(?:nextval|setval|pg_advisory_\w+)\s*\(|\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b',
+    re.IGNORECASE,
+)
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Return normalized statement with comments, literals and bind parameters replaced.
+
+    Args:
+        statement: sql statement sent to the db.
+
+    Returns:
+    normalized statement, the same for the statements which differ only by parameter values.
+    """
+    statement = COMMENT_REGEX.sub('', statement)
+    statement = STRING_LITERAL_REGEX.sub('?', statement)
+    statement = NUMBER_LITERAL_REGEX.sub('?', statement)
+    statement = BIND_PARAMETER_REGEX.sub('?', statement)
+    statement = PARAMETERS_LIST_REGEX.sub('(?+)', statement)
+    return WHITESPACE_REGEX.sub(' ', statement).strip()
+
+
+class QueryStatistics:
+    """Statements count, total db time and statements fingerprints of a single request."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.total_time = 0.0
+        self.fingerprints = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record statement executed during the request."""
+        self.statements += 1
+        self.total_time += duration
+        self.fingerprints[fingerprint_statement(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> dict:
+        """Return fingerprints of statements executed at least threshold times, a sign of N+1 queries."""
+        return {fingerprint: count for fingerprint, count in self.fingerprints.items() if count >= threshold}
+
+    @property
+    def total_time_ms(self) -> float:
+        return round(self.total_time * 1000, 3)
+
+
+def before_cursor_execute(
+    conn: Connection,
+    cursor,
+    statement: str,
+    parameters,
+    context: DefaultExecutionContext,
+    executemany: bool,
+        ) -> None:
+    """Store statement start time on the execution context."""
+    context._query_start_time = time.perf_counter()
+
+
+def after_cursor_execute(
+    conn: Connection,
+    cursor,
+    statement: str,
+    parameters,
+    context: DefaultExecutionContext,
+    executemany: bool,
+        ) -> None:
+    """Record executed statement in the current request's statistics."""
+    if has_request_context() and 'query_statistics' in g:
+        g.query_statistics.record(statement=statement, duration=time.perf_counter() - context._query_start_time)
+
+
+def register_query_statistics(engine: Engine) -> Engine:
+    """Registers per-request statements statistics event listeners on the engine."""
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    return engine
+
+
+def format_statement_comment(tags: dict) -> str:
+    """Return sqlcommenter style comment with the tags, values are stripped to word characters, dots and dashes.
+
+    Args:
+        tags: comment's keys and values.
+
+    Returns:
+    comment to append to the statement, safe for every dialect's parameters style.
+    """
+    tags = ','.join(
+        f"{key}='{UNSAFE_TAG_CHARACTERS_REGEX.sub('', str(value))}'" for key, value in sorted(tags.items()) if value
+    )
+    return f'/*{tags}*/'
+
+
+def parse_statement_comment(statement: str) -> dict:
+    """Return tags of the statement's comment added by format_statement_comment, empty dict if there is none."""
+    comment = STATEMENT_COMMENT_REGEX.search(statement)
+    if not comment:
+        return {}
+    return dict(STATEMENT_TAG_REGEX.findall(comment.group(1)))
+
+
+def add_statement_comment(
+    conn: Connection,
+    cursor,
+    statement: str,
+    parameters,
+    context: DefaultExecutionContext,
+    executemany: bool,
+        ) -> tuple:
+    """Append comment with the request's endpoint, blueprint and request id to the statement.
+
+    The comment attributes a single execution, as pg_stat_activity, the postgres statements log and auto_explain show
+    it. Postgres ignores comments in pg_stat_statements query ids, statements differing only by the comment are
+    counted together and the stored query text keeps the comment of its first execution, so pg_stat_statements can't
+    attribute a statement several endpoints execute.
+    """
+    if has_request_context() and request.endpoint:
+        comment = format_statement_comment(
+            {
+                'endpoint': request.endpoint,
+                'blueprint': request.blueprint,
+                'request_id': g.get('request_id'),
+            }
+        )
+        statement = f'{statement} {comment}'
+    return statement, parameters
+
+
+def register_statement_comments(engine: Engine) -> Engine:
+    """Registers statements comments event listener on the engine."""
+    event.listen(engine, 'before_cursor_execute', add_statement_comment, retval=True)
+    return engine
+
+
+def summarize_endpoints_load(entries: Iterable[dict]) -> list[dict]:
+    """Return db load of the logged statements executions grouped by their endpoint.
+
+    Args:
+        entries: slow query log entries, each of a single statement execution.
+
+    Returns:
+    list of endpoints load dicts, most time consuming first.
+    """
+    endpoints = {}
+    for entry in entries:
+        endpoint = entry.get('endpoint') or StatementCommentConstants.UNATTRIBUTED_ENDPOINT.value
+        load = endpoints.setdefault(
+            endpoint, {'endpoint': endpoint, 'statements': set(), 'calls': 0, 'total_time_ms': 0.0, 'rows': 0},
+        )
+        load['statements'].add(entry['statement'])
+        load['calls'] += 1
+        load['total_time_ms'] += entry['duration_ms']
+        # Row count is unknown (-1) for some statements, e.g. of the server-side cursors.
+        load['rows'] += max(entry.get('rows', 0), 0)
+    for load in endpoints.values():
+        load['statements'] = len(load['statements'])
+        load['total_time_ms'] = round(load['total_time_ms'], 3)
+        load['mean_time_ms'] = round(load['total_time_ms'] / load['calls'], 3)
+    return sorted(endpoints.values(), key=lambda load: load['total_time_ms'], reverse=True)
+
+
+class SlowQueryLog:
+    """Logs statements slower than the threshold, with sampled EXPLAIN (ANALYZE, BUFFERS) plans, to a rotating file."""
+
+    LOGGER_NAME = 'slow_queries'
+    EXPLAIN_SAVEPOINT_NAME = 'slow_query_explain'
+
+    def __init__(
+        self,
+        threshold_ms: int,
+        explain_sample_rate: float,
+        log_file: str,
+        max_bytes: int,
+        backup_count: int,
+            ) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._log = logging.getLogger(self.LOGGER_NAME)
+        self._log.setLevel(logging.INFO)
+        self.log_file = os.path.abspath(log_file)
+        self.backup_count = backup_count
+        if not any(getattr(handler, 'baseFilename', None) == self.log_file for handler in self._log.handlers):
+            os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+            handler = RotatingFileHandler(filename=self.log_file, maxBytes=max_bytes, backupCount=backup_count)
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self._log.addHandler(handler)
+
+    def after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor,
+        statement: str,
+        parameters,
+        context: DefaultExecutionContext,
+        executemany: bool,
+            ) -> None:
+        """Log the statement if it was slower than the threshold."""
+        start_time = getattr(context, '_query_start_time', None)
+        if start_time is None:
+            return
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+        entry = {
+            'duration_ms': round(duration_ms, 3),
+            'endpoint': request.endpoint if has_request_context() else None,
+            'request_id': g.get('request_id') if has_request_context() else None,
+            'statement': fingerprint_statement(statement),
+            'rows': cursor.rowcount,
+            'parameters_fingerprint': sha1(repr(parameters).encode()).hexdigest()[:16],
+        }
+        if not executemany and random.random() < self.explain_sample_rate and self._is_explainable(conn, statement):
+            entry['plan'] = self._explain(cursor=cursor, statement=statement, parameters=parameters)
+        self._log.info(json.dumps(entry))
+
+    def read_entries(self) -> Iterator[dict]:
+        """Yield entries of the log file and its rotated backups, oldest first, unreadable lines are skipped."""
+        log_files = [f'{self.log_file}.{number}' for number in range(self.backup_count, 0, -1)] + [self.log_file]
+        for log_file in log_files:
+            if not os.path.exists(log_file):
+                continue
+            with open(log_file) as lines:
+                for line in lines:
+                    try:
+                        yield json.loads(line[line.index('{'):])
+                    except ValueError:
+                        continue
+
+    def _is_explainable(self, conn: Connection, statement: str) -> bool:
+        """Only postgres SELECT statements are explained, EXPLAIN ANALYZE executes the statement again."""
+        is_postgresql = conn.dialect.name == DatabaseBackendConstants.POSTGRESQL.value
+        return is_postgresql and statement.lstrip().upper().startswith('SELECT')
+
+    def _explain(self, cursor, statement: str, parameters) -> str:
+        """Return EXPLAIN (ANALYZE, BUFFERS) plan of the statement, plain EXPLAIN plan of the statement with side
+        effects, ANALYZE would run it again, e.g. take another sequence number.
+
+        EXPLAIN runs inside a savepoint, so its failure doesn't abort the request's transaction.
+        """
+        explain = 'EXPLAIN' if SIDE_EFFECTS_REGEX.search(statement) else 'EXPLAIN (ANALYZE, BUFFERS)'
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute(f'SAVEPOINT {self.EXPLAIN_SAVEPOINT_NAME}')
+            try:
+                explain_cursor.execute(f'{explain} {statement}', parameters)
+                plan = '\n'.join(row[0] for row in explain_cursor.fetchall())
+                explain_cursor.execute(f'RELEASE SAVEPOINT {self.EXPLAIN_SAVEPOINT_NAME}')
+            except Exception as err:
+                explain_cursor.execute(f'ROLLBACK TO SAVEPOINT {self.EXPLAIN_SAVEPOINT_NAME}')
+                plan = f'EXPLAIN failed: {err}'
+        finally:
+            explain_cursor.close()
+        return plan
+
+
+def register_slow_query_log(engine: Engine, slow_query_log: SlowQueryLog) -> Engine:
+    """Registers slow query log event listener on the engine, statement start time is set by the statistics listener."""
+    event.listen(engine, 'after_cursor_execute', slow_query_log.after_cursor_execute)
+    return engine
@@ -0,0 +1,181 @@
+from threading import Lock
+from weakref import WeakKeyDictionary
+import os
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine.base import Engine
+from sqlalchemy.exc import DisconnectionError, TimeoutError
+from sqlalchemy.pool import QueuePool
+
+from utils.logging import setup_logging
+
+
+class PoolStatistics:
+    """Accumulated connection checkout statistics of a single pool."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        """Record successful connection checkout and the time spent waiting for it."""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_timeout(self, wait: float) -> None:
+        """Record connection checkout which gave up after pool timeout."""
+        with self._lock:
+            self.timeouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict:
+        """Return statistics as a dict, wait times in milliseconds."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'avg_wait_ms': round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                'max_wait_ms': round(self.max_wait * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool which records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            self.statistics.record_timeout(wait=time.perf_counter() - start)
+            raise
+        self.statistics.record_checkout(wait=time.perf_counter() - start)
+        return connection
+
+
+def get_pool_status(engine: Engine) -> dict:
+    """Return current usage and accumulated checkout statistics of the engine's pool.
+
+    Args:
+        engine: sqlalchemy engine to inspect.
+
+    Returns:
+    dict with pool size, connections in use, idle and overflow connections and checkout statistics.
+    """
+    pool = engine.pool
+    status = {'pool_class': pool.__class__.__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                'size': pool.size(),
+                'in_use': pool.checkedout(),
+                'idle': pool.checkedin(),
+                'overflow': pool.overflow(),
+            }
+        )
+    statistics = getattr(pool, 'statistics', None)
+    if statistics:
+        status.update(statistics.as_dict())
+    return status
+
+
+def set_connection_pid(dbapi_connection, connection_record) -> None:
+    """Store the pid of the process which opened the connection."""
+    connection_record.info['pid'] = os.getpid()
+
+
+def check_connection_pid(dbapi_connection, connection_record, connection_proxy) -> None:
+    """Refuse connections opened by another process, the pool replaces them with new ones.
+
+    The inherited connection is detached without closing, closing it would end the parent's db session.
+    """
+    pid = os.getpid()
+    if connection_record.info['pid'] != pid:
+        connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+        raise DisconnectionError(
+            f'Connection record belongs to pid {connection_record.info["pid"]}, attempting to check out in pid {pid}.'
+        )
+
+
+def warm_up_pool(engine: Engine, connections: int) -> int:
+    """Open connections in the engine's pool, so the first requests don't wait for them.
+
+    Connections are checked out at the same time and returned to the pool, pooled ones are pre-pinged on checkout.
+
+    Args:
+        engine: sqlalchemy engine to warm up.
+        connections: number of connections to open, limited by the pool size.
+
+    Returns:
+    number of connections opened.
+    """
+    if not isinstance(engine.pool, QueuePool):
+        return 0
+    opened = []
+    try:
+        for _ in range(min(connections, engine.pool.size())):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.exec_driver_sql('SELECT 1')
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+class EngineLifecycle:
+    """Keeps engines' pools fork-safe for pre-fork servers and warms them up in every worker.
+
+    Pools are disposed in the parent right before fork, so workers never share its connections,
+    pid check on checkout covers the connections which were in use at the time of fork.
+    """
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self._engines = WeakKeyDictionary()
+
+    def register(self, engine: Engine, warm_up_connections: int = 0) -> Engine:
+        """Register engine to be disposed before fork and warmed up with warm_up_connections after it."""
+        if engine not in self._engines:
+            event.listen(engine, 'connect', set_connection_pid)
+            event.listen(engine, 'checkout', check_connection_pid)
+        self._engines[engine] = warm_up_connections
+        return engine
+
+    def before_fork(self) -> None:
+        """Close pooled connections of the parent process, they would be shared with the child otherwise."""
+        for engine in list(self._engines):
+            engine.dispose()
+
+    def after_fork_in_child(self) -> None:
+        """Open registered engines' connections in the new worker process."""
+        self.warm_up()
+
+    def warm_up(self) -> None:
+        """Open connections in the registered engines' pools, failures are logged and don't stop the worker."""
+        for engine, connections in list(self._engines.items()):
+            if not connections:
+                continue
+            try:
+                opened = warm_up_pool(engine=engine, connections=connections)
+            except Exception as err:
+                self._log.warning(f'Pool warm-up of {engine.url!r} failed: {err}')
+                continue
+            self._log.debug(f'Pool warm-up of {engine.url!r} opened {opened} connections in pid {os.getpid()}.')
+
+
+engine_lifecycle = EngineLifecycle()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=engine_lifecycle.before_fork, after_in_child=engine_lifecycle.after_fork_in_child)
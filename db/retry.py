@@ -0,0 +1,118 @@
+from functools import wraps
+from threading import Lock
+from typing import Callable
+import random
+import time
+
+from flask import current_app, has_app_context
+
+from sqlalchemy.exc import DBAPIError
+
+from common.constants.db import RequestDeadlineConstants, TransactionRetryConstants
+from db.deadlines import remaining_time_ms
+from utils.logging import setup_logging
+
+log = setup_logging(__name__)
+
+
+class RetryStatistics:
+    """Accumulated statistics of the retried transactions."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.transactions = 0
+        self.retries = 0
+        self.failures = 0
+        self.retries_by_code = {}
+        self.total_backoff = 0.0
+
+    def record_success(self) -> None:
+        """Record committed transaction."""
+        with self._lock:
+            self.transactions += 1
+
+    def record_retry(self, code: str, backoff: float) -> None:
+        """Record transaction rolled back to be retried after the backoff."""
+        with self._lock:
+            self.retries += 1
+            self.retries_by_code[code] = self.retries_by_code.get(code, 0) + 1
+            self.total_backoff += backoff
+
+    def record_failure(self) -> None:
+        """Record transaction which failed after its retries budget was spent."""
+        with self._lock:
+            self.transactions += 1
+            self.failures += 1
+
+    def as_dict(self) -> dict:
+        """Return statistics as a dict, backoff time in milliseconds."""
+        with self._lock:
+            return {
+                'transactions': self.transactions,
+                'retries': self.retries,
+                'failures': self.failures,
+                'retries_by_code': dict(self.retries_by_code),
+                'total_backoff_ms': round(self.total_backoff * 1000, 3),
+            }
+
+
+retry_statistics = RetryStatistics()
+
+
+def get_retry_config() -> tuple[int, float, float]:
+    """Return max attempts and base and max backoff in seconds from the app config, defaults outside the app."""
+    config = current_app.config if has_app_context() else {}
+    return (
+        config.get('DB_RETRY_MAX_ATTEMPTS', TransactionRetryConstants.MAX_ATTEMPTS.value),
+        config.get('DB_RETRY_BASE_BACKOFF_MS', TransactionRetryConstants.BASE_BACKOFF_MS.value) / 1000,
+        config.get('DB_RETRY_MAX_BACKOFF_MS', TransactionRetryConstants.MAX_BACKOFF_MS.value) / 1000,
+    )
+
+
+def get_backoff(attempt: int, base_backoff: float, max_backoff: float) -> float:
+    """Return full jitter exponential backoff in seconds before the next attempt."""
+    return random.uniform(0, min(max_backoff, base_backoff * 2 ** (attempt - 1)))
+
+
+def retry_transaction(method: Callable) -> Callable:
+    """Retry service's write method if its transaction failed with serialization failure or deadlock.
+
+    The session is rolled back and the whole method runs again after jittered exponential backoff, until
+    the attempts budget or the request's deadline is spent. Methods called by an already retried method
+    run once, the outermost one retries the whole transaction.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        session = self.session
+        retry_scope_key = TransactionRetryConstants.SESSION_RETRY_SCOPE_KEY.value
+        if session.info.get(retry_scope_key):
+            return method(self, *args, **kwargs)
+        max_attempts, base_backoff, max_backoff = get_retry_config()
+        session.info[retry_scope_key] = True
+        try:
+            attempt = 1
+            while True:
+                try:
+                    result = method(self, *args, **kwargs)
+                except DBAPIError as err:
+                    code = getattr(err.orig, 'pgcode', None)
+                    if code not in TransactionRetryConstants.RETRYABLE_CODES.value:
+                        raise
+                    session.rollback()
+                    backoff = get_backoff(attempt=attempt, base_backoff=base_backoff, max_backoff=max_backoff)
+                    deadline = session.info.get(RequestDeadlineConstants.SESSION_DEADLINE_KEY.value)
+                    deadline_spent = deadline is not None and remaining_time_ms(deadline=deadline) <= backoff * 1000
+                    if attempt >= max_attempts or deadline_spent:
+                        retry_statistics.record_failure()
+                        log.warning(f'{method.__qualname__} transaction failed with {code} after {attempt} attempts.')
+                        raise
+                    retry_statistics.record_retry(code=code, backoff=backoff)
+                    log.debug(f'{method.__qualname__} transaction failed with {code}, attempt {attempt}, retrying.')
+                    time.sleep(backoff)
+                    attempt += 1
+                else:
+                    retry_statistics.record_success()
+                    return result
+        finally:
+            session.info.pop(retry_scope_key, None)
+    return wrapper
@@ -0,0 +1,71 @@
+from itertools import cycle
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.engine.base import Connection, Engine
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.pool import QueuePool
+
+from common.constants.db import DatabaseBackendConstants, DatabaseRoutingConstants
+
+
+class ReplicaSelector:
+    """Picks a read replica engine for read-only sessions."""
+
+    BALANCING_STRATEGIES = (
+        DatabaseRoutingConstants.ROUND_ROBIN.value,
+        DatabaseRoutingConstants.LEAST_LOADED.value,
+    )
+
+    def __init__(self, engines: list[Engine], balancing: str) -> None:
+        if balancing not in self.BALANCING_STRATEGIES:
+            raise ValueError(f'Unknown replica balancing strategy: {balancing}.')
+        self.engines = engines
+        self.balancing = balancing
+        self._engines_cycle = cycle(engines)
+        self._lock = Lock()
+
+    def select(self) -> Engine:
+        """Return replica engine picked with round robin or the one with the least connections in use."""
+        if self.balancing == DatabaseRoutingConstants.LEAST_LOADED.value:
+            return min(self.engines, key=self._connections_in_use)
+        with self._lock:
+            return next(self._engines_cycle)
+
+    @staticmethod
+    def _connections_in_use(engine: Engine) -> int:
+        """Return number of engine's connections in use, unknown for not pooled engines behind an external pooler."""
+        return engine.pool.checkedout() if isinstance(engine.pool, QueuePool) else 0
+
+
+class RoutingSession(Session):
+    """Session which sends read-only sessions to a read replica and everything else to the primary.
+
+    A session is read-only when its info dict has the 'read_only' key set, replica is picked once per session.
+    """
+
+    def __init__(self, replica_selector: ReplicaSelector | None = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.replica_selector = replica_selector
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine | Connection:
+        READ_ONLY_KEY = DatabaseRoutingConstants.SESSION_READ_ONLY_KEY.value
+        REPLICA_KEY = DatabaseRoutingConstants.SESSION_REPLICA_KEY.value
+        if self.replica_selector and self.info.get(READ_ONLY_KEY) and not self._flushing:
+            if REPLICA_KEY not in self.info:
+                self.info[REPLICA_KEY] = self.replica_selector.select()
+            return self.info[REPLICA_KEY]
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_begin')
+def set_replica_transaction_read_only(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection,
+        ) -> None:
+    """Start transactions on postgres read replica connections as READ ONLY."""
+    if connection.dialect.name != DatabaseBackendConstants.POSTGRESQL.value:
+        return
+    if connection.engine is session.info.get(DatabaseRoutingConstants.SESSION_REPLICA_KEY.value):
+        connection.exec_driver_sql('SET TRANSACTION READ ONLY')
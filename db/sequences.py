@@ -0,0 +1,104 @@
+from collections import deque
+from threading import Lock
+from typing import Type
+
+from flask import current_app, has_app_context
+
+from sqlalchemy import Sequence, func, select
+from sqlalchemy.orm import Session
+
+from common.constants.db import CardIdConstants, DatabaseBackendConstants
+from db import Base
+from utils.logging import setup_logging
+
+log = setup_logging(__name__)
+
+
+class CardIdAllocator:
+    """Allocates card id numbers from the postgres sequences, reserving them in blocks per worker process.
+
+    With block size above 1 the numbers are reserved with a single statement and handed out from memory, so
+    card ids are unique but not ordered by creation time across workers, and the reserved numbers left unused
+    when the worker stops are skipped. SQLite has no sequences, the number there follows the table's greatest
+    card id, SQLite runs one write transaction at a time.
+    """
+
+    def __init__(self, block_size: int = CardIdConstants.BLOCK_SIZE.value) -> None:
+        if block_size < 1:
+            raise ValueError(f'Card id block size has to be positive, got {block_size}.')
+        self.block_size = block_size
+        self._blocks = {}
+        self._lock = Lock()
+
+    def next_number(self, session: Session, sequence: Sequence, table: Type[Base]) -> int:
+        """Return next card id number of the table.
+
+        Args:
+            session: db session to reserve the numbers with.
+            sequence: postgres sequence of the table's card ids.
+            table: db table with the card_id column.
+
+        Returns:
+        Card id number not used by any other card id.
+        """
+        if session.get_bind().dialect.name == DatabaseBackendConstants.SQLITE.value:
+            return self._next_table_number(session=session, table=table)
+        number = self._pop(sequence=sequence)
+        if number is not None:
+            return number
+        # The block is reserved without the lock, other threads don't wait for the db.
+        block = self._reserve_block(session=session, sequence=sequence, size=self.block_size)
+        with self._lock:
+            numbers = self._blocks.setdefault(sequence.name, deque())
+            numbers.extend(block)
+            return numbers.popleft()
+
+    def next_numbers(self, session: Session, sequence: Sequence, table: Type[Base], count: int) -> list[int]:
+        """Return count of next card id numbers of the table reserved with a single statement.
+
+        Numbers are reserved apart from the worker's block, they are consecutive unless other transactions take
+        numbers from the sequence at the same time.
+
+        Args:
+            session: db session to reserve the numbers with.
+            sequence: postgres sequence of the table's card ids.
+            table: db table with the card_id column.
+            count: number of card id numbers.
+
+        Returns:
+        list of ascending card id numbers not used by any other card id.
+        """
+        if session.get_bind().dialect.name == DatabaseBackendConstants.SQLITE.value:
+            first = self._next_table_number(session=session, table=table)
+            return list(range(first, first + count))
+        return self._reserve_block(session=session, sequence=sequence, size=count)
+
+    def _pop(self, sequence: Sequence) -> int | None:
+        """Return reserved number of the sequence, None if there is none left."""
+        with self._lock:
+            numbers = self._blocks.get(sequence.name)
+            return numbers.popleft() if numbers else None
+
+    def _reserve_block(self, session: Session, sequence: Sequence, size: int) -> list[int]:
+        """Reserve block of the sequence's numbers with a single statement."""
+        statement = select(sequence.next_value()).select_from(func.generate_series(1, size))
+        block = sorted(session.execute(statement).scalars())
+        log.debug(f'Reserved {sequence.name} numbers from {block[0]} to {block[-1]}.')
+        return block
+
+    def _next_table_number(self, session: Session, table: Type[Base]) -> int:
+        """Return number following the greatest card id of the table, card ids have the same width."""
+        card_id = session.execute(select(func.max(table.card_id))).scalar()
+        return int(card_id.split('-')[1]) + 1 if card_id else 1
+
+
+def get_card_id_allocator() -> CardIdAllocator:
+    """Return the app's card id allocator, not reserving blocks outside the app."""
+    if has_app_context():
+        return current_app.card_id_allocator
+    return CardIdAllocator()
+
+
+def format_card_id(prefix: str, number: int) -> str:
+    """Return card id string, PREFIX-NUMBER with the zero padded number."""
+    return f'{prefix}-{number:0{CardIdConstants.NUMBER_WIDTH.value}d}'
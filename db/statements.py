@@ -0,0 +1,68 @@
+from threading import Lock
+from typing import Type
+
+from sqla_softdelete import SoftDeleteMixin
+from sqlalchemy import bindparam, exists, select, update
+from sqlalchemy.sql.dml import Update
+from sqlalchemy.sql.selectable import Select
+
+from db import Base
+
+
+class StatementRegistry:
+    """Lookup statements built once per (model, column) and reused for the whole process.
+
+    Reusing the same statement object lets sqlalchemy skip building the statement and its cache key on every call,
+    the statement is compiled once and then served from the engine's compiled cache.
+    Statements filter out soft deleted rows, the same way sqla_softdelete does for the legacy Query API.
+    Column value is passed as 'value' bound parameter on execution, list of values of the '_in' statements
+    as 'values' expanding bound parameter.
+    """
+
+    def __init__(self) -> None:
+        self._statements = {}
+        self._lock = Lock()
+
+    def select_by(self, table: Type[Base], column: str) -> Select:
+        """Return SELECT statement of table objects filtered by column value."""
+        return self._get_statement(kind='select', table=table, column=column)
+
+    def exists_by(self, table: Type[Base], column: str) -> Select:
+        """Return SELECT EXISTS statement of table objects filtered by column value."""
+        return self._get_statement(kind='exists', table=table, column=column)
+
+    def update_by(self, table: Type[Base], column: str) -> Update:
+        """Return UPDATE statement of table objects filtered by column value, values are set by the caller."""
+        return self._get_statement(kind='update', table=table, column=column)
+
+    def select_in(self, table: Type[Base], column: str) -> Select:
+        """Return SELECT statement of table objects with column value in the list of values."""
+        return self._get_statement(kind='select_in', table=table, column=column)
+
+    def update_in(self, table: Type[Base], column: str) -> Update:
+        """Return UPDATE statement of table objects with column value in the list of values."""
+        return self._get_statement(kind='update_in', table=table, column=column)
+
+    def _get_statement(self, kind: str, table: Type[Base], column: str) -> Select | Update:
+        key = (kind, table, column)
+        statement = self._statements.get(key)
+        if statement is None:
+            with self._lock:
+                statement = self._statements.setdefault(key, self._build_statement(kind, table, column))
+        return statement
+
+    def _build_statement(self, kind: str, table: Type[Base], column: str) -> Select | Update:
+        if kind.endswith('_in'):
+            criteria = [getattr(table, column).in_(bindparam('values', expanding=True))]
+        else:
+            criteria = [getattr(table, column) == bindparam('value')]
+        if issubclass(table, SoftDeleteMixin):
+            criteria.append(table.deleted_at.is_(None))
+        if kind == 'exists':
+            return select(exists().where(*criteria))
+        if kind.startswith('update'):
+            return update(table).where(*criteria)
+        return select(table).where(*criteria)
+
+
+statements = StatementRegistry()
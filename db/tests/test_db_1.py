@@ -0,0 +1,719 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+import json
+import os
+import time
+
+from flask import g, url_for
+
+from marshmallow import pre_dump
+from sqlalchemy import event, text, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+
+from common.constants.db import (
+    DatabaseRoutingConstants,
+    QueryStatisticsConstants,
+    RequestDeadlineConstants,
+    StatementCommentConstants,
+    TransactionRetryConstants,
+)
+from common.constants.exceptions import SqlalchemyExceptionConstants
+from common.constants.http import HttpStatusCodeConstants
+from common.tests.generic import TestMixin
+from common.tests.test_data.users import request_test_user_data
+from courses.schemas import CourseOutputSchema
+from courses.services import CourseService
+from db import Base, create_db_engine, get_session
+from db.commands import sql_endpoints_report
+from db.monitoring import fingerprint_statement, parse_statement_comment, summarize_endpoints_load
+from db.pool import get_pool_status, warm_up_pool
+from db.retry import retry_statistics, retry_transaction
+from db.sequences import CardIdAllocator
+from db.statements import statements
+from students.models import Student, card_id_sequence
+from students.services import StudentService
+from students.utils.exceptions import TeacherExistsError
+from teachers.models import Teacher
+from teachers.services import TeacherService
+from teachers.utils.exceptions import StudentExistsError
+from users.models import User
+from users.schemas import UserOutputSchema
+from users.services import UserService
+from users.utils.exceptions import UserNotFoundError
+from utils.exceptions import get_error_code, get_error_message, operational_error_handler
+from utils.schemas import get_schema
+
+
+class LazySessionTestCase(TestMixin, TestCase):
+    """Tests for the lazy per-request db session."""
+
+    def test_lazy_session_not_used_on_not_found_url(self) -> None:
+        """Test request to unknown url doesn't create db session."""
+        response = self.client.get('/api/v1/unknown-url')
+        self.assertEqual(HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value, response.status_code)
+        self.assertFalse(g.db_session.used)
+
+    def test_lazy_session_not_used_on_invalid_payload(self) -> None:
+        """Test request failing payload validation doesn't create db session."""
+        response = self.client.post(url_for('users.post_users'), json=request_test_user_data.ADD_USER_EMPTY_TEST_DATA)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertFalse(g.db_session.used)
+
+    def test_lazy_session_used_on_db_request(self) -> None:
+        """Test request querying the db creates db session."""
+        response = self.client.get(url_for('users.get_users'))
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertTrue(g.db_session.used)
+
+
+class ReadReplicaRoutingTestCase(TestMixin, TestCase):
+    """Tests for GET requests routing to the read replicas."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Second test database plays the read replica role.
+        self.replica_db_url = f'{self.db_url}_replica'
+        self.create_db(url=self.replica_db_url)
+        self.replica_engine = create_db_engine(config=self.app.config, echo=False, url=self.replica_db_url)
+        self.create_tables(engine=self.replica_engine, Base=Base)
+        self.replica_db_session = get_session(engine=self.replica_engine)
+        self.app.db_replica_engines = [self.replica_engine]
+        self.app.db_session_registry = get_session(
+            engine=self.app.db_engine,
+            replica_engines=self.app.db_replica_engines,
+            balancing=DatabaseRoutingConstants.ROUND_ROBIN.value,
+        )
+
+    def tearDown(self) -> None:
+        self.app.db_session_registry.remove()
+        self.replica_db_session.remove()
+        self.replica_engine.dispose()
+        super().tearDown()
+        self.drop_db(url=self.replica_db_url)
+
+    def test_get_request_routed_to_replica(self) -> None:
+        """Test GET '/users' endpoint reads users from the read replica."""
+        UserService(session=self.replica_db_session)._save_user_data(user=request_test_user_data.ADD_USER_TEST_DATA)
+        response = self.client.get(url_for('users.get_users'))
+        response_data = response.get_json()
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(1, len(response_data['data']))
+        self.assertEqual(0, self.db_session.query(User).count())
+
+    def test_client_sticks_to_primary_after_write(self) -> None:
+        """Test GET '/users' endpoint reads from the primary right after the client's POST '/users' request."""
+        response = self.client.post(url_for('users.post_users'), json=request_test_user_data.ADD_USER_TEST_DATA)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.app.db_session_registry.remove()
+        response = self.client.get(url_for('users.get_users'))
+        response_data = response.get_json()
+        self.assertEqual(1, len(response_data['data']))
+        self.assertEqual(request_test_user_data.ADD_USER_TEST_DATA['username'], response_data['data'][0]['username'])
+        self.assertEqual(0, self.replica_db_session.query(User).count())
+
+    def test_replica_transaction_read_only(self) -> None:
+        """Test read-only session runs READ ONLY transactions on the read replica."""
+        session = self.app.db_session_registry
+        session.info[DatabaseRoutingConstants.SESSION_READ_ONLY_KEY.value] = True
+        self.assertEqual('on', session.execute(text('SHOW transaction_read_only')).scalar())
+        self.assertIs(self.replica_engine, session.get_bind())
+
+
+class QueryStatisticsTestCase(TestMixin, TestCase):
+    """Tests for per-request statements statistics and N+1 queries detection."""
+
+    def test_statement_count_header(self) -> None:
+        """Test GET '/users' endpoint reports single statement in response headers."""
+        response = self.client.get(url_for('users.get_users'))
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+        self.assertIn(QueryStatisticsConstants.TOTAL_TIME_HEADER.value, response.headers)
+        self.assertEqual('0', response.headers[QueryStatisticsConstants.REPEATED_STATEMENTS_HEADER.value])
+
+    def test_n_plus_one_queries_detected(self) -> None:
+        """Test statement executed for each object of the list is reported as repeated statement."""
+        db_users = [self.add_random_user_to_db() for _ in range(self.app.config['SQL_N_PLUS_ONE_THRESHOLD'])]
+
+        def get_users_one_by_one() -> str:
+            for db_user in db_users:
+                g.db_session.execute(statements.select_by(table=User, column='id'), {'value': db_user.id})
+            return ''
+        self.app.add_url_rule('/n-plus-one', view_func=get_users_one_by_one)
+        with self.assertLogs(self.app.name, level='WARNING'):
+            response = self.client.get('/n-plus-one')
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.REPEATED_STATEMENTS_HEADER.value])
+
+    def test_get_courses_relationships_eager_loaded(self) -> None:
+        """Test GET '/courses' endpoint loads courses relationships without statements for each course."""
+        for _ in range(self.app.config['SQL_N_PLUS_ONE_THRESHOLD']):
+            self.add_random_course_to_db()
+        response = self.client.get(url_for('courses.get_courses'))
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('0', response.headers[QueryStatisticsConstants.REPEATED_STATEMENTS_HEADER.value])
+
+    def test_fingerprint_statement(self) -> None:
+        """Test statements which differ only by parameters have the same fingerprint."""
+        self.assertEqual(
+            fingerprint_statement("SELECT * FROM users WHERE id IN (%(id_1)s, %(id_2)s) AND username = 'john'"),
+            fingerprint_statement('SELECT *  FROM users\nWHERE id IN (%(id_1)s) AND username = \'bar\' /* comment */'),
+        )
+
+
+class StatementCommentsTestCase(TestMixin, TestCase):
+    """Tests for statements attribution to the endpoints with SQL comments."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.statements = []
+        event.listen(self.app.db_engine, 'after_cursor_execute', self.record_statement)
+
+    def tearDown(self) -> None:
+        event.remove(self.app.db_engine, 'after_cursor_execute', self.record_statement)
+        super().tearDown()
+
+    def record_statement(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def test_statements_tagged_with_endpoint(self) -> None:
+        """Test GET '/courses/{id}/students' endpoint statements are tagged with its endpoint and request id."""
+        db_course = self.add_random_student_to_course()
+        self.statements.clear()
+        response = self.client.get(url_for('courses.course_students.get_course_students', id=db_course.id))
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertTrue(self.statements)
+        for statement in self.statements:
+            self.assertEqual(
+                {
+                    'blueprint': 'courses.course_students',
+                    'endpoint': 'courses.course_students.get_course_students',
+                    'request_id': response.headers[StatementCommentConstants.REQUEST_ID_HEADER.value],
+                },
+                parse_statement_comment(statement),
+            )
+
+    def test_client_request_id_sanitized(self) -> None:
+        """Test client's X-Request-ID header is returned and can't close the statement's comment."""
+        request_id = "abc*/ DROP TABLE users; --'"
+        response = self.client.get(
+            url_for('users.get_users'), headers={StatementCommentConstants.REQUEST_ID_HEADER.value: request_id},
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(request_id, response.headers[StatementCommentConstants.REQUEST_ID_HEADER.value])
+        self.assertTrue(self.statements[-1].endswith(
+            "/*blueprint='users',endpoint='users.get_users',request_id='abcDROPTABLEusers--'*/"
+        ))
+
+    def test_statements_outside_request_not_tagged(self) -> None:
+        """Test statements executed outside of the request have no comment."""
+        self.add_user_to_db()
+        self.assertEqual({}, parse_statement_comment(self.statements[-1]))
+
+    def test_summarize_endpoints_load(self) -> None:
+        """Test logged executions are grouped by their own endpoint, a shared statement is counted under each."""
+        entries = [
+            {'endpoint': 'users.get_users', 'statement': 'SELECT ?', 'duration_ms': 4.0, 'rows': 1},
+            {'endpoint': 'users.get_users', 'statement': 'SELECT ?', 'duration_ms': 1.0, 'rows': 1},
+            {'endpoint': 'users.get_users', 'statement': 'SELECT ? FROM users', 'duration_ms': 1.0, 'rows': -1},
+            {'endpoint': 'courses.get_courses', 'statement': 'SELECT ?', 'duration_ms': 20.0, 'rows': 1},
+            {'endpoint': None, 'statement': 'SELECT pg_backend_pid()', 'duration_ms': 0.3, 'rows': 1},
+        ]
+        self.assertEqual(
+            [
+                {
+                    'endpoint': 'courses.get_courses', 'statements': 1, 'calls': 1,
+                    'total_time_ms': 20.0, 'rows': 1, 'mean_time_ms': 20.0,
+                },
+                {
+                    'endpoint': 'users.get_users', 'statements': 2, 'calls': 3,
+                    'total_time_ms': 6.0, 'rows': 2, 'mean_time_ms': 2.0,
+                },
+                {
+                    'endpoint': StatementCommentConstants.UNATTRIBUTED_ENDPOINT.value, 'statements': 1, 'calls': 1,
+                    'total_time_ms': 0.3, 'rows': 1, 'mean_time_ms': 0.3,
+                },
+            ],
+            summarize_endpoints_load(entries=entries),
+        )
+
+    def test_report_command_counts_every_execution(self) -> None:
+        """Test report command counts every logged execution under the endpoint which executed it."""
+        self.app.slow_query_log.threshold_ms = 0
+        self.app.slow_query_log.explain_sample_rate = 0
+        open(self.app.config['SLOW_QUERY_LOG_FILE'], 'w').close()
+        statement_counts = {'users.get_users': 0, 'courses.get_courses': 0}
+        for endpoint in ['users.get_users', 'users.get_users', 'courses.get_courses']:
+            response = self.client.get(url_for(endpoint))
+            self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+            statement_counts[endpoint] += int(response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+        result = self.app.test_cli_runner().invoke(sql_endpoints_report)
+        self.assertEqual(0, result.exit_code)
+        self.assertIn('Statements executions of at least 0 ms', result.output)
+        calls = {line.split()[0]: int(line.split()[2]) for line in result.output.splitlines()[2:]}
+        self.assertEqual(statement_counts, calls)
+
+
+class SlowQueryLogTestCase(TestMixin, TestCase):
+    """Tests for slow query log with EXPLAIN plans capture."""
+
+    def test_slow_query_logged_with_explain_plan(self) -> None:
+        """Test GET '/users' endpoint statement slower than the threshold is logged with its plan."""
+        self.app.slow_query_log.threshold_ms = 0
+        self.app.slow_query_log.explain_sample_rate = 1.0
+        response = self.client.get(url_for('users.get_users'))
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        with open(self.app.config['SLOW_QUERY_LOG_FILE']) as log_file:
+            last_line = log_file.readlines()[-1]
+        entry = json.loads(last_line[last_line.index('{'):])
+        self.assertEqual('users.get_users', entry['endpoint'])
+        self.assertEqual(response.headers[StatementCommentConstants.REQUEST_ID_HEADER.value], entry['request_id'])
+        self.assertTrue(entry['statement'].startswith('SELECT users.deleted_at'))
+        self.assertIn('Execution Time', entry['plan'])
+
+    def test_slow_query_with_side_effects_not_analyzed(self) -> None:
+        """Test slow sequence call is explained without ANALYZE, which would take another sequence number."""
+        self.app.slow_query_log.threshold_ms = 0
+        self.app.slow_query_log.explain_sample_rate = 1.0
+        allocator = CardIdAllocator(block_size=1)
+        numbers = [
+            allocator.next_number(session=self.db_session, sequence=card_id_sequence, table=Student)
+            for _ in range(2)
+        ]
+        self.assertEqual([1, 2], numbers)
+        with open(self.app.config['SLOW_QUERY_LOG_FILE']) as log_file:
+            last_line = log_file.readlines()[-1]
+        entry = json.loads(last_line[last_line.index('{'):])
+        self.assertIn('nextval', entry['statement'])
+        self.assertNotIn('Execution Time', entry['plan'])
+
+
+class StatementRegistryTestCase(TestMixin, TestCase):
+    """Tests for prebuilt lookup statements registry."""
+
+    def test_statement_built_once(self) -> None:
+        """Test registry returns the same statement object for the same model and column."""
+        self.assertIs(statements.select_by(table=User, column='id'), statements.select_by(table=User, column='id'))
+        self.assertIsNot(statements.select_by(table=User, column='id'), statements.exists_by(table=User, column='id'))
+
+    def test_statement_excludes_soft_deleted(self) -> None:
+        """Test registry statements don't find soft deleted objects."""
+        db_user = self.add_user_to_db()
+        statement = statements.exists_by(table=User, column='id')
+        self.assertTrue(self.db_session.execute(statement, {'value': db_user.id}).scalar())
+        db_user.delete()
+        self.db_session.commit()
+        self.assertFalse(self.db_session.execute(statement, {'value': db_user.id}).scalar())
+
+
+class SessionBoundServiceTestCase(TestMixin, TestCase):
+    """Tests for services and schemas built once per process and bound to the request's session."""
+
+    def test_service_built_once(self) -> None:
+        """Test services of the same schemas share the serializer and are bound to their own sessions."""
+        output_schema = get_schema(UserOutputSchema, many=True)
+        self.assertIs(output_schema, get_schema(UserOutputSchema, many=True))
+        self.assertIsNot(output_schema, get_schema(UserOutputSchema, many=False))
+        service = UserService.for_session(session=self.db_session, output_schema=output_schema)
+        other_session = get_session(engine=self.app.db_engine)
+        other_service = UserService.for_session(session=other_session, output_schema=output_schema)
+        self.assertIs(service.validator, other_service.validator)
+        self.assertIs(self.db_session, service.session)
+        self.assertIs(other_session, other_service.session)
+        other_session.remove()
+
+    def test_nested_service_bound_to_session(self) -> None:
+        """Test nested services are bound to the session of the service."""
+        service = CourseService.for_session(session=self.db_session)
+        self.assertIs(self.db_session, service.student_service.session)
+        self.assertIsNone(CourseService.for_session(session=None).student_service.session)
+
+
+class UpdateReturningTestCase(TestMixin, TestCase):
+    """Tests for updates returning the updated object from the UPDATE statement."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.statements = []
+        event.listen(self.app.db_engine, 'after_cursor_execute', self.record_statement)
+
+    def tearDown(self) -> None:
+        event.remove(self.app.db_engine, 'after_cursor_execute', self.record_statement)
+        super().tearDown()
+
+    def record_statement(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def test_updated_object_returned(self) -> None:
+        """Test updated object is returned by the single UPDATE ... RETURNING statement."""
+        db_user = self.add_user_to_db()
+        self.statements.clear()
+        updated_user = UserService(session=self.db_session)._update_object(
+            table=User,
+            column='id',
+            value=db_user.id,
+            values={'first_name': 'renamed_john'},
+            not_found_error=UserNotFoundError,
+        )
+        self.assertEqual(1, len(self.statements))
+        self.assertTrue(self.statements[0].startswith('UPDATE users SET first_name='))
+        self.assertIn('RETURNING', self.statements[0])
+        self.assertEqual('renamed_john', updated_user.first_name)
+        self.assertEqual(db_user.created_at, updated_user.created_at)
+
+    def test_soft_deleted_object_not_updated(self) -> None:
+        """Test update of soft deleted object raises the model's not found error."""
+        db_user = self.add_user_to_db()
+        db_user.delete()
+        self.db_session.commit()
+        with self.assertRaises(UserNotFoundError):
+            UserService(session=self.db_session)._update_object(
+                table=User,
+                column='id',
+                value=db_user.id,
+                values={'first_name': 'renamed_john'},
+                not_found_error=UserNotFoundError,
+            )
+
+
+class ConnectionReleaseTestCase(TestMixin, TestCase):
+    """Tests for services releasing db connection before the serialization."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connections_in_use = []
+
+        test_case = self
+
+        class PoolCheckingMixin:
+            @pre_dump(pass_many=True)
+            def check_pool(self, data, many: bool, **kwargs):
+                test_case.connections_in_use.append(get_pool_status(engine=test_case.app.db_engine)['in_use'])
+                return data
+
+        self.user_schema_class = type('UserPoolCheckingSchema', (PoolCheckingMixin, UserOutputSchema), {})
+        self.course_schema_class = type('CoursePoolCheckingSchema', (PoolCheckingMixin, CourseOutputSchema), {})
+
+    def test_connection_released_before_list_serialization(self) -> None:
+        """Test list of objects is serialized with the connection returned to the pool."""
+        self.add_user_to_db()
+        self.db_session.remove()
+        session = get_session(engine=self.app.db_engine)
+        users = UserService(session=session, output_schema=self.user_schema_class(many=True)).get_users()
+        self.assertEqual(1, len(users))
+        self.assertEqual([0], self.connections_in_use)
+        session.remove()
+
+    def test_relationships_loaded_before_serialization(self) -> None:
+        """Test object with relationships is serialized detached, without lazy loading statements."""
+        course_id = self.add_random_student_to_course().id
+        self.db_session.remove()
+        session = get_session(engine=self.app.db_engine)
+        course = CourseService(
+            session=session, output_schema=self.course_schema_class(many=False),
+        ).get_course_by_id(id=course_id)
+        self.assertEqual(str(course_id), course['id'])
+        self.assertIn('id', course['subject'])
+        self.assertIn('id', course['teacher'])
+        self.assertEqual(1, len(course['students']))
+        self.assertEqual([0], self.connections_in_use)
+        session.remove()
+
+
+class ConflictingUserService(UserService):
+    """UserService renaming user, while concurrent transactions update the same user."""
+
+    def __init__(self, *args, conflicts: int, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.conflicts = conflicts
+        self.attempts = 0
+
+    @retry_transaction
+    def _rename_user(self, id: str, username: str) -> User:
+        self.attempts += 1
+        db_user = self.session.get(User, id)
+        if self.attempts <= self.conflicts:
+            with self.session.get_bind().engine.begin() as connection:
+                connection.execute(update(User).where(User.id == id).values(first_name=f'concurrent_{self.attempts}'))
+        db_user.username = username
+        self.session.commit()
+        return db_user
+
+
+class TransactionRetryTestCase(TestMixin, TestCase):
+    """Tests for write transactions retry after serialization failures."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['DB_RETRY_BASE_BACKOFF_MS'] = 1
+        self.user_id = self.add_user_to_db().id
+        self.db_session.remove()
+        self.session = get_session(engine=self.app.db_engine.execution_options(isolation_level='REPEATABLE READ'))
+        self.statistics = retry_statistics.as_dict()
+
+    def tearDown(self) -> None:
+        self.session.remove()
+        super().tearDown()
+
+    def test_serialization_failure_retried(self) -> None:
+        """Test transaction failed with serialization failure is rolled back and committed on the next attempt."""
+        service = ConflictingUserService(session=self.session, conflicts=1)
+        db_user = service._rename_user(id=self.user_id, username='renamed_john')
+        self.assertEqual(2, service.attempts)
+        self.assertEqual('renamed_john', db_user.username)
+        self.assertEqual('concurrent_1', db_user.first_name)
+        statistics = retry_statistics.as_dict()
+        self.assertEqual(self.statistics['retries'] + 1, statistics['retries'])
+        self.assertEqual(self.statistics['failures'], statistics['failures'])
+        self.assertEqual(
+            self.statistics['retries_by_code'].get('40001', 0) + 1, statistics['retries_by_code']['40001'],
+        )
+
+    def test_serialization_failure_retries_budget_spent(self) -> None:
+        """Test transaction conflicting on every attempt fails after the attempts budget with 409 response."""
+        self.app.config['DB_RETRY_MAX_ATTEMPTS'] = 2
+        service = ConflictingUserService(session=self.session, conflicts=3)
+        with self.assertRaises(OperationalError) as context:
+            service._rename_user(id=self.user_id, username='renamed_john')
+        self.assertEqual(2, service.attempts)
+        self.assertEqual(self.statistics['failures'] + 1, retry_statistics.as_dict()['failures'])
+        response = operational_error_handler(error=context.exception)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_409_CONFLICT.value, response.status_code)
+
+    def test_nested_retried_method_runs_once(self) -> None:
+        """Test retried method called by other retried method is retried only by the outermost one."""
+        service = ConflictingUserService(session=self.session, conflicts=1)
+        service.session.info[TransactionRetryConstants.SESSION_RETRY_SCOPE_KEY.value] = True
+        with self.assertRaises(OperationalError):
+            service._rename_user(id=self.user_id, username='renamed_john')
+        self.assertEqual(1, service.attempts)
+
+
+class EngineLifecycleTestCase(TestMixin, TestCase):
+    """Tests for fork-safe engines and pool warm-up."""
+
+    def test_pool_warm_up(self) -> None:
+        """Test warm-up opens connections and leaves them idle in the pool."""
+        self.app.db_engine.dispose()
+        self.assertEqual(2, warm_up_pool(engine=self.app.db_engine, connections=2))
+        self.assertEqual(2, self.app.db_engine.pool.checkedin())
+
+    def test_connection_from_other_process_replaced(self) -> None:
+        """Test pooled connection opened by another process is not handed out again."""
+        with self.app.db_engine.connect() as connection:
+            connection.connection._connection_record.info['pid'] = 0
+            inherited_connection = connection.connection.dbapi_connection
+        with self.app.db_engine.connect() as connection:
+            self.assertIsNot(inherited_connection, connection.connection.dbapi_connection)
+            self.assertEqual(1, connection.exec_driver_sql('SELECT 1').scalar())
+        inherited_connection.close()
+
+    def test_worker_pool_warmed_up_after_fork(self) -> None:
+        """Test forked worker process starts with warmed up pool of its own connections."""
+        self.add_user_to_db()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            with os.fdopen(write_fd, 'w') as pipe:
+                pipe.write(json.dumps(get_pool_status(engine=self.app.db_engine)))
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            child_pool_status = json.loads(pipe.read())
+        os.waitpid(pid, 0)
+        self.assertEqual(self.app.config['SQLALCHEMY_POOL_WARM_UP_CONNECTIONS'], child_pool_status['idle'])
+        self.assertEqual(1, self.db_session.query(User).count())
+
+
+class RequestDeadlineTestCase(TestMixin, TestCase):
+    """Tests for request deadline propagation to statement_timeout."""
+
+    def test_statement_timeout_set_from_deadline(self) -> None:
+        """Test session with request deadline limits its statements with the rest of the budget."""
+        db_session = get_session(engine=self.app.db_engine)
+        db_session.info[RequestDeadlineConstants.SESSION_DEADLINE_KEY.value] = time.monotonic() + 1.5
+        statement_timeout = db_session.execute(text('SHOW statement_timeout')).scalar()
+        db_session.remove()
+        self.assertRegex(statement_timeout, r'^1[0-9]{3}ms$')
+        self.assertLessEqual(int(statement_timeout[:-2]), 1500)
+
+    def test_request_with_spent_budget_rejected(self) -> None:
+        """Test GET '/users' endpoint with no budget left is rejected before any statement is sent."""
+        response = self.client.get(
+            url_for('users.get_users'),
+            headers={RequestDeadlineConstants.DEADLINE_HEADER.value: '0'},
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_504_GATEWAY_TIMEOUT.value, response.status_code)
+        self.assertEqual('0', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+
+    def test_slow_statement_cancelled(self) -> None:
+        """Test statement running longer than the request's budget is cancelled with 504 response."""
+        self.app.add_url_rule('/slow', 'slow', lambda: str(g.db_session.execute(text('SELECT pg_sleep(2)')).scalar()))
+        response = self.client.get('/slow', headers={RequestDeadlineConstants.DEADLINE_HEADER.value: '100'})
+        self.assertEqual(HttpStatusCodeConstants.HTTP_504_GATEWAY_TIMEOUT.value, response.status_code)
+        self.assertEqual(
+            {'code': HttpStatusCodeConstants.HTTP_504_GATEWAY_TIMEOUT.value},
+            response.get_json()['status'],
+        )
+
+
+class CardIdAllocatorTestCase(TestMixin, TestCase):
+    """Tests for card ids allocated from the db sequences."""
+
+    def add_student(self, user_id: str) -> Student:
+        """Save Student in its own thread's session, as concurrent requests do."""
+        with self.app.app_context():
+            session = get_session(engine=self.app.db_engine)
+            try:
+                return StudentService(session=session)._save_student_data({'id': user_id, 'student_since': None})
+            finally:
+                session.remove()
+
+    def test_card_ids_reserved_in_blocks(self) -> None:
+        """Test allocator hands out numbers from a block reserved with a single sequence call."""
+        allocator = CardIdAllocator(block_size=5)
+        numbers = [
+            allocator.next_number(session=self.db_session, sequence=card_id_sequence, table=Student)
+            for _ in range(6)
+        ]
+        self.assertEqual([1, 2, 3, 4, 5, 6], numbers)
+        last_value = self.db_session.execute(text(f'SELECT last_value FROM {card_id_sequence.name}')).scalar()
+        self.assertEqual(10, last_value)
+
+    def test_card_ids_reserved_for_batch(self) -> None:
+        """Test batch numbers are reserved with a single sequence call, apart from the worker's block."""
+        allocator = CardIdAllocator(block_size=5)
+        first = allocator.next_number(session=self.db_session, sequence=card_id_sequence, table=Student)
+        numbers = allocator.next_numbers(session=self.db_session, sequence=card_id_sequence, table=Student, count=3)
+        self.assertEqual(1, first)
+        self.assertEqual([6, 7, 8], numbers)
+        self.assertEqual(2, allocator.next_number(session=self.db_session, sequence=card_id_sequence, table=Student))
+
+    def test_concurrent_students_get_unique_card_ids(self) -> None:
+        """Test students saved concurrently by workers sharing the allocator get unique card ids."""
+        self.app.card_id_allocator = CardIdAllocator(block_size=3)
+        user_ids = [self.add_random_user_to_db().id for _ in range(12)]
+        self.db_session.remove()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            card_ids = [student.card_id for student in executor.map(self.add_student, user_ids)]
+        self.assertEqual(12, len(set(card_ids)))
+        self.assertTrue(all(card_id.startswith('STU-') and len(card_id) == 11 for card_id in card_ids))
+
+
+class ExclusiveRoleTestCase(TestMixin, TestCase):
+    """Tests for the db triggers keeping a user registered either as a student or as a teacher."""
+
+    def register(self, user_id: str, service_class: type) -> bool:
+        """Register the user as a student or a teacher in its own thread's session, return bool of success."""
+        with self.app.app_context():
+            session = get_session(engine=self.app.db_engine)
+            try:
+                if service_class is StudentService:
+                    service_class(session=session)._save_student_data({'id': user_id, 'student_since': None})
+                else:
+                    service_class(session=session)._save_teacher_data({'id': user_id, 'qualification': 'Math'})
+                return True
+            except (StudentExistsError, TeacherExistsError):
+                return False
+            finally:
+                session.remove()
+
+    def test_student_of_teacher_rejected_by_db(self) -> None:
+        """Test INSERT of the student of the user registered as a teacher fails, without the service's checks."""
+        db_teacher = self.add_random_teacher_to_db()
+        self.db_session.add(Student(id=db_teacher.id, card_id='STU-0000001'))
+        with self.assertRaises(IntegrityError) as context:
+            self.db_session.commit()
+        self.db_session.rollback()
+        self.assertEqual(
+            SqlalchemyExceptionConstants.EXCLUSION_VIOLATION_CODE.value,
+            get_error_code(error=context.exception),
+        )
+        self.assertEqual(
+            f'Student with id: {db_teacher.id} can not be created, '
+            f'because a Teacher with id: {db_teacher.id} already exists.',
+            get_error_message(error=context.exception),
+        )
+        self.assertEqual(0, self.db_session.query(Student).count())
+
+    def test_soft_deleted_teacher_registered_as_student(self) -> None:
+        """Test user of the soft deleted teacher can be registered as a student."""
+        db_teacher = self.add_random_teacher_to_db()
+        db_teacher.delete()
+        self.db_session.commit()
+        self.assertTrue(self.register(user_id=db_teacher.id, service_class=StudentService))
+
+    def test_concurrent_registrations_of_user_exclusive(self) -> None:
+        """Test user registered as a student and as a teacher at the same time gets a single role."""
+        user_ids = [self.add_random_user_to_db().id for _ in range(8)]
+        self.db_session.remove()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            students = executor.map(lambda id: self.register(user_id=id, service_class=StudentService), user_ids)
+            teachers = executor.map(lambda id: self.register(user_id=id, service_class=TeacherService), user_ids)
+            registrations = [student + teacher for student, teacher in zip(students, teachers)]
+        self.assertEqual([1] * 8, registrations)
+        self.assertEqual(8, self.db_session.query(Student).count() + self.db_session.query(Teacher).count())
+
+    def repeatable_read_session(self) -> Session:
+        """Return session of the repeatable read transactions, not waiting for the row locks longer than a second.
+
+        The session isn't scoped, the tests use it from the other threads.
+        """
+        session = get_session(engine=self.app.db_engine.execution_options(isolation_level='REPEATABLE READ'))()
+        session.execute(text("SET LOCAL lock_timeout = '1s'"))
+        return session
+
+    def test_registration_committed_after_snapshot_on_repeatable_read_serialization_failure(self) -> None:
+        """Test registration of the user registered by other transaction after the snapshot was taken fails.
+
+        Repeatable read snapshot doesn't see the other registration's row, the write of the user's row conflicts with
+        the other's instead.
+        """
+        db_user = self.add_random_user_to_db()
+        student_session = self.repeatable_read_session()
+        teacher_session = self.repeatable_read_session()
+        try:
+            # Snapshot of the teacher's transaction is taken by its card_id allocation, before the student's commit.
+            teacher_session.execute(text('SELECT 1'))
+            student_session.add(Student(id=db_user.id, card_id='STU-0000001'))
+            student_session.commit()
+            teacher_session.add(Teacher(id=db_user.id, card_id='TEA-0000001', qualification='Math'))
+            with self.assertRaises(OperationalError) as context:
+                teacher_session.flush()
+            self.assertEqual(
+                SqlalchemyExceptionConstants.SERIALIZATION_FAILURE_CODE.value,
+                context.exception.orig.pgcode,
+            )
+        finally:
+            teacher_session.close()
+            student_session.close()
+        self.assertEqual(1, self.db_session.query(Student).count())
+        self.assertEqual(0, self.db_session.query(Teacher).count())
+
+    def test_registration_waiting_for_other_on_repeatable_read_serialization_failure(self) -> None:
+        """Test registration of the user being registered by other transaction fails once the other one commits."""
+        db_user = self.add_random_user_to_db()
+        student_session = self.repeatable_read_session()
+        teacher_session = self.repeatable_read_session()
+
+        def add_teacher() -> None:
+            teacher_session.add(Teacher(id=db_user.id, card_id='TEA-0000001', qualification='Math'))
+            teacher_session.flush()
+
+        try:
+            teacher_session.execute(text('SELECT 1'))
+            student_session.add(Student(id=db_user.id, card_id='STU-0000001'))
+            student_session.flush()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                teacher = executor.submit(add_teacher)
+                time.sleep(0.2)
+                student_session.commit()
+                with self.assertRaises(OperationalError) as context:
+                    teacher.result()
+            self.assertEqual(
+                SqlalchemyExceptionConstants.SERIALIZATION_FAILURE_CODE.value,
+                context.exception.orig.pgcode,
+            )
+        finally:
+            teacher_session.close()
+            student_session.close()
+        self.assertEqual(0, self.db_session.query(Teacher).count())
@@ -0,0 +1,134 @@
+from unittest import SkipTest, TestCase
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+
+from sqlalchemy import text
+
+from app.config import TestingConfig, TestingExternalPoolerConfig
+from common.constants.db import RequestDeadlineConstants
+from common.tests.generic import TestMixin
+from courses.tests import test_courses_1, test_courses_students_1
+from db import get_session
+from db.pool import get_pool_status
+from db.tests import test_db_1
+from users.tests import test_users_1
+
+PGBOUNCER_START_TIMEOUT = 10
+pgbouncer_process = None
+
+
+def setUpModule() -> None:
+    """Start local pgbouncer in transaction pooling mode in front of the test postgres server."""
+    global pgbouncer_process
+    pgbouncer = shutil.which('pgbouncer')
+    if not pgbouncer:
+        raise SkipTest('pgbouncer executable not found.')
+    config_dir = tempfile.mkdtemp()
+    auth_file = os.path.join(config_dir, 'userlist.txt')
+    with open(auth_file, 'w') as file:
+        file.write(f'"{TestingConfig.POSTGRES_DB_USERNAME}" "{TestingConfig.POSTGRES_DB_PASSWORD}"\n')
+    config_file = os.path.join(config_dir, 'pgbouncer.ini')
+    with open(config_file, 'w') as file:
+        file.write(
+            '[databases]\n'
+            f'* = host={TestingConfig.POSTGRES_DB_HOST} port={TestingConfig.POSTGRES_DB_PORT}\n'
+            '[pgbouncer]\n'
+            f'listen_addr = {TestingExternalPoolerConfig.POSTGRES_DB_HOST}\n'
+            f'listen_port = {TestingExternalPoolerConfig.POSTGRES_DB_PORT}\n'
+            'unix_socket_dir =\n'
+            'auth_type = trust\n'
+            f'auth_file = {auth_file}\n'
+            'pool_mode = transaction\n'
+            'default_pool_size = 2\n'
+            'ignore_startup_parameters = extra_float_digits\n'
+        )
+    pgbouncer_process = subprocess.Popen([pgbouncer, config_file], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + PGBOUNCER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if pgbouncer_process.poll() is not None:
+            raise RuntimeError(f'pgbouncer failed to start: {pgbouncer_process.stderr.read().decode()}')
+        try:
+            socket.create_connection(
+                (TestingExternalPoolerConfig.POSTGRES_DB_HOST, TestingExternalPoolerConfig.POSTGRES_DB_PORT),
+            ).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError('pgbouncer did not start listening in time.')
+
+
+def tearDownModule() -> None:
+    """Stop local pgbouncer."""
+    if pgbouncer_process:
+        pgbouncer_process.terminate()
+        pgbouncer_process.wait()
+
+
+class ExternalPoolerTestCase(TestMixin, TestCase):
+    """Tests for the app behind the external transaction-mode pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+    def test_engine_not_pooled(self) -> None:
+        """Test app engine leaves connections pooling to the external pooler."""
+        self.assertEqual('NullPool', get_pool_status(engine=self.app.db_engine)['pool_class'])
+
+    def test_statement_timeout_not_leaked(self) -> None:
+        """Test request's statement_timeout ends with its transaction, server connections are shared."""
+        db_session = get_session(engine=self.app.db_engine)
+        db_session.info[RequestDeadlineConstants.SESSION_DEADLINE_KEY.value] = time.monotonic() + 1.5
+        db_session.execute(text('SELECT 1'))
+        db_session.remove()
+        self.assertEqual('0', self.db_session.execute(text('SHOW statement_timeout')).scalar())
+
+
+class GetUsersExternalPoolerTestCase(test_users_1.GetUsersTestCase):
+    """Tests for GET '/users' endpoint behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+
+class PostUsersExternalPoolerTestCase(test_users_1.PostUsersTestCase):
+    """Tests for POST '/users' endpoint behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+
+class PutUsersExternalPoolerTestCase(test_users_1.PutUsersTestCase):
+    """Tests for PUT '/users/{id}' endpoint behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+
+class GetCoursesExternalPoolerTestCase(test_courses_1.GetCoursesTestCase):
+    """Tests for GET '/courses' endpoint behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+
+class PostCoursesExternalPoolerTestCase(test_courses_1.PostCoursesTestCase):
+    """Tests for POST '/courses' endpoint behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+
+class PostCourseStudentsExternalPoolerTestCase(test_courses_students_1.PostCourseStudentsTestCase):
+    """Tests for POST '/courses/{id}/students' endpoint behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+
+class GetUsersStreamingExternalPoolerTestCase(test_users_1.GetUsersStreamingTestCase):
+    """Tests for GET '/users' endpoint with list streaming behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
+
+
+class RequestDeadlineExternalPoolerTestCase(test_db_1.RequestDeadlineTestCase):
+    """Tests for request deadline propagation behind the external pooler."""
+
+    config_name = TestingExternalPoolerConfig.CONFIG_NAME
@@ -0,0 +1,104 @@
+from typing import Type
+
+from sqlalchemy import DDL, event
+
+from common.constants.db import DatabaseBackendConstants, ExclusiveRoleConstants
+from db import Base
+
+# Rejects the inserted rows if a user of them is registered in the exclusive table given by the trigger's first
+# argument, with the error naming the row's and the exclusive table's models given by the other two. The statement's
+# rows are checked at once, from its transition table. Registrations of the same user lock the user's row first, so
+# they wait for each other and the waiting one sees the other's row once it commits on read committed. Snapshots of
+# the other isolation levels don't see the rows committed after them and a row lock alone doesn't conflict with them,
+# the registrations write the user's row instead, the one writing it after the other's commit, or waiting for it,
+# fails with serialization failure and is retried. The engine's isolation level is the same for every registration.
+# Migrations create the function from this statement.
+EXCLUSIVE_ROLE_FUNCTION_SQL = f"""
+    CREATE OR REPLACE FUNCTION {ExclusiveRoleConstants.FUNCTION_NAME.value}() RETURNS trigger AS $$
+    DECLARE
+        registered_id uuid;
+    BEGIN
+        IF current_setting('transaction_isolation') = 'read committed' THEN
+            PERFORM 1 FROM users JOIN {ExclusiveRoleConstants.INSERTED_ROWS.value} USING (id)
+                FOR NO KEY UPDATE OF users;
+        ELSE
+            UPDATE users SET id = users.id FROM {ExclusiveRoleConstants.INSERTED_ROWS.value} AS inserted
+                WHERE users.id = inserted.id;
+        END IF;
+        EXECUTE format(
+            'SELECT inserted.id FROM {ExclusiveRoleConstants.INSERTED_ROWS.value} AS inserted JOIN %I AS exclusive '
+            'ON exclusive.id = inserted.id WHERE exclusive.deleted_at IS NULL LIMIT 1',
+            TG_ARGV[0]
+        ) INTO registered_id;
+        IF registered_id IS NOT NULL THEN
+            RAISE EXCEPTION '% with id: % can not be created, because a % with id: % already exists.',
+                TG_ARGV[1], registered_id, TG_ARGV[2], registered_id USING ERRCODE = 'exclusion_violation';
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def exclusive_role_trigger_sql(table: str, exclusive_table: str, model: str, exclusive_model: str) -> str:
+    """Return postgres statement creating the exclusive role trigger of the table.
+
+    Args:
+        table: name of the db table the trigger checks the inserted rows of.
+        exclusive_table: name of the db table the users of the inserted rows can't be registered in.
+        model: name of the table's model, used in the error message.
+        exclusive_model: name of the exclusive table's model, used in the error message.
+
+    Returns:
+    CREATE TRIGGER statement.
+    """
+    return (
+        f'CREATE TRIGGER {table}_{ExclusiveRoleConstants.TRIGGER_SUFFIX.value} AFTER INSERT ON {table} '
+        f'REFERENCING NEW TABLE AS {ExclusiveRoleConstants.INSERTED_ROWS.value} FOR EACH STATEMENT '
+        f"EXECUTE FUNCTION {ExclusiveRoleConstants.FUNCTION_NAME.value}('{exclusive_table}', '{model}', "
+        f"'{exclusive_model}')"
+    )
+
+
+def add_exclusive_role_trigger(table: Type[Base], exclusive_table: str, exclusive_model: str) -> None:
+    """Create trigger rejecting the table's rows of the users registered in the exclusive table with the tables.
+
+    The exclusive table is given by name, the models of the roles don't import each other. SQLite runs one write
+    transaction at a time, its trigger checks the exclusive table only, SQLite's RAISE takes a literal message,
+    without the id.
+
+    Args:
+        table: db table the trigger checks the inserted rows of.
+        exclusive_table: name of the db table the users of the inserted rows can't be registered in.
+        exclusive_model: name of the exclusive table's model, used in the error message.
+    """
+    name = f'{table.__tablename__}_{ExclusiveRoleConstants.TRIGGER_SUFFIX.value}'
+    postgres_trigger = DDL(
+        exclusive_role_trigger_sql(
+            table=table.__tablename__,
+            exclusive_table=exclusive_table,
+            model=table.__name__,
+            exclusive_model=exclusive_model,
+        )
+    )
+    sqlite_trigger = DDL(
+        f'CREATE TRIGGER {name} BEFORE INSERT ON {table.__tablename__} '
+        f'WHEN EXISTS (SELECT 1 FROM {exclusive_table} WHERE id = NEW.id AND deleted_at IS NULL) '
+        f"BEGIN SELECT RAISE(ABORT, '{table.__name__} can not be created, "
+        f"because a {exclusive_model} with the same id already exists.'); END"
+    )
+    # Triggers are created once every table is, the trigger's function refers to the exclusive table.
+    event.listen(Base.metadata, 'after_create', postgres_trigger.execute_if(
+        dialect=DatabaseBackendConstants.POSTGRESQL.value,
+    ))
+    event.listen(Base.metadata, 'after_create', sqlite_trigger.execute_if(
+        dialect=DatabaseBackendConstants.SQLITE.value,
+    ))
+
+
+# DDL formats the statement with %, the function's own % are doubled.
+event.listen(
+    Base.metadata,
+    'before_create',
+    DDL(EXCLUSIVE_ROLE_FUNCTION_SQL.replace('%', '%%')).execute_if(dialect=DatabaseBackendConstants.POSTGRESQL.value),
+)
@@ -0,0 +1,48 @@
+from datetime import date
+import uuid
+
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.types import CHAR, Date, TypeDecorator, TypeEngine
+
+from common.constants.db import DatabaseBackendConstants
+
+
+class GUID(TypeDecorator):
+    """Platform-independent UUID type.
+
+    Uses postgres UUID type, stores UUID as 32 characters hex string on other dialects.
+    Values are returned as uuid.UUID objects on every dialect.
+    """
+
+    impl = CHAR
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine:
+        if dialect.name == DatabaseBackendConstants.POSTGRESQL.value:
+            return dialect.type_descriptor(UUID(as_uuid=True))
+        return dialect.type_descriptor(CHAR(32))
+
+    def process_bind_param(self, value, dialect: Dialect):
+        if value is None or dialect.name == DatabaseBackendConstants.POSTGRESQL.value:
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.hex
+
+    def process_result_value(self, value, dialect: Dialect) -> uuid.UUID | None:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(value)
+
+
+class ISODate(TypeDecorator):
+    """Date type accepting ISO 8601 formatted strings on every dialect, as postgres does."""
+
+    impl = Date
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect: Dialect) -> date | None:
+        if isinstance(value, str):
+            return date.fromisoformat(value)
+        return value
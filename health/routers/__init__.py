@@ -0,0 +1,49 @@
+from flask import Blueprint, Response, current_app, jsonify, make_response
+
+from common.constants.http import HttpStatusCodeConstants
+from common.schemas.response import ResponseBaseSchema
+from db.pool import get_pool_status
+from db.retry import retry_statistics
+from utils.schemas import get_schema
+
+health_bp = Blueprint('health', __name__, url_prefix='/health')
+
+
+@health_bp.get('/db-pool')
+def get_db_pool() -> Response:
+    """GET '/health/db-pool' endpoint view function.
+
+    Returns:
+    http response with json data: connection pool usage and checkout wait statistics.
+    """
+    STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': get_pool_status(engine=current_app.db_engine),
+            'errors': [],
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
+
+
+@health_bp.get('/db-retries')
+def get_db_retries() -> Response:
+    """GET '/health/db-retries' endpoint view function.
+
+    Returns:
+    http response with json data: statistics of the transactions retried after serialization failures and deadlocks.
+    """
+    STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': retry_statistics.as_dict(),
+            'errors': [],
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
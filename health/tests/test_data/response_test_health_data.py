@@ -0,0 +1,30 @@
+from unittest.mock import ANY
+
+# GET
+RESPONSE_GET_DB_POOL = {
+    'data': {
+        'pool_class': 'InstrumentedQueuePool',
+        'size': 5,
+        'in_use': ANY,
+        'idle': ANY,
+        'overflow': ANY,
+        'checkouts': ANY,
+        'timeouts': 0,
+        'avg_wait_ms': ANY,
+        'max_wait_ms': ANY,
+    },
+    'errors': [],
+    'status': {'code': 200}
+}
+
+RESPONSE_GET_DB_RETRIES = {
+    'data': {
+        'transactions': ANY,
+        'retries': ANY,
+        'failures': ANY,
+        'retries_by_code': ANY,
+        'total_backoff_ms': ANY,
+    },
+    'errors': [],
+    'status': {'code': 200}
+}
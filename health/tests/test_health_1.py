@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from flask import url_for
+
+from common.constants.http import HttpStatusCodeConstants
+from common.tests.generic import TestMixin
+from common.tests.test_data.users import request_test_user_data
+from health.tests.test_data import response_test_health_data
+
+
+class GetDbPoolTestCase(TestMixin, TestCase):
+    """Tests for GET '/health/db-pool' endpoint."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = url_for('health.get_db_pool')
+
+    def test_get_db_pool(self) -> None:
+        """Test GET '/health/db-pool' endpoint returns pool usage statistics."""
+        response = self.client.get(self.url)
+        response_data = response.get_json()
+        expected_result = response_test_health_data.RESPONSE_GET_DB_POOL
+        self.assertEqual(expected_result, response_data)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+
+    def test_get_db_pool_counts_checkouts(self) -> None:
+        """Test GET '/health/db-pool' endpoint counts connection checkouts made by other requests."""
+        self.client.get(url_for('users.get_users'))
+        response = self.client.get(self.url)
+        response_data = response.get_json()
+        self.assertLessEqual(1, response_data['data']['checkouts'])
+
+
+class GetDbRetriesTestCase(TestMixin, TestCase):
+    """Tests for GET '/health/db-retries' endpoint."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = url_for('health.get_db_retries')
+
+    def test_get_db_retries(self) -> None:
+        """Test GET '/health/db-retries' endpoint returns transactions retry statistics."""
+        response = self.client.get(self.url)
+        response_data = response.get_json()
+        expected_result = response_test_health_data.RESPONSE_GET_DB_RETRIES
+        self.assertEqual(expected_result, response_data)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+
+    def test_get_db_retries_counts_transactions(self) -> None:
+        """Test GET '/health/db-retries' endpoint counts write transactions made by other requests."""
+        transactions = self.client.get(self.url).get_json()['data']['transactions']
+        self.client.post(url_for('users.post_users'), json=request_test_user_data.ADD_USER_TEST_DATA)
+        response = self.client.get(self.url)
+        self.assertEqual(transactions + 1, response.get_json()['data']['transactions'])
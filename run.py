@@ -1,7 +1,10 @@
 from app import create_app
 from app.config import DevelopmentConfig
+from db.pool import engine_lifecycle
 
 app = create_app(config_name=DevelopmentConfig.CONFIG_NAME)
 
 if __name__ == "__main__":
+    # Single process server doesn't fork, warming up the pools right away.
+    engine_lifecycle.warm_up()
     app.run(host=app.config['APP_HOST'], port=app.config['APP_PORT'])
@@ -1,23 +1,32 @@
 from sqla_softdelete import SoftDeleteMixin
-from sqlalchemy import Column, Date, DateTime, ForeignKey, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Sequence, String, func
 from sqlalchemy.orm import backref, relationship
 
 from common.constants.models import StudentsModelConstants
 from db import Base
+from db.triggers import add_exclusive_role_trigger
+from db.types import GUID, ISODate
+
+# Card id numbers sequence, created by create_all on postgres only, SQLite has no sequences.
+card_id_sequence = Sequence(StudentsModelConstants.CARD_ID_SEQUENCE.value, metadata=Base.metadata)
 
 
 class Student(SoftDeleteMixin, Base):
     """A model representing a student."""
 
     __tablename__ = 'students'
+    __mapper_args__ = {'eager_defaults': True}
 
-    id = Column(UUID(as_uuid=True), ForeignKey('users.id'), primary_key=True, index=True, nullable=False)
+    id = Column(GUID(), ForeignKey('users.id'), primary_key=True, index=True, nullable=False)
     user = relationship('User', backref=backref('students', uselist=False))
     card_id = Column(String(StudentsModelConstants.CHAR_SIZE_64.value), nullable=True, unique=True)
-    student_since = Column(Date, nullable=True)
+    student_since = Column(ISODate(), nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     courses = relationship('CourseStudentAssociation', back_populates='student')
 
     def __str__(self):
         return f'Student: id={self.id}, card_id={self.card_id}, student_since={self.student_since}'
+
+
+# User registered as a teacher can't be registered as a student, the db rejects the insert.
+add_exclusive_role_trigger(table=Student, exclusive_table='teachers', exclusive_model='Teacher')
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from flask import Blueprint, Response, g, jsonify, make_response, request
+from flask import Blueprint, Response, current_app, g, jsonify, make_response, request
 
 from flask_jwt_extended import jwt_required
 
@@ -8,29 +8,40 @@ from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
 from students.schemas import StudentInputSchema, StudentOutputSchema, StudentUpdateSchema
 from students.services import StudentService
+from utils.requests import get_request_ids
+from utils.responses import bulk_status_code, stream_response
+from utils.schemas import get_schema
 
 students_bp = Blueprint('students', __name__, url_prefix='/students')
 
 
 @students_bp.get('/')
 def get_students():
-    """GET '/students' endpoint view function.
+    """GET '/students' and '/students?ids={id},{id}' endpoint view function.
 
     Returns:
     http response with json data: list of Student model objects serialized with StudentOutputSchema.
     """
-    students = StudentService(
-        session=g.db_session,
-        output_schema=StudentOutputSchema(many=True),
-    ).get_students()
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    service = StudentService.for_session(
+        session=g.db_session,
+        output_schema=get_schema(StudentOutputSchema, many=True),
+    )
+    errors = []
+    if 'ids' in request.args:
+        students, errors = service.get_students_by_ids(ids=get_request_ids())
+    elif current_app.config['LIST_STREAMING_ENABLED']:
+        students = service.stream_students(batch_size=current_app.config['LIST_STREAMING_BATCH_SIZE'])
+        return stream_response(data=students, status_code=STATUS_CODE)
+    else:
+        students = service.get_students()
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
             },
             'data': students,
-            'errors': [],
+            'errors': errors,
         }
     )
     return make_response(jsonify(response), STATUS_CODE)
@@ -43,13 +54,13 @@ def post_students() -> Response:
     Returns:
     http response with json data: newly created Student model object serialized with StudentOutputSchema.
     """
-    student = StudentService(
+    student = StudentService.for_session(
         session=g.db_session,
-        input_schema=StudentInputSchema(many=False),
-        output_schema=StudentOutputSchema(many=False),
+        input_schema=get_schema(StudentInputSchema, many=False),
+        output_schema=get_schema(StudentOutputSchema, many=False),
     ).add_student(request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_201_CREATED.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -61,6 +72,32 @@ def post_students() -> Response:
     return make_response(jsonify(response), STATUS_CODE)
 
 
+@students_bp.post('/bulk')
+def post_students_bulk() -> Response:
+    """POST '/students/bulk' endpoint view function.
+
+    Returns:
+    http response with json data: newly created Student model objects serialized with StudentOutputSchema
+    and errors of the rejected ones, both by the payload item index.
+    """
+    students, errors = StudentService.for_session(
+        session=g.db_session,
+        input_schema=get_schema(StudentInputSchema, many=False),
+        output_schema=get_schema(StudentOutputSchema, many=True),
+    ).add_students(request.get_json())
+    STATUS_CODE = bulk_status_code(data=students, errors=errors)
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': students,
+            'errors': errors,
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
+
+
 @students_bp.get('/<uuid:id>')
 def get_student(id: UUID) -> Response:
     """GET '/students/{id}' endpoint view function.
@@ -71,12 +108,12 @@ def get_student(id: UUID) -> Response:
     Returns:
     http response with json data: single Student model objects serialized with StudentOutputSchema.
     """
-    student = StudentService(
+    student = StudentService.for_session(
         session=g.db_session,
-        output_schema=StudentOutputSchema(many=False),
+        output_schema=get_schema(StudentOutputSchema, many=False),
     ).get_student_by_id(id=id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -99,7 +136,7 @@ def delete_student(id: UUID) -> Response:
     Returns:
     http response with no data and 204 status code.
     """
-    StudentService(session=g.db_session).delete_student(id=id)
+    StudentService.for_session(session=g.db_session).delete_student(id=id)
     return make_response('', HttpStatusCodeConstants.HTTP_204_NO_CONTENT.value)
 
 
@@ -114,13 +151,13 @@ def put_student(id: UUID) -> Response:
     Returns:
     http response with json data: single updated Student model objects serialized with StudentOutputSchema.
     """
-    student = StudentService(
+    student = StudentService.for_session(
         session=g.db_session,
-        input_schema=StudentUpdateSchema(many=False),
-        output_schema=StudentOutputSchema(many=False),
+        input_schema=get_schema(StudentUpdateSchema, many=False),
+        output_schema=get_schema(StudentOutputSchema, many=False),
     ).update_student(id=id, data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
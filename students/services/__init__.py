@@ -1,19 +1,19 @@
 from copy import deepcopy
-from typing import Type
+from typing import Iterator, Type
 from uuid import UUID
 import abc
 
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import scoped_session
 
 from common.abstract.services import GenericService
 from common.constants.models import StudentsModelConstants
-from students.models import Student
+from db.retry import retry_transaction
+from students.models import Student, card_id_sequence
 from students.schemas import StudentBaseSchema
 from students.services.serializers import StudentSerializer
 from students.utils.exceptions import StudentNotFoundError, TeacherExistsError
 from teachers.models import Teacher
-from utils.exceptions import parse_integrity_error
+from users.models import User
 from utils.logging import setup_logging
 
 
@@ -37,6 +37,29 @@ class AbstractStudentService(metaclass=abc.ABCMeta):
         """
         return self._get_students()
 
+    def get_students_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        """Query database with a single statement and return Student objects from the db filtered by ids.
+
+        Args:
+            ids: list of UUIDs of Student objects.
+
+        Returns:
+        tuple of lists: Student objects serialized with StudentOutputSchema in the order of ids and not found errors
+        of the missing ones.
+        """
+        return self._get_students_by_ids(ids)
+
+    def stream_students(self, batch_size: int) -> Iterator[list[dict]]:
+        """Query database with server-side cursor and return Student objects in batches.
+
+        Args:
+            batch_size: number of Student objects read from the db and serialized at once.
+
+        Returns:
+        Iterator of Student objects batches serialized with StudentOutputSchema.
+        """
+        return self._stream_students(batch_size)
+
     def add_student(self, data: dict) -> dict:
         """Getting student dict payload and saving it in the Student table.
 
@@ -48,6 +71,18 @@ class AbstractStudentService(metaclass=abc.ABCMeta):
         """
         return self._add_student(data)
 
+    def add_students(self, data: list[dict]) -> tuple[list[dict], list[dict]]:
+        """Getting list of student dict payloads and saving them in the Student table with a single statement.
+
+        Args:
+            data: list of dicts from flask request json payload.
+
+        Returns:
+        tuple of lists: created Student objects serialized with StudentOutputSchema and errors of the rejected ones,
+        both by the item index.
+        """
+        return self._add_students(data)
+
     def get_student_by_id(self, id: UUID) -> dict:
         """Query database and return single Student objects from the db filtered by id.
 
@@ -86,10 +121,22 @@ class AbstractStudentService(metaclass=abc.ABCMeta):
     def _get_students(self) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _stream_students(self, batch_size: int) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _get_students_by_ids(self, ids: list[UUID]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _add_student(self, data: dict) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _add_students(self, data: list[dict]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _get_student_by_id(self, id: UUID) -> None:
         pass
@@ -109,117 +156,95 @@ class StudentService(AbstractStudentService, GenericService):
     def _get_students(self) -> list[dict]:
         self._log.debug('Getting all students from the db.')
         students = self.session.query(Student).all()
+        self._release_connection()
         return self.validator.serialize(students)
 
+    def _get_students_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        students, errors = self._get_objects_by_ids(table=Student, ids=ids)
+        self._release_connection()
+        return self.validator.serialize(students), errors
+
+    def _stream_students(self, batch_size: int) -> Iterator[list[dict]]:
+        self._log.debug('Streaming all students from the db.')
+        students = self.session.query(Student).yield_per(batch_size)
+        return self.validator.serialize_stream(data=students, batch_size=batch_size)
+
     def _add_student(self, data: dict) -> dict:
         student = self.validator.deserialize(data=data)
         db_student = self._save_student_data(data=student)
+        self._release_connection()
         return self.validator.serialize(data=db_student)
 
+    @retry_transaction
+    def _add_students(self, data: list[dict]) -> tuple[list[dict], list[dict]]:
+        return self._add_registrations(
+            table=Student,
+            parent_table=User,
+            exclusive_table=Teacher,
+            card_id_prefix=StudentsModelConstants.CARD_ID_PREFIX.value,
+            card_id_sequence=card_id_sequence,
+            items=data,
+        )
+
+    @retry_transaction
     def _save_student_data(self, data: dict) -> Student:
         """Saves and return Student data in the db.
 
         Args:
             data: dict of serialized student data.
+        Raises:
+        TeacherExistsError if the user is registered as a teacher.
 
         Returns:
         Student model object saved in the db.
         """
         student = deepcopy(data)
-        # check if teacher with id exists.
-        self._is_teacher_exists(column='id', value=student['id'])
-        # Generating student card_id, if exception occurs during the saving process, rollback session and try again.
-        while True:
-            try:
-                student['card_id'] = self._create_student_card_id()
-                db_student = Student(**student)
-                self.session.add(db_student)
-                self.session.commit()
-                self._log.debug(f'Created student with card_id: {student["card_id"]}')
-                break
-            except IntegrityError as err:
-                table_name, field, value = parse_integrity_error(error=err)
-                self._log.debug(
-                    f'Error during saving {table_name} with {field}: {value} and card_id: {student["card_id"]}'
-                )
-                if field not in ['card_id']:
-                    raise err
-                self.session.rollback()
-        self.session.refresh(db_student)
+        student['card_id'] = self._create_student_card_id()
+        db_student = Student(**student)
+        self.session.add(db_student)
+        self._commit_registration(
+            table=Student, exclusive_table=Teacher, id=student['id'], exists_error=TeacherExistsError,
+        )
+        self._log.debug(f'Created student with card_id: {student["card_id"]}')
         return db_student
 
-    def _is_teacher_exists(self, column: str, value: str) -> None:
-        """Checks if Teacher from the request json data exists in the db.
-
-        Args:
-            column: name of table column to look up.
-            value: to find in the table.
-        Raises:
-        TeacherExistsError if Teacher obj with id exists.
-
-        Returns:
-        Nothing.
-        """
-        if self._check_obj_exists(table=Teacher, column=column, value=value):
-            raise TeacherExistsError(
-                f'Student with {column}: {value} can not be created, '
-                f'because a Teacher with {column}: {value} already exists.'
-            )
-
     def _create_student_card_id(self) -> str:
         """Create student card_id number.
 
         Returns:
-        properly formatted teacher card_id.
+        properly formatted student card_id.
         """
-        db_card_id = self._get_last_column_object(table=Student, column='card_id')
-        if db_card_id:
-            card_id = self._create_card_id(card_id=db_card_id)
-        else:
-            card_id = self._create_card_id(card_id=StudentsModelConstants.CARD_ID_DEFAULT_NUMBER.value)
-        return card_id
+        return self._create_card_id(
+            prefix=StudentsModelConstants.CARD_ID_PREFIX.value,
+            sequence=card_id_sequence,
+            table=Student,
+        )
 
     def _get_student_by_id(self, id: UUID) -> dict:
         student = self._get_student(column='id', value=id)
+        self._release_connection()
         return self.validator.serialize(data=student)
 
     def _get_student(self, column: str, value: UUID | str) -> Student:
-        if self._student_exists(column=column, value=value):
-            self._log.debug(f'Getting Student with {column}: {value}.')
-            return self.session.query(Student).filter(Student.__table__.columns[column] == value).one()
-
-    def _student_exists(self, column: str, value: str) -> bool:
-        """Check if Student object exists in the db.
-
-        Args:
-            column: name of column in the Student model.
-            value: to find in the Student model.
-        Raises:
-        StudentNotFoundError exception if object not present in Student model.
-
-        Returns:
-        bool of Student object existence.
-        """
-        self._log.debug(f'Checking if Student with {column}: {value} exists.')
-        q = self.session.query(Student).filter(Student.__table__.columns[column] == value)
-        obj_exists = self.session.query(q.exists()).scalar()
-        if not obj_exists:
-            raise StudentNotFoundError(f'Student with {column}: {value} not found.')
-        return True
+        return self._get_object(table=Student, column=column, value=value, not_found_error=StudentNotFoundError)
 
+    @retry_transaction
     def _delete_student(self, id: UUID) -> None:
-        if self._student_exists(column='id', value=id):
-            student = self.session.query(Student).filter(Student.id == id).one()
-            # Soft deleting Student object.
-            student.delete()
-            self.session.commit()
-            self._log.debug(f'Student with id: {id} deleted.')
+        self._delete_object(table=Student, id=id, not_found_error=StudentNotFoundError)
+        self.session.commit()
+        self._log.debug(f'Student with id: {id} deleted.')
 
+    @retry_transaction
     def _update_student(self, id: UUID, data: dict) -> dict:
         student = self.validator.deserialize(data=data)
-        db_student = self._get_student(column='id', value=id)
-        db_student.student_since = student['student_since']
+        db_student = self._update_object(
+            table=Student,
+            column='id',
+            value=id,
+            values={'student_since': student['student_since']},
+            not_found_error=StudentNotFoundError,
+        )
         self.session.commit()
-        self.session.refresh(db_student)
         self._log.debug(f'Student with id: {id} updated.')
+        self._release_connection()
         return self.validator.serialize(data=db_student)
@@ -1,7 +1,10 @@
+from copy import deepcopy
 from unittest import TestCase
+from uuid import uuid4
 
 from flask import url_for
 
+from common.constants.db import QueryStatisticsConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.tests.generic import TestMixin
 from common.tests.test_data.students import request_test_student_data
@@ -36,6 +39,14 @@ class GetStudentsTestCase(TestMixin, TestCase):
         self.assertEqual(1, self.db_session.query(Student).count())
 
 
+class GetStudentsStreamingTestCase(GetStudentsTestCase):
+    """Tests for GET '/students' endpoint with list streaming enabled."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['LIST_STREAMING_ENABLED'] = True
+
+
 class GetStudentTestCase(TestMixin, TestCase):
     """Tests for GET '/students/{id}' endpoint."""
 
@@ -47,6 +58,7 @@ class GetStudentTestCase(TestMixin, TestCase):
         expected_result = response_test_student_data.RESPONSE_STUDENT_NOT_FOUND
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(0, self.db_session.query(Student).count())
 
     def test_get_student_test_data_in_db(self) -> None:
@@ -58,9 +70,41 @@ class GetStudentTestCase(TestMixin, TestCase):
         expected_result = response_test_student_data.RESPONSE_GET_STUDENT
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(1, self.db_session.query(Student).count())
 
 
+class GetStudentsByIdsTestCase(TestMixin, TestCase):
+    """Tests for GET '/students?ids={id},{id}' endpoint."""
+
+    def test_get_students_by_ids_in_requested_order(self) -> None:
+        """Test GET '/students?ids={id},{id}' endpoint returns students in the ids order and missing ids."""
+        db_student = self.add_student_to_db()
+        random_db_student = self.add_random_student_to_db()
+        missing_id = str(uuid4())
+        url = url_for('students.get_students', ids=f'{random_db_student.id},{missing_id},{db_student.id}')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertEqual(
+            [str(random_db_student.id), str(db_student.id)],
+            [student['id'] for student in response_data['data']],
+        )
+        self.assertEqual(
+            [{'id': missing_id, 'message': f'Student with id: {missing_id} not found.'}],
+            response_data['errors'],
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+
+    def test_get_students_by_ids_invalid_ids(self) -> None:
+        """Test GET '/students?ids={id}' endpoint with invalid UUID in the ids."""
+        url = url_for('students.get_students', ids='not-a-uuid')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertIn('ids', response_data['errors']['message'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+
+
 class PostStudentsTestCase(TestMixin, TestCase):
     """Tests for POST '/students' endpoint."""
 
@@ -78,6 +122,10 @@ class PostStudentsTestCase(TestMixin, TestCase):
         expected_result = response_test_student_data.RESPONSE_POST_STUDENT
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=2),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Student).count())
 
     def test_post_students_invalid_json_payload(self) -> None:
@@ -96,12 +144,12 @@ class PostStudentsTestCase(TestMixin, TestCase):
         payload_data['id'] = db_teacher.id
         response = self.client.post(self.url, json=payload_data)
         response_data = response.get_json()
-        response_test_student_data.RESPONSE_USER_ALREADY_TEACHER['errors']['message'] = (
-            response_test_student_data.RESPONSE_USER_ALREADY_TEACHER['errors']['message'].format(
+        expected_result = deepcopy(response_test_student_data.RESPONSE_USER_ALREADY_TEACHER)
+        expected_result['errors']['message'] = (
+            expected_result['errors']['message'].format(
                 first_id=db_teacher.id, second_id=db_teacher.id,
             )
         )
-        expected_result = response_test_student_data.RESPONSE_USER_ALREADY_TEACHER
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
         self.assertEqual(0, self.db_session.query(Student).count())
@@ -119,6 +167,10 @@ class PutStudentTestCase(TestMixin, TestCase):
         expected_result = response_test_student_data.RESPONSE_STUDENT_UPDATE_TEST_DATA
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=1),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Student).count())
 
     def test_put_student_updating_other_student_data(self) -> None:
@@ -160,3 +212,79 @@ class DeleteStudentTestCase(TestMixin, TestCase):
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
         self.assertEqual(2, self.db_session.query(Student).count())
+
+
+class PostStudentsBulkTestCase(TestMixin, TestCase):
+    """Tests for POST '/students/bulk' endpoint."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = url_for('students.post_students_bulk')
+        # Other tests set the id of the shared test data.
+        self.item = deepcopy(request_test_student_data.ADD_STUDENT_TEST_DATA)
+        self.item.pop('id', None)
+
+    def test_post_students_bulk_valid_payload(self) -> None:
+        """Test POST '/students/bulk' endpoint with valid payload, ids are checked, card_ids reserved and students
+        inserted with three statements.
+        """
+        db_users = [self.add_random_user_to_db() for _ in range(3)]
+        payload_data = [{**self.item, 'id': str(db_user.id)} for db_user in db_users]
+        response = self.client.post(self.url, json=payload_data)
+        response_data = response.get_json()
+        expected_result = [
+            {'index': index, 'data': {**item, 'card_id': f'STU-000000{index + 1}'}}
+            for index, item in enumerate(payload_data)
+        ]
+        self.assertEqual(expected_result, response_data['data'])
+        self.assertEqual([], response_data['errors'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual('3', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+        self.assertEqual(3, self.db_session.query(Student).count())
+
+    def test_post_students_bulk_partially_valid_payload(self) -> None:
+        """Test POST '/students/bulk' endpoint with invalid, unknown, duplicated and teacher ids, one is created."""
+        db_user = self.add_random_user_to_db()
+        db_teacher = self.add_random_teacher_to_db()
+        payload_data = [
+            {**self.item, 'id': str(db_user.id)},
+            self.item,
+            {**self.item, 'id': str(db_teacher.id)},
+            {**self.item, 'id': request_test_student_data.DUMMY_STUDENT_UUID},
+            {**self.item, 'id': str(db_user.id)},
+        ]
+        response = self.client.post(self.url, json=payload_data)
+        response_data = response.get_json()
+        expected_errors = [
+            {'index': 1, 'message': {'id': ['Missing data for required field.']}},
+            {
+                'index': 2,
+                'message': (
+                    f'Student with id: {db_teacher.id} can not be created, '
+                    f'because a Teacher with id: {db_teacher.id} already exists.'
+                ),
+            },
+            {
+                'index': 3,
+                'message': (
+                    f'Foreign key violation id: {request_test_student_data.DUMMY_STUDENT_UUID} '
+                    'is not present in table.'
+                ),
+            },
+            {'index': 4, 'message': f'Student with id: {db_user.id} already exists.'},
+        ]
+        self.assertEqual([0], [item['index'] for item in response_data['data']])
+        self.assertEqual(expected_errors, response_data['errors'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_207_MULTI_STATUS.value, response.status_code)
+        self.assertEqual(1, self.db_session.query(Student).count())
+
+    def test_post_students_bulk_student_already_registered(self) -> None:
+        """Test POST '/students/bulk' endpoint with ids of the students already in the db."""
+        db_student = self.add_student_to_db()
+        payload_data = [{**self.item, 'id': str(db_student.id)}]
+        response = self.client.post(self.url, json=payload_data)
+        response_data = response.get_json()
+        expected_errors = [{'index': 0, 'message': f'Student with id: {db_student.id} already exists.'}]
+        self.assertEqual(expected_errors, response_data['errors'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(1, self.db_session.query(Student).count())
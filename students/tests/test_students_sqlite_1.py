@@ -0,0 +1,50 @@
+from app.config import TestingSqliteConfig
+from students.tests import test_students_1
+
+
+class GetStudentsSqliteTestCase(test_students_1.GetStudentsTestCase):
+    """Tests for GET '/students' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetStudentsStreamingSqliteTestCase(test_students_1.GetStudentsStreamingTestCase):
+    """Tests for GET '/students' endpoint with list streaming enabled on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetStudentSqliteTestCase(test_students_1.GetStudentTestCase):
+    """Tests for GET '/students/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostStudentsSqliteTestCase(test_students_1.PostStudentsTestCase):
+    """Tests for POST '/students' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PutStudentSqliteTestCase(test_students_1.PutStudentTestCase):
+    """Tests for PUT '/students/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteStudentSqliteTestCase(test_students_1.DeleteStudentTestCase):
+    """Tests for DELETE '/students/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostStudentsBulkSqliteTestCase(test_students_1.PostStudentsBulkTestCase):
+    """Tests for POST '/students/bulk' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetStudentsByIdsSqliteTestCase(test_students_1.GetStudentsByIdsTestCase):
+    """Tests for GET '/students?ids={id},{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
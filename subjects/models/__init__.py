@@ -2,11 +2,11 @@ import uuid
 
 from sqla_softdelete import SoftDeleteMixin
 from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import backref, relationship
 
 from common.constants.models import CourseModelConstants
 from db import Base
+from db.types import GUID
 
 
 class Subject(SoftDeleteMixin, Base):
@@ -16,8 +16,9 @@ class Subject(SoftDeleteMixin, Base):
     __table_args__ = (
         UniqueConstraint('title', 'code', name='_title_code_uc'),
     )
+    __mapper_args__ = {'eager_defaults': True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
 
     title = Column(String(CourseModelConstants.CHAR_SIZE_256.value), nullable=False)
     code = Column(String(CourseModelConstants.CHAR_SIZE_16.value), nullable=False)
@@ -26,7 +27,7 @@ class Subject(SoftDeleteMixin, Base):
 
     created_at = Column(DateTime, server_default=func.now())
 
-    teacher_id = Column(UUID(as_uuid=True), ForeignKey('teachers.id'), nullable=False)
+    teacher_id = Column(GUID(), ForeignKey('teachers.id'), nullable=False)
     teacher = relationship('Teacher', back_populates='subjects')
 
     def __repr__(self):
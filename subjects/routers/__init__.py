@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from flask import Blueprint, Response, g, jsonify, make_response, request
+from flask import Blueprint, Response, current_app, g, jsonify, make_response, request
 
 from flask_jwt_extended import jwt_required
 
@@ -8,29 +8,40 @@ from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
 from subjects.schemas import SubjectInputSchema, SubjectOutputSchema, SubjectUpdateSchema
 from subjects.services import SubjectService
+from utils.requests import get_request_ids
+from utils.responses import stream_response
+from utils.schemas import get_schema
 
 subjects_bp = Blueprint('subjects', __name__, url_prefix='/subjects')
 
 
 @subjects_bp.get('/')
 def get_subjects() -> Response:
-    """GET '/subjects' endpoint view function.
+    """GET '/subjects' and '/subjects?ids={id},{id}' endpoint view function.
 
     Returns:
     http response with json data: list of Subject model objects serialized with SubjectOutputSchema.
     """
-    subjects = SubjectService(
-        session=g.db_session,
-        output_schema=SubjectOutputSchema(many=True),
-    ).get_subjects()
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    service = SubjectService.for_session(
+        session=g.db_session,
+        output_schema=get_schema(SubjectOutputSchema, many=True),
+    )
+    errors = []
+    if 'ids' in request.args:
+        subjects, errors = service.get_subjects_by_ids(ids=get_request_ids())
+    elif current_app.config['LIST_STREAMING_ENABLED']:
+        subjects = service.stream_subjects(batch_size=current_app.config['LIST_STREAMING_BATCH_SIZE'])
+        return stream_response(data=subjects, status_code=STATUS_CODE)
+    else:
+        subjects = service.get_subjects()
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
             },
             'data': subjects,
-            'errors': [],
+            'errors': errors,
         }
     )
     return make_response(jsonify(response), STATUS_CODE)
@@ -43,13 +54,13 @@ def post_subject() -> Response:
     Returns:
     http response with json data: newly created Subject model object serialized with SubjectOutputSchema.
     """
-    subject = SubjectService(
+    subject = SubjectService.for_session(
         session=g.db_session,
-        input_schema=SubjectInputSchema(many=False),
-        output_schema=SubjectOutputSchema(many=False),
+        input_schema=get_schema(SubjectInputSchema, many=False),
+        output_schema=get_schema(SubjectOutputSchema, many=False),
     ).add_subject(data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_201_CREATED.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -71,12 +82,12 @@ def get_subject(id: UUID) -> Response:
     Returns:
     http response with json data: single Subject model objects serialized with SubjectOutputSchema.
     """
-    subject = SubjectService(
+    subject = SubjectService.for_session(
         session=g.db_session,
-        output_schema=SubjectOutputSchema(many=False),
+        output_schema=get_schema(SubjectOutputSchema, many=False),
     ).get_subject_by_id(id=id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -99,13 +110,13 @@ def put_subject(id: UUID) -> Response:
     Returns:
     http response with json data: single updated Subject model object serialized with SubjectOutputSchema.
     """
-    subject = SubjectService(
+    subject = SubjectService.for_session(
         session=g.db_session,
-        input_schema=SubjectUpdateSchema(many=False),
-        output_schema=SubjectOutputSchema(many=False),
+        input_schema=get_schema(SubjectUpdateSchema, many=False),
+        output_schema=get_schema(SubjectOutputSchema, many=False),
     ).update_subject(id=id, data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -128,5 +139,27 @@ def delete_subject(id: UUID) -> Response:
     Returns:
     http response with no data and 204 status code.
     """
-    SubjectService(session=g.db_session).delete_subject(id=id)
+    SubjectService.for_session(session=g.db_session).delete_subject(id=id)
     return make_response('', HttpStatusCodeConstants.HTTP_204_NO_CONTENT.value)
+
+
+@subjects_bp.delete('/')
+@jwt_required()
+def delete_subjects() -> Response:
+    """DELETE '/subjects?ids={id},{id}' endpoint view function.
+
+    Returns:
+    http response with json data: ids of deleted and missing Subject objects.
+    """
+    result = SubjectService.for_session(session=g.db_session).delete_subjects(ids=get_request_ids())
+    STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': result,
+            'errors': [],
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
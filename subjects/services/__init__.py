@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Type
+from typing import Iterator, Type
 from uuid import UUID
 import abc
 
@@ -7,6 +7,7 @@ from sqlalchemy.orm import scoped_session
 
 from common.abstract.services import GenericService
 from courses.schemas import CourseBaseSchema
+from db.retry import retry_transaction
 from subjects.models import Subject
 from subjects.services.serializers import SubjectSerializer
 from subjects.utils.exceptions import SubjectNotFoundError
@@ -33,6 +34,29 @@ class AbstractSubjectService(metaclass=abc.ABCMeta):
         """
         return self._get_subjects()
 
+    def get_subjects_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        """Query database with a single statement and return Subject objects from the db filtered by ids.
+
+        Args:
+            ids: list of UUIDs of Subject objects.
+
+        Returns:
+        tuple of lists: Subject objects serialized with SubjectOutputSchema in the order of ids and not found errors
+        of the missing ones.
+        """
+        return self._get_subjects_by_ids(ids)
+
+    def stream_subjects(self, batch_size: int) -> Iterator[list[dict]]:
+        """Query database with server-side cursor and return Subject objects in batches.
+
+        Args:
+            batch_size: number of Subject objects read from the db and serialized at once.
+
+        Returns:
+        Iterator of Subject objects batches serialized with SubjectOutputSchema.
+        """
+        return self._stream_subjects(batch_size)
+
     def add_subject(self, data: dict) -> dict:
         """Getting subject dict payload and saving it in the Subject table.
 
@@ -78,10 +102,29 @@ class AbstractSubjectService(metaclass=abc.ABCMeta):
         """
         return self._delete_subject(id)
 
+    def delete_subjects(self, ids: list[UUID]) -> dict:
+        """Delete Subject objects from the database with a single statement.
+
+        Args:
+            ids: list of UUIDs of Subject objects.
+
+        Returns:
+        dict with lists of deleted ids and of missing ids, already deleted objects are missing.
+        """
+        return self._delete_subjects(ids)
+
     @abc.abstractclassmethod
     def _get_subjects(self) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _stream_subjects(self, batch_size: int) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _get_subjects_by_ids(self, ids: list[UUID]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _add_subject(self) -> None:
         pass
@@ -98,6 +141,10 @@ class AbstractSubjectService(metaclass=abc.ABCMeta):
     def _delete_subject(self, id: UUID) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _delete_subjects(self, ids: list[UUID]) -> None:
+        pass
+
 
 class SubjectService(AbstractSubjectService, GenericService):
     """Provides CRUD operations and related data transformations for Subject model."""
@@ -105,13 +152,26 @@ class SubjectService(AbstractSubjectService, GenericService):
     def _get_subjects(self) -> list[dict]:
         self._log.debug('Getting all subjects from the db.')
         subjects = self.session.query(Subject).all()
+        self._release_connection()
         return self.validator.serialize(subjects)
 
+    def _get_subjects_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        subjects, errors = self._get_objects_by_ids(table=Subject, ids=ids)
+        self._release_connection()
+        return self.validator.serialize(subjects), errors
+
+    def _stream_subjects(self, batch_size: int) -> Iterator[list[dict]]:
+        self._log.debug('Streaming all subjects from the db.')
+        subjects = self.session.query(Subject).yield_per(batch_size)
+        return self.validator.serialize_stream(data=subjects, batch_size=batch_size)
+
     def _add_subject(self, data: dict) -> dict:
         subject = self.validator.deserialize(data=data)
         db_subject = self._save_subject_data(data=subject)
+        self._release_connection()
         return self.validator.serialize(data=db_subject)
 
+    @retry_transaction
     def _save_subject_data(self, data: dict) -> Subject:
         """Saves subject data in the Subject model.
 
@@ -126,51 +186,40 @@ class SubjectService(AbstractSubjectService, GenericService):
         self._log.debug(f'Creating subject with title: {subject["title"]}')
         self.session.add(db_subject)
         self.session.commit()
-        self.session.refresh(db_subject)
         return db_subject
 
     def _get_subject_by_id(self, id: UUID) -> dict:
         subject = self._get_subject(column='id', value=id)
+        self._release_connection()
         return self.validator.serialize(data=subject)
 
     def _get_subject(self, column: str, value: UUID | str) -> Subject:
-        if self._subject_exists(column=column, value=value):
-            self._log.debug(f'Getting Subject with {column}: {value}.')
-            return self.session.query(Subject).filter(Subject.__table__.columns[column] == value).one()
-
-    def _subject_exists(self, column: str, value: str) -> bool:
-        """Check if Subject object exists in the db.
-
-        Args:
-            column: name of column in the Subject model.
-            value: to find in the Subject model.
-        Raises:
-        SubjectNotFoundError exception if object not present in Subject model.
-
-        Returns:
-        bool of Subject object existence.
-        """
-        self._log.debug(f'Checking if Subject with {column}: {value} exists.')
-        q = self.session.query(Subject).filter(Subject.__table__.columns[column] == value)
-        obj_exists = self.session.query(q.exists()).scalar()
-        if not obj_exists:
-            raise SubjectNotFoundError(f'Subject with {column}: {value} not found.')
-        return True
+        return self._get_object(table=Subject, column=column, value=value, not_found_error=SubjectNotFoundError)
 
+    @retry_transaction
     def _update_subject(self, id: UUID, data: dict) -> dict:
         subject = self.validator.deserialize(data=data)
-        db_subject = self._get_subject(column='id', value=id)
-        db_subject.title = subject['title']
-        db_subject.code = subject['code']
+        db_subject = self._update_object(
+            table=Subject,
+            column='id',
+            value=id,
+            values={'title': subject['title'], 'code': subject['code']},
+            not_found_error=SubjectNotFoundError,
+        )
         self.session.commit()
-        self.session.refresh(db_subject)
         self._log.debug(f'Subject with id: {id} updated.')
+        self._release_connection()
         return self.validator.serialize(data=db_subject)
 
+    @retry_transaction
     def _delete_subject(self, id: UUID) -> None:
-        if self._subject_exists(column='id', value=id):
-            subject = self.session.query(Subject).filter(Subject.id == id).one()
-            # Soft deleting Course object.
-            subject.delete()
-            self.session.commit()
-            self._log.debug(f'Subject with id: {id} deleted.')
+        self._delete_object(table=Subject, id=id, not_found_error=SubjectNotFoundError)
+        self.session.commit()
+        self._log.debug(f'Subject with id: {id} deleted.')
+
+    @retry_transaction
+    def _delete_subjects(self, ids: list[UUID]) -> dict:
+        deleted_ids = self._delete_objects(table=Subject, ids=ids)
+        self.session.commit()
+        self._log.debug(f'{len(deleted_ids)} Subject objects deleted.')
+        return {'deleted': deleted_ids, 'missing': self._missing_ids(ids=ids, found_ids=deleted_ids)}
@@ -1,7 +1,9 @@
 from unittest import TestCase
+from uuid import uuid4
 
 from flask import url_for
 
+from common.constants.db import QueryStatisticsConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.tests.generic import TestMixin
 from common.tests.test_data.subjects import request_test_subject_data
@@ -36,6 +38,14 @@ class GetSubjectsTestCase(TestMixin, TestCase):
         self.assertEqual(1, self.db_session.query(Subject).count())
 
 
+class GetSubjectsStreamingTestCase(GetSubjectsTestCase):
+    """Tests for GET '/subjects' endpoint with list streaming enabled."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['LIST_STREAMING_ENABLED'] = True
+
+
 class GetSubjectTestCase(TestMixin, TestCase):
     """Tests for GET '/subjects/{id}' endpoint."""
 
@@ -47,6 +57,7 @@ class GetSubjectTestCase(TestMixin, TestCase):
         expected_result = response_test_subject_data.RESPONSE_SUBJECT_NOT_FOUND
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(0, self.db_session.query(Subject).count())
 
     def test_get_subject_test_data_in_db(self) -> None:
@@ -58,9 +69,41 @@ class GetSubjectTestCase(TestMixin, TestCase):
         expected_result = response_test_subject_data.RESPONSE_GET_SUBJECT
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(1, self.db_session.query(Subject).count())
 
 
+class GetSubjectsByIdsTestCase(TestMixin, TestCase):
+    """Tests for GET '/subjects?ids={id},{id}' endpoint."""
+
+    def test_get_subjects_by_ids_in_requested_order(self) -> None:
+        """Test GET '/subjects?ids={id},{id}' endpoint returns subjects in the ids order and missing ids."""
+        db_subject = self.add_subject_to_db()
+        random_db_subject = self.add_random_subject_to_db()
+        missing_id = str(uuid4())
+        url = url_for('subjects.get_subjects', ids=f'{random_db_subject.id},{missing_id},{db_subject.id}')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertEqual(
+            [str(random_db_subject.id), str(db_subject.id)],
+            [subject['id'] for subject in response_data['data']],
+        )
+        self.assertEqual(
+            [{'id': missing_id, 'message': f'Subject with id: {missing_id} not found.'}],
+            response_data['errors'],
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+
+    def test_get_subjects_by_ids_invalid_ids(self) -> None:
+        """Test GET '/subjects?ids={id}' endpoint with invalid UUID in the ids."""
+        url = url_for('subjects.get_subjects', ids='not-a-uuid')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertIn('ids', response_data['errors']['message'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+
+
 class PostSubjectsTestCase(TestMixin, TestCase):
     """Tests for POST '/subjects' endpoint."""
 
@@ -78,6 +121,10 @@ class PostSubjectsTestCase(TestMixin, TestCase):
         expected_result = response_test_subject_data.RESPONSE_POST_SUBJECT
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=1),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Subject).count())
 
     def test_post_subjects_invalid_json_payload(self) -> None:
@@ -102,6 +149,10 @@ class PutSubjectTestCase(TestMixin, TestCase):
         expected_result = response_test_subject_data.RESPONSE_SUBJECT_UPDATE_TEST_DATA
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=2),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Subject).count())
 
     def test_put_subject_updating_other_subject_data(self) -> None:
@@ -143,3 +194,48 @@ class DeleteSubjectTestCase(TestMixin, TestCase):
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
         self.assertEqual(2, self.db_session.query(Subject).count())
+
+
+class DeleteSubjectsBulkTestCase(TestMixin, TestCase):
+    """Tests for DELETE '/subjects?ids={id},{id}' endpoint."""
+
+    def test_delete_subjects_bulk_teacher_deleting_own_subjects(self) -> None:
+        """Test DELETE '/subjects?ids={id},{id}' endpoint, teacher deleting own subjects and a missing one."""
+        db_subject = self.add_subject_to_db()
+        other_db_subject = self._add_subject_to_db(
+            data={'title': f'test_title_{uuid4()}', 'code': 'BIO_1000', 'teacher_id': db_subject.teacher_id},
+        )
+        missing_id = uuid4()
+        url = url_for('subjects.delete_subjects', ids=f'{other_db_subject.id},{missing_id},{db_subject.id}')
+        response = self.client.delete(url)
+        response_data = response.get_json()
+        expected_result = {'deleted': [str(other_db_subject.id), str(db_subject.id)], 'missing': [str(missing_id)]}
+        self.assertEqual(expected_result, response_data['data'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=2),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
+        self.assertEqual(0, self.db_session.query(Subject).count())
+
+    def test_delete_subjects_bulk_deleting_other_subject_data(self) -> None:
+        """Test DELETE '/subjects?ids={id},{id}' endpoint with other's subject id in the ids."""
+        db_subject = self.add_subject_to_db()
+        random_db_subject = self.add_random_subject_to_db()
+        url = url_for('subjects.delete_subjects', ids=f'{db_subject.id},{random_db_subject.id}')
+        response = self.client.delete(url)
+        response_data = response.get_json()
+        expected_result = response_test_subject_data.RESPONSE_SUBJECT_UNAUTHORIZED_DELETE
+        self.assertEqual(expected_result, response_data)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(2, self.db_session.query(Subject).count())
+
+    def test_delete_subjects_bulk_without_ids(self) -> None:
+        """Test DELETE '/subjects' endpoint without the ids query string."""
+        self.add_subject_to_db()
+        url = url_for('subjects.delete_subjects')
+        response = self.client.delete(url)
+        response_data = response.get_json()
+        self.assertIn('ids', response_data['errors']['message'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(1, self.db_session.query(Subject).count())
@@ -0,0 +1,50 @@
+from app.config import TestingSqliteConfig
+from subjects.tests import test_subjects_1
+
+
+class GetSubjectsSqliteTestCase(test_subjects_1.GetSubjectsTestCase):
+    """Tests for GET '/subjects' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetSubjectsStreamingSqliteTestCase(test_subjects_1.GetSubjectsStreamingTestCase):
+    """Tests for GET '/subjects' endpoint with list streaming enabled on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetSubjectSqliteTestCase(test_subjects_1.GetSubjectTestCase):
+    """Tests for GET '/subjects/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostSubjectsSqliteTestCase(test_subjects_1.PostSubjectsTestCase):
+    """Tests for POST '/subjects' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PutSubjectSqliteTestCase(test_subjects_1.PutSubjectTestCase):
+    """Tests for PUT '/subjects/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteSubjectSqliteTestCase(test_subjects_1.DeleteSubjectTestCase):
+    """Tests for DELETE '/subjects/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteSubjectsBulkSqliteTestCase(test_subjects_1.DeleteSubjectsBulkTestCase):
+    """Tests for DELETE '/subjects?ids={id},{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetSubjectsByIdsSqliteTestCase(test_subjects_1.GetSubjectsByIdsTestCase):
+    """Tests for GET '/subjects?ids={id},{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
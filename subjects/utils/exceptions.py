@@ -2,6 +2,7 @@ from flask import Response, jsonify, make_response
 
 from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
+from utils.schemas import get_schema
 
 
 class SubjectNotFoundError(Exception):
@@ -18,7 +19,7 @@ def subject_not_found_error_handler(error: SubjectNotFoundError) -> Response:
     http Response with formatted error message.
     """
     STATUS_CODE = HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -1,19 +1,25 @@
 from flask import g, request
 
+from subjects.models import Subject
 from subjects.services import SubjectService
+from utils.requests import get_request_ids
 
 
 def subject_token_verifier(jwt_header: dict, jwt_payload: dict) -> bool:
-    """Checks if Subject.course.teacher_id from JWT matches the id from jwt_payload.
+    """Checks if Subject.teacher_id of the request's subjects matches the id from jwt_payload.
+
+    Subjects of the bulk request are looked up with a single query, missing subjects are left to the view.
 
     Args:
         jwt_header: JWT headers dict.
         jwt_payload: JWT decoded payload dict.
 
     Returns:
-    bool of comparison Subject.course.teacher_id and decoded jwt data.
+    bool of comparison Subject.teacher_id and decoded jwt data.
     """
-    subject = SubjectService(session=g.db_session)._get_subject(column='id', value=str(request.view_args['id']))
-    if jwt_payload['sub'] == str(subject.teacher_id):
-        return True
-    return False
+    service = SubjectService.for_session(session=g.db_session)
+    if 'id' in request.view_args:
+        subjects = [service._get_subject(column='id', value=str(request.view_args['id']))]
+    else:
+        subjects = service._get_objects(table=Subject, column='id', values=get_request_ids())
+    return all(jwt_payload['sub'] == str(subject.teacher_id) for subject in subjects)
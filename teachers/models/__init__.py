@@ -1,25 +1,34 @@
 from sqla_softdelete import SoftDeleteMixin
-from sqlalchemy import Column, Date, DateTime, ForeignKey, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Sequence, String, func
 from sqlalchemy.orm import backref, relationship
 
 from common.constants.models import TeacherModelConstants
 from db import Base
+from db.triggers import add_exclusive_role_trigger
+from db.types import GUID, ISODate
+
+# Card id numbers sequence, created by create_all on postgres only, SQLite has no sequences.
+card_id_sequence = Sequence(TeacherModelConstants.CARD_ID_SEQUENCE.value, metadata=Base.metadata)
 
 
 class Teacher(SoftDeleteMixin, Base):
     """A model representing a teacher."""
 
     __tablename__ = 'teachers'
+    __mapper_args__ = {'eager_defaults': True}
 
-    id = Column(UUID(as_uuid=True), ForeignKey('users.id'), primary_key=True, index=True, nullable=False)
+    id = Column(GUID(), ForeignKey('users.id'), primary_key=True, index=True, nullable=False)
     user = relationship('User', backref=backref('teachers', uselist=False))
     card_id = Column(String(TeacherModelConstants.CHAR_SIZE_64.value), nullable=True, unique=True)
     qualification = Column(String(TeacherModelConstants.CHAR_SIZE_256.value), nullable=False)
-    working_since = Column(Date, nullable=True)
+    working_since = Column(ISODate(), nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     courses = relationship('Course', back_populates='teacher')
     subjects = relationship('Subject', back_populates='teacher')
 
     def __str__(self):
         return f'Teacher: id={self.id}, card_id={self.card_id}, qualification={self.qualification}'
+
+
+# User registered as a student can't be registered as a teacher, the db rejects the insert.
+add_exclusive_role_trigger(table=Teacher, exclusive_table='students', exclusive_model='Student')
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from flask import Blueprint, Response, g, jsonify, make_response, request
+from flask import Blueprint, Response, current_app, g, jsonify, make_response, request
 
 from flask_jwt_extended import jwt_required
 
@@ -8,29 +8,40 @@ from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
 from teachers.schemas import TeacherInputSchema, TeacherOutputSchema, TeacherUpdateSchema
 from teachers.services import TeacherService
+from utils.requests import get_request_ids
+from utils.responses import bulk_status_code, stream_response
+from utils.schemas import get_schema
 
 teachers_bp = Blueprint('teachers', __name__, url_prefix='/teachers')
 
 
 @teachers_bp.get('/')
 def get_teachers() -> Response:
-    """GET '/teachers' endpoint view function.
+    """GET '/teachers' and '/teachers?ids={id},{id}' endpoint view function.
 
     Returns:
     http response with json data: list of Teacher model objects serialized with TeacherOutputSchema.
     """
-    teachers = TeacherService(
-        session=g.db_session,
-        output_schema=TeacherOutputSchema(many=True),
-    ).get_teachers()
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    service = TeacherService.for_session(
+        session=g.db_session,
+        output_schema=get_schema(TeacherOutputSchema, many=True),
+    )
+    errors = []
+    if 'ids' in request.args:
+        teachers, errors = service.get_teachers_by_ids(ids=get_request_ids())
+    elif current_app.config['LIST_STREAMING_ENABLED']:
+        teachers = service.stream_teachers(batch_size=current_app.config['LIST_STREAMING_BATCH_SIZE'])
+        return stream_response(data=teachers, status_code=STATUS_CODE)
+    else:
+        teachers = service.get_teachers()
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
             },
             'data': teachers,
-            'errors': [],
+            'errors': errors,
         }
     )
     return make_response(jsonify(response), STATUS_CODE)
@@ -43,13 +54,13 @@ def post_teachers() -> Response:
     Returns:
     http response with json data: newly created Teacher model object serialized with TeacherOutputSchema.
     """
-    teacher = TeacherService(
+    teacher = TeacherService.for_session(
         session=g.db_session,
-        input_schema=TeacherInputSchema(many=False),
-        output_schema=TeacherOutputSchema(many=False),
+        input_schema=get_schema(TeacherInputSchema, many=False),
+        output_schema=get_schema(TeacherOutputSchema, many=False),
     ).add_teacher(data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_201_CREATED.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -61,6 +72,32 @@ def post_teachers() -> Response:
     return make_response(jsonify(response), STATUS_CODE)
 
 
+@teachers_bp.post('/bulk')
+def post_teachers_bulk() -> Response:
+    """POST '/teachers/bulk' endpoint view function.
+
+    Returns:
+    http response with json data: newly created Teacher model objects serialized with TeacherOutputSchema
+    and errors of the rejected ones, both by the payload item index.
+    """
+    teachers, errors = TeacherService.for_session(
+        session=g.db_session,
+        input_schema=get_schema(TeacherInputSchema, many=False),
+        output_schema=get_schema(TeacherOutputSchema, many=True),
+    ).add_teachers(request.get_json())
+    STATUS_CODE = bulk_status_code(data=teachers, errors=errors)
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': teachers,
+            'errors': errors,
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
+
+
 @teachers_bp.get('/<uuid:id>')
 def get_teacher(id: UUID) -> Response:
     """GET '/teachers/{id}' endpoint view function.
@@ -71,12 +108,12 @@ def get_teacher(id: UUID) -> Response:
     Returns:
     http response with json data: single Teacher model objects serialized with TeacherOutputSchema.
     """
-    teacher = TeacherService(
+    teacher = TeacherService.for_session(
         session=g.db_session,
-        output_schema=TeacherOutputSchema(many=False),
+        output_schema=get_schema(TeacherOutputSchema, many=False),
     ).get_teacher_by_id(id=id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -99,7 +136,7 @@ def delete_teacher(id: UUID) -> Response:
     Returns:
     http response with no data and 204 status code.
     """
-    TeacherService(session=g.db_session).delete_teacher(id=id)
+    TeacherService.for_session(session=g.db_session).delete_teacher(id=id)
     return make_response('', HttpStatusCodeConstants.HTTP_204_NO_CONTENT.value)
 
 
@@ -114,13 +151,13 @@ def put_teacher(id: UUID) -> Response:
     Returns:
     http response with json data: single updated Teacher model objects serialized with TeacherOutputSchema.
     """
-    teacher = TeacherService(
+    teacher = TeacherService.for_session(
         session=g.db_session,
-        input_schema=TeacherUpdateSchema(many=False),
-        output_schema=TeacherOutputSchema(many=False),
+        input_schema=get_schema(TeacherUpdateSchema, many=False),
+        output_schema=get_schema(TeacherOutputSchema, many=False),
     ).update_teacher(id=id, data=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
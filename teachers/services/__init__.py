@@ -1,19 +1,19 @@
 from copy import deepcopy
-from typing import Type
+from typing import Iterator, Type
 from uuid import UUID
 import abc
 
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import scoped_session
 
 from common.abstract.services import GenericService
 from common.constants.models import TeacherModelConstants
+from db.retry import retry_transaction
 from students.models import Student
-from teachers.models import Teacher
+from teachers.models import Teacher, card_id_sequence
 from teachers.schemas import TeacherBaseSchema
 from teachers.services.serializers import TeacherSerializer
 from teachers.utils.exceptions import StudentExistsError, TeacherNotFoundError
-from utils.exceptions import parse_integrity_error
+from users.models import User
 from utils.logging import setup_logging
 
 
@@ -37,6 +37,29 @@ class AbstractTeacherService(metaclass=abc.ABCMeta):
         """
         return self._get_teachers()
 
+    def get_teachers_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        """Query database with a single statement and return Teacher objects from the db filtered by ids.
+
+        Args:
+            ids: list of UUIDs of Teacher objects.
+
+        Returns:
+        tuple of lists: Teacher objects serialized with TeacherOutputSchema in the order of ids and not found errors
+        of the missing ones.
+        """
+        return self._get_teachers_by_ids(ids)
+
+    def stream_teachers(self, batch_size: int) -> Iterator[list[dict]]:
+        """Query database with server-side cursor and return Teacher objects in batches.
+
+        Args:
+            batch_size: number of Teacher objects read from the db and serialized at once.
+
+        Returns:
+        Iterator of Teacher objects batches serialized with TeacherOutputSchema.
+        """
+        return self._stream_teachers(batch_size)
+
     def add_teacher(self, data: dict) -> dict:
         """Getting user dict payload and saving it in the Teacher table.
 
@@ -48,6 +71,18 @@ class AbstractTeacherService(metaclass=abc.ABCMeta):
         """
         return self._add_teacher(data)
 
+    def add_teachers(self, data: list[dict]) -> tuple[list[dict], list[dict]]:
+        """Getting list of teacher dict payloads and saving them in the Teacher table with a single statement.
+
+        Args:
+            data: list of dicts from flask request json payload.
+
+        Returns:
+        tuple of lists: created Teacher objects serialized with TeacherOutputSchema and errors of the rejected ones,
+        both by the item index.
+        """
+        return self._add_teachers(data)
+
     def get_teacher_by_id(self, id: UUID) -> dict:
         """Query database and return single Teacher objects from the db filtered by id.
 
@@ -86,10 +121,22 @@ class AbstractTeacherService(metaclass=abc.ABCMeta):
     def _get_teachers(self) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _stream_teachers(self, batch_size: int) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _get_teachers_by_ids(self, ids: list[UUID]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _add_teacher(self, data: dict) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _add_teachers(self, data: list[dict]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _get_teacher_by_id(self, id: UUID) -> None:
         pass
@@ -109,118 +156,95 @@ class TeacherService(AbstractTeacherService, GenericService):
     def _get_teachers(self) -> list[dict]:
         self._log.debug('Getting all teachers from the db.')
         teachers = self.session.query(Teacher).all()
+        self._release_connection()
         return self.validator.serialize(teachers)
 
+    def _get_teachers_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        teachers, errors = self._get_objects_by_ids(table=Teacher, ids=ids)
+        self._release_connection()
+        return self.validator.serialize(teachers), errors
+
+    def _stream_teachers(self, batch_size: int) -> Iterator[list[dict]]:
+        self._log.debug('Streaming all teachers from the db.')
+        teachers = self.session.query(Teacher).yield_per(batch_size)
+        return self.validator.serialize_stream(data=teachers, batch_size=batch_size)
+
     def _add_teacher(self, data: dict) -> dict:
         teacher = self.validator.deserialize(data=data)
         db_teacher = self._save_teacher_data(data=teacher)
+        self._release_connection()
         return self.validator.serialize(data=db_teacher)
 
+    @retry_transaction
+    def _add_teachers(self, data: list[dict]) -> tuple[list[dict], list[dict]]:
+        return self._add_registrations(
+            table=Teacher,
+            parent_table=User,
+            exclusive_table=Student,
+            card_id_prefix=TeacherModelConstants.CARD_ID_PREFIX.value,
+            card_id_sequence=card_id_sequence,
+            items=data,
+        )
+
+    @retry_transaction
     def _save_teacher_data(self, data: dict) -> Teacher:
         """Saves and return Teacher data in the db.
 
         Args:
             data: dict of serialized teacher data.
+        Raises:
+        StudentExistsError if the user is registered as a student.
 
         Returns:
         Teacher model object saved in the db.
         """
         teacher = deepcopy(data)
-        # check if student with id exists.
-        self._is_student_exists(column='id', value=teacher['id'])
-        # Generating teacher card_id, if exception occurs during the saving process, rollback session and try again.
-        while True:
-            try:
-                teacher['card_id'] = self._create_teacher_card_id()
-                db_teacher = Teacher(**teacher)
-                self.session.add(db_teacher)
-                self.session.commit()
-                self._log.debug(f'Created teacher with card_id: {teacher["card_id"]}')
-                break
-            except IntegrityError as err:
-                table_name, field, value = parse_integrity_error(error=err)
-                self._log.debug(
-                    f'Error during saving {table_name} with {field}: {value} and card_id: {teacher["card_id"]}'
-                )
-                if field not in ['card_id']:
-                    raise err
-                self.session.rollback()
-        self.session.refresh(db_teacher)
+        teacher['card_id'] = self._create_teacher_card_id()
+        db_teacher = Teacher(**teacher)
+        self.session.add(db_teacher)
+        self._commit_registration(
+            table=Teacher, exclusive_table=Student, id=teacher['id'], exists_error=StudentExistsError,
+        )
+        self._log.debug(f'Created teacher with card_id: {teacher["card_id"]}')
         return db_teacher
 
-    def _is_student_exists(self, column: str, value: str) -> None:
-        """Checks if Student from the request json data exists in the db.
-
-        Args:
-            column: name of table column to look up.
-            value: to find in the table.
-        Raises:
-        StudentExistsError if Student with id exists.
-
-        Returns:
-        Nothing.
-        """
-        if self._check_obj_exists(table=Student, column=column, value=value):
-            raise StudentExistsError(
-                f'Teacher with {column}: {value} can not be created, '
-                f'because a Student with {column}: {value} already exists.'
-            )
-
     def _create_teacher_card_id(self) -> str:
         """Create teacher card_id number.
 
         Returns:
         properly formatted teacher card_id.
         """
-        db_card_id = self._get_last_column_object(table=Teacher, column='card_id')
-        if db_card_id:
-            card_id = self._create_card_id(card_id=db_card_id)
-        else:
-            card_id = self._create_card_id(card_id=TeacherModelConstants.CARD_ID_DEFAULT_NUMBER.value)
-        return card_id
+        return self._create_card_id(
+            prefix=TeacherModelConstants.CARD_ID_PREFIX.value,
+            sequence=card_id_sequence,
+            table=Teacher,
+        )
 
     def _get_teacher_by_id(self, id: UUID) -> dict:
         teacher = self._get_teacher(column='id', value=id)
+        self._release_connection()
         return self.validator.serialize(data=teacher)
 
     def _get_teacher(self, column: str, value: UUID | str) -> Teacher:
-        if self._teacher_exists(column=column, value=value):
-            self._log.debug(f'Getting Teacher with {column}: {value}.')
-            return self.session.query(Teacher).filter(Teacher.__table__.columns[column] == value).one()
-
-    def _teacher_exists(self, column: str, value: str) -> bool:
-        """Check if Teacher object exists in the db.
-
-        Args:
-            column: name of column in the Teacher model.
-            value: to find in the Teacher model.
-        Raises:
-        TeacherNotFoundError exception if object not present in Teacher model.
-
-        Returns:
-        bool of Teacher object existence.
-        """
-        self._log.debug(f'Checking if Teacher with {column}: {value} exists.')
-        q = self.session.query(Teacher).filter(Teacher.__table__.columns[column] == value)
-        obj_exists = self.session.query(q.exists()).scalar()
-        if not obj_exists:
-            raise TeacherNotFoundError(f'Teacher with {column}: {value} not found.')
-        return True
+        return self._get_object(table=Teacher, column=column, value=value, not_found_error=TeacherNotFoundError)
 
+    @retry_transaction
     def _delete_teacher(self, id: UUID) -> None:
-        if self._teacher_exists(column='id', value=id):
-            teacher = self.session.query(Teacher).filter(Teacher.id == id).one()
-            # Soft deleting Teacher object.
-            teacher.delete()
-            self.session.commit()
-            self._log.debug(f'Teacher with id: "{id}" deleted.')
+        self._delete_object(table=Teacher, id=id, not_found_error=TeacherNotFoundError)
+        self.session.commit()
+        self._log.debug(f'Teacher with id: "{id}" deleted.')
 
+    @retry_transaction
     def _update_teacher(self, id: UUID, data: dict) -> dict:
         teacher = self.validator.deserialize(data=data)
-        db_teacher = self._get_teacher(column='id', value=id)
-        db_teacher.qualification = teacher['qualification']
-        db_teacher.working_since = teacher['working_since']
+        db_teacher = self._update_object(
+            table=Teacher,
+            column='id',
+            value=id,
+            values={'qualification': teacher['qualification'], 'working_since': teacher['working_since']},
+            not_found_error=TeacherNotFoundError,
+        )
         self.session.commit()
-        self.session.refresh(db_teacher)
         self._log.debug(f'Teacher with id: "{id}" updated.')
+        self._release_connection()
         return self.validator.serialize(data=db_teacher)
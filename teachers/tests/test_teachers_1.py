@@ -1,7 +1,10 @@
+from copy import deepcopy
 from unittest import TestCase
+from uuid import uuid4
 
 from flask import url_for
 
+from common.constants.db import QueryStatisticsConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.tests.generic import TestMixin
 from common.tests.test_data.teachers import request_test_teacher_data
@@ -36,6 +39,14 @@ class GetTeachersTestCase(TestMixin, TestCase):
         self.assertEqual(1, self.db_session.query(Teacher).count())
 
 
+class GetTeachersStreamingTestCase(GetTeachersTestCase):
+    """Tests for GET '/teachers' endpoint with list streaming enabled."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['LIST_STREAMING_ENABLED'] = True
+
+
 class GetTeacherTestCase(TestMixin, TestCase):
     """Tests for GET '/teachers/{id}' endpoint."""
 
@@ -47,6 +58,7 @@ class GetTeacherTestCase(TestMixin, TestCase):
         expected_result = response_test_teacher_data.RESPONSE_TEACHER_NOT_FOUND
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(0, self.db_session.query(Teacher).count())
 
     def test_get_teacher_test_data_in_db(self) -> None:
@@ -58,9 +70,41 @@ class GetTeacherTestCase(TestMixin, TestCase):
         expected_result = response_test_teacher_data.RESPONSE_GET_TEACHER
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(1, self.db_session.query(Teacher).count())
 
 
+class GetTeachersByIdsTestCase(TestMixin, TestCase):
+    """Tests for GET '/teachers?ids={id},{id}' endpoint."""
+
+    def test_get_teachers_by_ids_in_requested_order(self) -> None:
+        """Test GET '/teachers?ids={id},{id}' endpoint returns teachers in the ids order and missing ids."""
+        db_teacher = self.add_teacher_to_db()
+        random_db_teacher = self.add_random_teacher_to_db()
+        missing_id = str(uuid4())
+        url = url_for('teachers.get_teachers', ids=f'{random_db_teacher.id},{missing_id},{db_teacher.id}')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertEqual(
+            [str(random_db_teacher.id), str(db_teacher.id)],
+            [teacher['id'] for teacher in response_data['data']],
+        )
+        self.assertEqual(
+            [{'id': missing_id, 'message': f'Teacher with id: {missing_id} not found.'}],
+            response_data['errors'],
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+
+    def test_get_teachers_by_ids_invalid_ids(self) -> None:
+        """Test GET '/teachers?ids={id}' endpoint with invalid UUID in the ids."""
+        url = url_for('teachers.get_teachers', ids='not-a-uuid')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertIn('ids', response_data['errors']['message'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+
+
 class PostTeachersTestCase(TestMixin, TestCase):
     """Tests for POST '/teachers' endpoint."""
 
@@ -78,6 +122,10 @@ class PostTeachersTestCase(TestMixin, TestCase):
         expected_result = response_test_teacher_data.RESPONSE_POST_TEACHERS
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=2),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Teacher).count())
 
     def test_post_teachers_invalid_json_payload(self) -> None:
@@ -96,12 +144,12 @@ class PostTeachersTestCase(TestMixin, TestCase):
         payload_data['id'] = db_student.id
         response = self.client.post(self.url, json=payload_data)
         response_data = response.get_json()
-        response_test_teacher_data.RESPONSE_USER_ALREADY_STUDENT['errors']['message'] = (
-            response_test_teacher_data.RESPONSE_USER_ALREADY_STUDENT['errors']['message'].format(
+        expected_result = deepcopy(response_test_teacher_data.RESPONSE_USER_ALREADY_STUDENT)
+        expected_result['errors']['message'] = (
+            expected_result['errors']['message'].format(
                 first_id=db_student.id, second_id=db_student.id,
             )
         )
-        expected_result = response_test_teacher_data.RESPONSE_USER_ALREADY_STUDENT
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
         self.assertEqual(0, self.db_session.query(Teacher).count())
@@ -119,6 +167,10 @@ class PutTeachersTestCase(TestMixin, TestCase):
         expected_result = response_test_teacher_data.RESPONSE_TEACHER_UPDATE_TEST_DATA
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=1),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(Teacher).count())
 
     def test_put_teachers_updating_other_teacher_data(self) -> None:
@@ -160,3 +212,79 @@ class DeleteTeachersTestCase(TestMixin, TestCase):
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
         self.assertEqual(2, self.db_session.query(Teacher).count())
+
+
+class PostTeachersBulkTestCase(TestMixin, TestCase):
+    """Tests for POST '/teachers/bulk' endpoint."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = url_for('teachers.post_teachers_bulk')
+        # Other tests set the id of the shared test data.
+        self.item = deepcopy(request_test_teacher_data.ADD_TEACHER_TEST_DATA)
+        self.item.pop('id', None)
+
+    def test_post_teachers_bulk_valid_payload(self) -> None:
+        """Test POST '/teachers/bulk' endpoint with valid payload, ids are checked, card_ids reserved and teachers
+        inserted with three statements.
+        """
+        db_users = [self.add_random_user_to_db() for _ in range(3)]
+        payload_data = [{**self.item, 'id': str(db_user.id)} for db_user in db_users]
+        response = self.client.post(self.url, json=payload_data)
+        response_data = response.get_json()
+        expected_result = [
+            {'index': index, 'data': {**item, 'card_id': f'UNI-000000{index + 1}'}}
+            for index, item in enumerate(payload_data)
+        ]
+        self.assertEqual(expected_result, response_data['data'])
+        self.assertEqual([], response_data['errors'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual('3', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+        self.assertEqual(3, self.db_session.query(Teacher).count())
+
+    def test_post_teachers_bulk_partially_valid_payload(self) -> None:
+        """Test POST '/teachers/bulk' endpoint with invalid, unknown, duplicated and student ids, one is created."""
+        db_user = self.add_random_user_to_db()
+        db_student = self.add_random_student_to_db()
+        payload_data = [
+            {**self.item, 'id': str(db_user.id)},
+            self.item,
+            {**self.item, 'id': str(db_student.id)},
+            {**self.item, 'id': request_test_teacher_data.DUMMY_TEACHER_UUID},
+            {**self.item, 'id': str(db_user.id)},
+        ]
+        response = self.client.post(self.url, json=payload_data)
+        response_data = response.get_json()
+        expected_errors = [
+            {'index': 1, 'message': {'id': ['Missing data for required field.']}},
+            {
+                'index': 2,
+                'message': (
+                    f'Teacher with id: {db_student.id} can not be created, '
+                    f'because a Student with id: {db_student.id} already exists.'
+                ),
+            },
+            {
+                'index': 3,
+                'message': (
+                    f'Foreign key violation id: {request_test_teacher_data.DUMMY_TEACHER_UUID} '
+                    'is not present in table.'
+                ),
+            },
+            {'index': 4, 'message': f'Teacher with id: {db_user.id} already exists.'},
+        ]
+        self.assertEqual([0], [item['index'] for item in response_data['data']])
+        self.assertEqual(expected_errors, response_data['errors'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_207_MULTI_STATUS.value, response.status_code)
+        self.assertEqual(1, self.db_session.query(Teacher).count())
+
+    def test_post_teachers_bulk_teacher_already_registered(self) -> None:
+        """Test POST '/teachers/bulk' endpoint with ids of the teachers already in the db."""
+        db_teacher = self.add_teacher_to_db()
+        payload_data = [{**self.item, 'id': str(db_teacher.id)}]
+        response = self.client.post(self.url, json=payload_data)
+        response_data = response.get_json()
+        expected_errors = [{'index': 0, 'message': f'Teacher with id: {db_teacher.id} already exists.'}]
+        self.assertEqual(expected_errors, response_data['errors'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(1, self.db_session.query(Teacher).count())
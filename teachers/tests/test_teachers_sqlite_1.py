@@ -0,0 +1,50 @@
+from app.config import TestingSqliteConfig
+from teachers.tests import test_teachers_1
+
+
+class GetTeachersSqliteTestCase(test_teachers_1.GetTeachersTestCase):
+    """Tests for GET '/teachers' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetTeachersStreamingSqliteTestCase(test_teachers_1.GetTeachersStreamingTestCase):
+    """Tests for GET '/teachers' endpoint with list streaming enabled on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetTeacherSqliteTestCase(test_teachers_1.GetTeacherTestCase):
+    """Tests for GET '/teachers/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostTeachersSqliteTestCase(test_teachers_1.PostTeachersTestCase):
+    """Tests for POST '/teachers' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PutTeachersSqliteTestCase(test_teachers_1.PutTeachersTestCase):
+    """Tests for PUT '/teachers/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteTeachersSqliteTestCase(test_teachers_1.DeleteTeachersTestCase):
+    """Tests for DELETE '/teachers/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostTeachersBulkSqliteTestCase(test_teachers_1.PostTeachersBulkTestCase):
+    """Tests for POST '/teachers/bulk' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetTeachersByIdsSqliteTestCase(test_teachers_1.GetTeachersByIdsTestCase):
+    """Tests for GET '/teachers?ids={id},{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
@@ -2,6 +2,7 @@ from flask import Response, jsonify, make_response
 
 from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
+from utils.schemas import get_schema
 
 
 class TeacherNotFoundError(Exception):
@@ -22,7 +23,7 @@ def student_exists_error_handler(error: StudentExistsError) -> Response:
     http Response with formatted error message.
     """
     STATUS_CODE = HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -44,7 +45,7 @@ def teacher_not_found_error_handler(error: TeacherNotFoundError) -> Response:
     http Response with formatted error message.
     """
     STATUS_CODE = HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -2,18 +2,19 @@ import uuid
 
 from sqla_softdelete import SoftDeleteMixin
 from sqlalchemy import Boolean, Column, DateTime, String, func
-from sqlalchemy.dialects.postgresql import UUID
 
 from common.constants.models import UserModelConstants
 from db import Base
+from db.types import GUID
 
 
 class User(SoftDeleteMixin, Base):
     """A model representing a user."""
 
     __tablename__ = 'users'
+    __mapper_args__ = {'eager_defaults': True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, index=True, default=uuid.uuid4)
     first_name = Column(String(UserModelConstants.CHAR_SIZE_64.value), nullable=True)
     last_name = Column(String(UserModelConstants.CHAR_SIZE_64.value), nullable=True)
     username = Column(String(UserModelConstants.CHAR_SIZE_64.value), nullable=False, unique=True)
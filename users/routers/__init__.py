@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from flask import Blueprint, Response, g, jsonify, make_response, request
+from flask import Blueprint, Response, current_app, g, jsonify, make_response, request
 
 from flask_jwt_extended import jwt_required
 
@@ -8,25 +8,36 @@ from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
 from users.schemas import UserInputSchema, UserOutputSchema, UserUpdateSchema
 from users.services import UserService
+from utils.requests import get_request_ids
+from utils.responses import bulk_status_code, stream_response
+from utils.schemas import get_schema
 
 users_bp = Blueprint('users', __name__, url_prefix='/users')
 
 
 @users_bp.get('/')
 def get_users() -> Response:
-    """GET '/users' endpoint view function."""
-    users = UserService(
-        session=g.db_session,
-        output_schema=UserOutputSchema(many=True),
-    ).get_users()
+    """GET '/users' and '/users?ids={id},{id}' endpoint view function."""
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    service = UserService.for_session(
+        session=g.db_session,
+        output_schema=get_schema(UserOutputSchema, many=True),
+    )
+    errors = []
+    if 'ids' in request.args:
+        users, errors = service.get_users_by_ids(ids=get_request_ids())
+    elif current_app.config['LIST_STREAMING_ENABLED']:
+        users = service.stream_users(batch_size=current_app.config['LIST_STREAMING_BATCH_SIZE'])
+        return stream_response(data=users, status_code=STATUS_CODE)
+    else:
+        users = service.get_users()
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
             },
             'data': users,
-            'errors': [],
+            'errors': errors,
         }
     )
     return make_response(jsonify(response), STATUS_CODE)
@@ -35,13 +46,13 @@ def get_users() -> Response:
 @users_bp.post('/')
 def post_users() -> Response:
     """POST '/users' endpoint view function."""
-    user = UserService(
+    user = UserService.for_session(
         session=g.db_session,
-        input_schema=UserInputSchema(many=False),
-        output_schema=UserOutputSchema(many=False),
+        input_schema=get_schema(UserInputSchema, many=False),
+        output_schema=get_schema(UserOutputSchema, many=False),
     ).add_user(user=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_201_CREATED.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -53,23 +64,44 @@ def post_users() -> Response:
     return make_response(jsonify(response), STATUS_CODE)
 
 
+@users_bp.post('/bulk')
+def post_users_bulk() -> Response:
+    """POST '/users/bulk' endpoint view function."""
+    users, errors = UserService.for_session(
+        session=g.db_session,
+        input_schema=get_schema(UserInputSchema, many=False),
+        output_schema=get_schema(UserOutputSchema, many=True),
+    ).add_users(users=request.get_json())
+    STATUS_CODE = bulk_status_code(data=users, errors=errors)
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': users,
+            'errors': errors,
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
+
+
 @users_bp.delete('/<uuid:id>')
 @jwt_required()
 def delete_user(id: UUID) -> Response:
     """DELETE '/users/{id}' endpoint view function."""
-    UserService(session=g.db_session).delete_user(id=id)
+    UserService.for_session(session=g.db_session).delete_user(id=id)
     return make_response('', HttpStatusCodeConstants.HTTP_204_NO_CONTENT.value)
 
 
 @users_bp.get('/<uuid:id>')
 def get_user(id: UUID) -> Response:
     """GET '/users/{id}' endpoint view function."""
-    user = UserService(
+    user = UserService.for_session(
         session=g.db_session,
-        output_schema=UserOutputSchema(many=False),
+        output_schema=get_schema(UserOutputSchema, many=False),
     ).get_user_by_id(id=id)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -85,13 +117,13 @@ def get_user(id: UUID) -> Response:
 @jwt_required()
 def put_user(id: UUID) -> Response:
     """PUT '/users/{id}' endpoint view function."""
-    user = UserService(
+    user = UserService.for_session(
         session=g.db_session,
-        input_schema=UserUpdateSchema(many=False),
-        output_schema=UserOutputSchema(many=False),
+        input_schema=get_schema(UserUpdateSchema, many=False),
+        output_schema=get_schema(UserOutputSchema, many=False),
     ).update_user(id=id, user=request.get_json())
     STATUS_CODE = HttpStatusCodeConstants.HTTP_200_OK.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -1,15 +1,18 @@
 from copy import deepcopy
-from typing import Type
-from uuid import UUID
+from typing import Iterator, Type
+from uuid import UUID, uuid4
 import abc
 
 from passlib.hash import argon2
 from sqlalchemy.orm import scoped_session
 
+from common.abstract.services import GenericService
+from db.retry import retry_transaction
 from users.models import User
 from users.schemas import UserBaseSchema
 from users.services.serializers import UserSerializer
 from users.utils.exceptions import UserNotFoundError
+from users.utils.passwords import get_password_hasher, hash_password
 from utils.logging import setup_logging
 
 
@@ -29,10 +32,22 @@ class AbstractUserService(metaclass=abc.ABCMeta):
         """Return list of User objects from the db."""
         return self._get_users()
 
+    def get_users_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        """Return User objects from the db filtered by ids in the order of ids, and errors of the missing ones."""
+        return self._get_users_by_ids(ids)
+
+    def stream_users(self, batch_size: int) -> Iterator[list[dict]]:
+        """Return iterator of User objects batches read from the db with server-side cursor."""
+        return self._stream_users(batch_size)
+
     def add_user(self, user: dict) -> dict:
         """Add User object to the db."""
         return self._add_user(user)
 
+    def add_users(self, users: list[dict]) -> tuple[list[dict], list[dict]]:
+        """Add User objects to the db, return created users and errors of the rejected ones by item index."""
+        return self._add_users(users)
+
     def delete_user(self, id: UUID) -> None:
         """Delete User object from the db."""
         return self._delete_user(id)
@@ -53,10 +68,22 @@ class AbstractUserService(metaclass=abc.ABCMeta):
     def _get_users(self) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _stream_users(self, batch_size: int) -> None:
+        pass
+
+    @abc.abstractclassmethod
+    def _get_users_by_ids(self, ids: list[UUID]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _add_user(self, user: dict) -> None:
         pass
 
+    @abc.abstractclassmethod
+    def _add_users(self, users: list[dict]) -> None:
+        pass
+
     @abc.abstractclassmethod
     def _delete_user(self, id: UUID) -> None:
         pass
@@ -74,13 +101,25 @@ class AbstractUserService(metaclass=abc.ABCMeta):
         pass
 
 
-class UserService(AbstractUserService):
+class UserService(AbstractUserService, GenericService):
 
     def _get_users(self) -> list[dict]:
         self._log.debug('Getting all users from the db.')
         users = self.session.query(User).all()
+        self._release_connection()
         return self.validator.serialize(users)
 
+    def _get_users_by_ids(self, ids: list[UUID]) -> tuple[list[dict], list[dict]]:
+        users, errors = self._get_objects_by_ids(table=User, ids=ids)
+        self._release_connection()
+        return self.validator.serialize(users), errors
+
+    def _stream_users(self, batch_size: int) -> Iterator[list[dict]]:
+        self._log.debug('Streaming all users from the db.')
+        users = self.session.query(User).yield_per(batch_size)
+        return self.validator.serialize_stream(data=users, batch_size=batch_size)
+
+    @retry_transaction
     def _save_user_data(self, user: dict) -> User:
         """Saves and return User data in the db."""
         user = deepcopy(user)
@@ -89,53 +128,77 @@ class UserService(AbstractUserService):
         self._log.debug(f'Creating user with username: {user.username}')
         self.session.add(user)
         self.session.commit()
-        self.session.refresh(user)
         return user
 
     def _add_user(self, user: dict) -> dict:
         user = self.validator.deserialize(data=user)
         db_user = self._save_user_data(user=user)
+        self._release_connection()
         return self.validator.serialize(data=db_user)
 
+    def _add_users(self, users: list[dict]) -> tuple[list[dict], list[dict]]:
+        valid_users, errors = self._deserialize_items(items=users)
+        errors.update(self._unique_conflicts(table=User, items=valid_users))
+        valid_users = {index: user for index, user in valid_users.items() if index not in errors}
+        # Connection isn't held while the passwords are hashed.
+        self._release_connection()
+        passwords = get_password_hasher().hash_passwords(passwords=[user['password'] for user in valid_users.values()])
+        rows = [
+            {**user, 'id': uuid4(), 'password': password} for user, password in zip(valid_users.values(), passwords)
+        ]
+        rows = self._save_users_data(rows=rows)
+        self._release_connection()
+        return (
+            [{'index': index, 'data': user} for index, user in zip(valid_users, self.validator.serialize(data=rows))],
+            [{'index': index, 'message': errors[index]} for index in sorted(errors)],
+        )
+
+    @retry_transaction
+    def _save_users_data(self, rows: list[dict]) -> list[dict]:
+        """Saves Users rows with hashed passwords in the db with a single INSERT, return the inserted rows."""
+        if not rows:
+            return []
+        rows = self._insert_objects(table=User, rows=rows)
+        self.session.commit()
+        self._log.debug(f'{len(rows)} User objects created.')
+        return rows
+
     def _hash_password(self, password: str) -> str:
         """Return password hashed with argon2 algorithm."""
-        return argon2.using(rounds=4).hash(password)
+        return hash_password(password=password)
 
+    @retry_transaction
     def _delete_user(self, id: UUID) -> None:
-        if self._user_exists(column='id', value=id):
-            user = self.session.query(User).filter(User.id == id).one()
-            # Soft deleting User object.
-            user.delete()
-            self.session.commit()
-            self._log.debug(f'User with id: "{id}" deleted.')
-
-    def _user_exists(self, column: str, value: UUID) -> bool:
-        """Check if User object exists in the db."""
-        self._log.debug(f'Checking if User with {column}: {value} exists.')
-        q = self.session.query(User).filter(User.__table__.columns[column] == value)
-        user_exists = self.session.query(q.exists()).scalar()
-        if not user_exists:
-            raise UserNotFoundError(f'User with {column}: {value} not found.')
-        return True
-
-    def _get_user(self, column: str, value: UUID | str) -> dict:
-        if self._user_exists(column=column, value=value):
-            return self.session.query(User).filter(User.__table__.columns[column] == value).one()
+        self._delete_object(table=User, id=id, not_found_error=UserNotFoundError)
+        self.session.commit()
+        self._log.debug(f'User with id: "{id}" deleted.')
+
+    def _get_user(self, column: str, value: UUID | str) -> User:
+        return self._get_object(table=User, column=column, value=value, not_found_error=UserNotFoundError)
 
     def _get_user_by_id(self, id: UUID) -> dict:
         user = self._get_user(column='id', value=id)
+        self._release_connection()
         return self.validator.serialize(data=user)
 
+    @retry_transaction
     def _update_user(self, id: UUID, user: dict) -> dict:
         user = self.validator.deserialize(user)
-        db_user = self._get_user(column='id', value=id)
-        db_user.username = user['username']
-        db_user.first_name = user['first_name']
-        db_user.last_name = user['last_name']
-        db_user.email = user['email']
-        db_user.phone_number = user['phone_number']
+        db_user = self._update_object(
+            table=User,
+            column='id',
+            value=id,
+            values={
+                'username': user['username'],
+                'first_name': user['first_name'],
+                'last_name': user['last_name'],
+                'email': user['email'],
+                'phone_number': user['phone_number'],
+            },
+            not_found_error=UserNotFoundError,
+        )
         self.session.commit()
-        self.session.refresh(db_user)
+        self._release_connection()
         return self.validator.serialize(data=db_user)
 
     def _get_user_by_username(self, username: str) -> User:
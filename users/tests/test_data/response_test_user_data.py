@@ -10,6 +10,12 @@ RESPONSE_USER_TEST_DATA = {
     'email': 'test_john@john.com',
     'phone_number': '+380991112233',
 }
+RESPONSE_USER_INVALID_PAYLOAD_MESSAGE = {
+    'email': ['Missing data for required field.'],
+    'password': ['Missing data for required field.'],
+    'phone_number': ['Missing data for required field.'],
+    'username': ['Missing data for required field.'],
+}
 # GET
 RESPONSE_USERS_EMPTY_DB = {'data': [], 'errors': [], 'status': {'code': 200}}
 RESPONSE_GET_USER = {
@@ -28,6 +34,43 @@ RESPONSE_POST_USER = {
     'errors': [],
     'status': {'code': 201}
 }
+RESPONSE_POST_USERS_BULK = {
+    'data': [
+        {'index': 0, 'data': RESPONSE_USER_TEST_DATA},
+        {
+            'index': 1,
+            'data': {
+                'id': ANY,
+                'username': request_test_user_data.ADD_USERS_BULK_TEST_DATA[1]['username'],
+                'first_name': request_test_user_data.ADD_USERS_BULK_TEST_DATA[1]['first_name'],
+                'last_name': request_test_user_data.ADD_USERS_BULK_TEST_DATA[1]['last_name'],
+                'email': request_test_user_data.ADD_USERS_BULK_TEST_DATA[1]['email'],
+                'phone_number': request_test_user_data.ADD_USERS_BULK_TEST_DATA[1]['phone_number'],
+            },
+        },
+    ],
+    'errors': [],
+    'status': {'code': 201}
+}
+RESPONSE_POST_USERS_BULK_MIXED = {
+    'data': [
+        {'index': 0, 'data': RESPONSE_POST_USERS_BULK['data'][1]['data']},
+    ],
+    'errors': [
+        {'index': 1, 'message': RESPONSE_USER_INVALID_PAYLOAD_MESSAGE},
+        {
+            'index': 2,
+            'message': f'User with username: {request_test_user_data.ADD_USER_TEST_DATA["username"]} already exists.',
+        },
+        {
+            'index': 3,
+            'message': (
+                f'User with email: {request_test_user_data.ADD_USERS_BULK_TEST_DATA[1]["email"]} already exists.'
+            ),
+        },
+    ],
+    'status': {'code': 207}
+}
 # PUT
 RESPONSE_USER_UPDATE_TEST_DATA = {
     'data': {
@@ -50,12 +93,7 @@ RESPONSE_USER_NOT_FOUND = {
 RESPONSE_USER_INVALID_PAYLOAD = {
     'data': [],
     'errors': {
-        'message': {
-            'email': ['Missing data for required field.'],
-            'password': ['Missing data for required field.'],
-            'phone_number': ['Missing data for required field.'],
-            'username': ['Missing data for required field.'],
-        },
+        'message': RESPONSE_USER_INVALID_PAYLOAD_MESSAGE,
     },
     'status': {'code': 400}
 }
@@ -1,11 +1,14 @@
 from unittest import TestCase
+from uuid import uuid4
 
 from flask import url_for
 
+from common.constants.db import QueryStatisticsConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.tests.generic import TestMixin
 from common.tests.test_data.users import request_test_user_data
 from users.models import User
+from users.services import UserService
 from users.tests.test_data import response_test_user_data
 
 
@@ -36,6 +39,37 @@ class GetUsersTestCase(TestMixin, TestCase):
         self.assertEqual(1, self.db_session.query(User).count())
 
 
+class GetUsersStreamingTestCase(GetUsersTestCase):
+    """Tests for GET '/users' endpoint with list streaming enabled."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['LIST_STREAMING_ENABLED'] = True
+
+    def test_get_users_streamed_in_batches(self) -> None:
+        """Test GET '/users' endpoint streams more users than a single batch."""
+        self.app.config['LIST_STREAMING_BATCH_SIZE'] = 2
+        for number in range(5):
+            self._add_user_to_db(
+                user={
+                    **request_test_user_data.ADD_USER_TEST_DATA,
+                    'username': f'test_john_{number}',
+                    'email': f'test_john_{number}@john.com',
+                    'phone_number': f'+38099111223{number}',
+                },
+            )
+        response = self.client.get(self.url)
+        response_data = response.get_json()
+        self.assertNotIn('Content-Length', response.headers)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual({'code': HttpStatusCodeConstants.HTTP_200_OK.value}, response_data['status'])
+        self.assertEqual([], response_data['errors'])
+        self.assertEqual(
+            sorted(f'test_john_{number}' for number in range(5)),
+            sorted(user['username'] for user in response_data['data']),
+        )
+
+
 class GetUserTestCase(TestMixin, TestCase):
     """Tests for GET '/users/{id}' endpoint."""
 
@@ -47,6 +81,7 @@ class GetUserTestCase(TestMixin, TestCase):
         expected_result = response_test_user_data.RESPONSE_USER_NOT_FOUND
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(0, self.db_session.query(User).count())
 
     def test_get_user_test_data_in_db(self) -> None:
@@ -58,9 +93,41 @@ class GetUserTestCase(TestMixin, TestCase):
         expected_result = response_test_user_data.RESPONSE_GET_USER
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
         self.assertEqual(1, self.db_session.query(User).count())
 
 
+class GetUsersByIdsTestCase(TestMixin, TestCase):
+    """Tests for GET '/users?ids={id},{id}' endpoint."""
+
+    def test_get_users_by_ids_in_requested_order(self) -> None:
+        """Test GET '/users?ids={id},{id}' endpoint returns users in the ids order and missing ids."""
+        db_user = self.add_user_to_db()
+        random_db_user = self.add_random_user_to_db()
+        missing_id = str(uuid4())
+        url = url_for('users.get_users', ids=f'{random_db_user.id},{missing_id},{db_user.id}')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertEqual(
+            [str(random_db_user.id), str(db_user.id)],
+            [user['id'] for user in response_data['data']],
+        )
+        self.assertEqual(
+            [{'id': missing_id, 'message': f'User with id: {missing_id} not found.'}],
+            response_data['errors'],
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual('1', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+
+    def test_get_users_by_ids_invalid_ids(self) -> None:
+        """Test GET '/users?ids={id}' endpoint with invalid UUID in the ids."""
+        url = url_for('users.get_users', ids='not-a-uuid')
+        response = self.client.get(url)
+        response_data = response.get_json()
+        self.assertIn('ids', response_data['errors']['message'])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+
+
 class PostUsersTestCase(TestMixin, TestCase):
     """Tests for POST '/users' endpoint."""
 
@@ -75,6 +142,10 @@ class PostUsersTestCase(TestMixin, TestCase):
         expected_result = response_test_user_data.RESPONSE_POST_USER
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=1),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(User).count())
 
     def test_post_users_invalid_json_payload(self) -> None:
@@ -109,6 +180,10 @@ class PutUsersTestCase(TestMixin, TestCase):
         expected_result = response_test_user_data.RESPONSE_USER_UPDATE_TEST_DATA
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_200_OK.value, response.status_code)
+        self.assertEqual(
+            self.returning_statement_count(statements=1),
+            response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value],
+        )
         self.assertEqual(1, self.db_session.query(User).count())
 
     def test_put_users_updating_other_user_data(self) -> None:
@@ -149,3 +224,70 @@ class DeleteUsersTestCase(TestMixin, TestCase):
         self.assertEqual(expected_result, response_data)
         self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
         self.assertEqual(2, self.db_session.query(User).count())
+
+
+class PostUsersBulkTestCase(TestMixin, TestCase):
+    """Tests for POST '/users/bulk' endpoint."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = url_for('users.post_users_bulk')
+
+    def test_post_users_bulk_valid_payload(self) -> None:
+        """Test POST '/users/bulk' endpoint with valid payload, users are checked and inserted with two statements."""
+        response = self.client.post(self.url, json=request_test_user_data.ADD_USERS_BULK_TEST_DATA)
+        response_data = response.get_json()
+        expected_result = response_test_user_data.RESPONSE_POST_USERS_BULK
+        self.assertEqual(expected_result, response_data)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+        self.assertEqual('2', response.headers[QueryStatisticsConstants.STATEMENT_COUNT_HEADER.value])
+        self.assertEqual(2, self.db_session.query(User).count())
+        for user in request_test_user_data.ADD_USERS_BULK_TEST_DATA:
+            db_user = self.db_session.query(User).filter_by(username=user['username']).one()
+            self.assertTrue(UserService(session=self.db_session)._verify_password(user['password'], db_user.password))
+
+    def test_post_users_bulk_optional_fields_differ(self) -> None:
+        """Test POST '/users/bulk' endpoint with optional fields given by some of the users only."""
+        with_names = request_test_user_data.ADD_USERS_BULK_TEST_DATA[1]
+        without_names = {
+            key: value for key, value in request_test_user_data.ADD_USER_TEST_DATA.items()
+            if key not in ('first_name', 'last_name')
+        }
+        for payload in ([with_names, without_names], [without_names, with_names]):
+            with self.subTest(first_name=payload[0].get('first_name')):
+                response = self.client.post(self.url, json=payload)
+                response_data = response.get_json()
+                self.assertEqual(HttpStatusCodeConstants.HTTP_201_CREATED.value, response.status_code)
+                for user, created in zip(payload, response_data['data']):
+                    db_user = self.db_session.query(User).filter_by(username=user['username']).one()
+                    self.assertEqual(user.get('first_name'), db_user.first_name)
+                    self.assertEqual(user.get('last_name'), db_user.last_name)
+                    self.assertEqual(db_user.first_name, created['data'].get('first_name'))
+                    self.assertEqual(str(db_user.id), created['data']['id'])
+                self.db_session.query(User).delete()
+                self.db_session.commit()
+
+    def test_post_users_bulk_partially_valid_payload(self) -> None:
+        """Test POST '/users/bulk' endpoint with invalid and duplicated users, the valid ones are created."""
+        self.add_user_to_db()
+        response = self.client.post(self.url, json=request_test_user_data.ADD_USERS_BULK_MIXED_TEST_DATA)
+        response_data = response.get_json()
+        expected_result = response_test_user_data.RESPONSE_POST_USERS_BULK_MIXED
+        self.assertEqual(expected_result, response_data)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_207_MULTI_STATUS.value, response.status_code)
+        self.assertEqual(2, self.db_session.query(User).count())
+
+    def test_post_users_bulk_no_valid_users(self) -> None:
+        """Test POST '/users/bulk' endpoint with all users invalid."""
+        response = self.client.post(self.url, json=[request_test_user_data.ADD_USER_EMPTY_TEST_DATA])
+        response_data = response.get_json()
+        self.assertEqual([], response_data['data'])
+        self.assertEqual([0], [error['index'] for error in response_data['errors']])
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(0, self.db_session.query(User).count())
+
+    def test_post_users_bulk_payload_not_list(self) -> None:
+        """Test POST '/users/bulk' endpoint with single user payload instead of the list."""
+        response = self.client.post(self.url, json=request_test_user_data.ADD_USER_TEST_DATA)
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(0, self.db_session.query(User).count())
@@ -0,0 +1,68 @@
+from app.config import TestingSqliteConfig
+from common.constants.http import HttpStatusCodeConstants
+from common.tests.test_data.users import request_test_user_data
+from users.models import User
+from users.tests import test_users_1
+
+
+class GetUsersSqliteTestCase(test_users_1.GetUsersTestCase):
+    """Tests for GET '/users' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetUsersStreamingSqliteTestCase(test_users_1.GetUsersStreamingTestCase):
+    """Tests for GET '/users' endpoint with list streaming enabled on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetUserSqliteTestCase(test_users_1.GetUserTestCase):
+    """Tests for GET '/users/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostUsersSqliteTestCase(test_users_1.PostUsersTestCase):
+    """Tests for POST '/users' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+    def test_post_users_duplicate_username(self) -> None:
+        """Test POST '/users' endpoint with payload user already in the db.
+
+        SQLite checks unique constraints in other order than postgres, so it reports the other duplicate column.
+        """
+        self.add_user_to_db()
+        response = self.client.post(self.url, json=request_test_user_data.ADD_USER_TEST_DATA)
+        response_data = response.get_json()
+        self.assertEqual(
+            'User with phone_number: +380991112233 already exists.',
+            response_data['errors']['message'],
+        )
+        self.assertEqual(HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value, response.status_code)
+        self.assertEqual(1, self.db_session.query(User).count())
+
+
+class PutUsersSqliteTestCase(test_users_1.PutUsersTestCase):
+    """Tests for PUT '/users/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class DeleteUsersSqliteTestCase(test_users_1.DeleteUsersTestCase):
+    """Tests for DELETE '/users/{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class PostUsersBulkSqliteTestCase(test_users_1.PostUsersBulkTestCase):
+    """Tests for POST '/users/bulk' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
+
+
+class GetUsersByIdsSqliteTestCase(test_users_1.GetUsersByIdsTestCase):
+    """Tests for GET '/users?ids={id},{id}' endpoint on the SQLite db."""
+
+    config_name = TestingSqliteConfig.CONFIG_NAME
@@ -2,6 +2,7 @@ from flask import Response, jsonify, make_response
 
 from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
+from utils.schemas import get_schema
 
 
 class UserNotFoundError(Exception):
@@ -11,7 +12,7 @@ class UserNotFoundError(Exception):
 def user_not_found_error_handler(error: UserNotFoundError) -> Response:
     """Custom UserNotFoundError handler return http Response with error message."""
     STATUS_CODE = HttpStatusCodeConstants.HTTP_404_NOT_FOUND.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -0,0 +1,70 @@
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+import multiprocessing
+
+from flask import current_app, has_app_context
+
+from passlib.hash import argon2
+
+from common.constants.auth import PasswordHashConstants
+from utils.logging import setup_logging
+
+log = setup_logging(__name__)
+
+
+def hash_password(password: str) -> str:
+    """Return password hashed with argon2 algorithm."""
+    return argon2.using(rounds=PasswordHashConstants.ARGON2_ROUNDS.value).hash(password)
+
+
+class PasswordHasher:
+    """Hashes batches of passwords with argon2 across the pool of worker processes.
+
+    argon2 is CPU bound, the pool spreads a batch over the CPU cores instead of hashing it serially in the request
+    thread. The pool is started on the first batch, so the pre-fork server's workers each start their own pool after
+    the fork, its processes are spawned and don't inherit the app's db connections. With 1 worker or a single password
+    passwords are hashed in the calling thread.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._pool = None
+        self._lock = Lock()
+
+    def hash_passwords(self, passwords: list[str]) -> list[str]:
+        """Return argon2 hashes of the passwords, in the order of passwords.
+
+        Args:
+            passwords: list of plain text passwords.
+
+        Returns:
+        list of password hashes.
+        """
+        if self.workers <= 1 or len(passwords) <= 1:
+            return [hash_password(password) for password in passwords]
+        chunk_size = max(1, len(passwords) // (self.workers * PasswordHashConstants.CHUNKS_PER_WORKER.value))
+        return list(self._get_pool().map(hash_password, passwords, chunksize=chunk_size))
+
+    def shutdown(self) -> None:
+        """Stop the pool's worker processes, the next batch starts a new pool."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                log.debug(f'Starting password hashing pool of {self.workers} processes.')
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return self._pool
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the app's password hasher, hashing in the calling thread outside the app."""
+    if has_app_context():
+        return current_app.password_hasher
+    return PasswordHasher(workers=1)
@@ -3,11 +3,21 @@ import re
 from flask import Response, jsonify, make_response
 
 from marshmallow.exceptions import ValidationError
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from common.constants.exceptions import SqlalchemyExceptionConstants
 from common.constants.http import HttpStatusCodeConstants
 from common.schemas.response import ResponseBaseSchema
+from utils.schemas import get_schema
+
+
+class RequestDeadlineExceededError(Exception):
+    pass
+
+
+def get_error_text(error: IntegrityError) -> str:
+    """Return db error text of sqlalchemy IntegrityError, psycopg2 keeps it in pgerror, sqlite3 in the message."""
+    return getattr(error.orig, 'pgerror', None) or str(error.orig)
 
 
 def parse_integrity_error(error: IntegrityError) -> tuple:
@@ -19,23 +29,64 @@ def parse_integrity_error(error: IntegrityError) -> tuple:
     Returns:
     tuple with data: table_name, field where error occurred and value of that field.
     """
+    if not hasattr(error.orig, 'pgcode'):
+        return parse_sqlite_integrity_error(error=error)
     table_name = re.search(
         SqlalchemyExceptionConstants.INTEGRITY_ERROR_TABLE_NAME_REGEX.value,
-        error.orig.pgerror,
+        get_error_text(error=error),
     ).group(1)
     table_name = table_name.split('_')[0][:-1].capitalize()
     field, value = re.findall(
         SqlalchemyExceptionConstants.INTEGRITY_ERROR_FIELD_VALUE_REGEX.value,
-        error.orig.pgerror,
+        get_error_text(error=error),
     )
     return table_name, field, value
 
 
+def parse_sqlite_integrity_error(error: IntegrityError) -> tuple:
+    """Parse SQLite IntegrityError, its message has no value, it is taken from the statement's parameters.
+
+    Args:
+        error: raised sqlalchemy IntegrityError.
+
+    Returns:
+    tuple with data: table_name, field where error occurred and value of that field.
+    """
+    match = re.search(SqlalchemyExceptionConstants.SQLITE_INTEGRITY_ERROR_REGEX.value, str(error.orig))
+    table_name, field = (match.group(2), match.group(3)) if match and match.group(2) else ('', '')
+    table_name = table_name.split('_')[0][:-1].capitalize()
+    return table_name, field, get_statement_params(error=error).get(field, '')
+
+
+def get_statement_params(error: IntegrityError) -> dict:
+    """Return parameters of the failed statement by column name, SQLite statements take them positionally."""
+    if isinstance(error.params, dict):
+        return error.params
+    insert_columns = re.search(SqlalchemyExceptionConstants.SQLITE_INSERT_COLUMNS_REGEX.value, error.statement)
+    if insert_columns:
+        columns = [column.strip() for column in insert_columns.group(1).split(',')]
+    else:
+        columns = re.findall(SqlalchemyExceptionConstants.SQLITE_UPDATE_COLUMNS_REGEX.value, error.statement)
+    return dict(zip(columns, error.params or ()))
+
+
+def get_error_code(error: IntegrityError) -> str:
+    """Return SQLSTATE code of the IntegrityError, SQLite errors are mapped to the postgres codes."""
+    if hasattr(error.orig, 'pgcode'):
+        return error.orig.pgcode
+    if re.search(SqlalchemyExceptionConstants.EXCLUSIVE_ROLE_ERROR_REGEX.value, str(error.orig)):
+        return SqlalchemyExceptionConstants.EXCLUSION_VIOLATION_CODE.value
+    match = re.search(SqlalchemyExceptionConstants.SQLITE_INTEGRITY_ERROR_REGEX.value, str(error.orig))
+    if match and match.group(1) == SqlalchemyExceptionConstants.SQLITE_UNIQUE_CONSTRAINT.value:
+        return SqlalchemyExceptionConstants.UNIQUE_VIOLATION_CODE.value
+    return SqlalchemyExceptionConstants.FOREIGN_KEY_VIOLATION_CODE.value
+
+
 def integrity_error_handler(error: IntegrityError) -> Response:
     """Custom IntegrityError handler return http Response with error message."""
     ERROR_MESSAGE = get_error_message(error)
     STATUS_CODE = HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -48,7 +99,7 @@ def integrity_error_handler(error: IntegrityError) -> Response:
 
 
 def get_error_message(error: IntegrityError) -> str:
-    """Get formatted error message bases of error.orig type.
+    """Get formatted error message bases of error.orig SQLSTATE code.
 
     Args:
         error: raised sqlalchemy IntegrityError.
@@ -56,18 +107,28 @@ def get_error_message(error: IntegrityError) -> str:
     Returns:
     Properly formatted error message.
     """
+    if get_error_code(error=error) == SqlalchemyExceptionConstants.EXCLUSION_VIOLATION_CODE.value:
+        # Exclusive role trigger's message names the tables itself.
+        return re.search(
+            SqlalchemyExceptionConstants.EXCLUSIVE_ROLE_ERROR_REGEX.value,
+            get_error_text(error=error),
+        ).group(1)
     table_name, field, value = parse_integrity_error(error=error)
     SQLALCHEMY_INTEGRITY_ERROR_MAP = {
-        'UniqueViolation': f'{table_name} with {field}: {value} already exists.' if table_name else error.orig.pgerror,
-        'ForeignKeyViolation': f'Foreign key violation {field}: {value} is not present in table.',
+        SqlalchemyExceptionConstants.UNIQUE_VIOLATION_CODE.value: (
+            f'{table_name} with {field}: {value} already exists.' if table_name else get_error_text(error=error)
+        ),
+        SqlalchemyExceptionConstants.FOREIGN_KEY_VIOLATION_CODE.value: (
+            f'Foreign key violation {field}: {value} is not present in table.'
+        ),
     }
-    return SQLALCHEMY_INTEGRITY_ERROR_MAP[error.orig.__class__.__name__]
+    return SQLALCHEMY_INTEGRITY_ERROR_MAP[get_error_code(error=error)]
 
 
 def marshmallow_validation_error_handler(error: ValidationError) -> Response:
     """Custom marshmallow ValidationError handler return http Response with error message."""
     STATUS_CODE = HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value
-    response = ResponseBaseSchema().load(
+    response = get_schema(ResponseBaseSchema).load(
         {
             'status': {
                 'code': STATUS_CODE,
@@ -77,3 +138,52 @@ def marshmallow_validation_error_handler(error: ValidationError) -> Response:
         }
     )
     return make_response(jsonify(response), STATUS_CODE)
+
+
+def request_deadline_exceeded_error_handler(error: RequestDeadlineExceededError) -> Response:
+    """Custom RequestDeadlineExceededError handler return http Response with error message."""
+    STATUS_CODE = HttpStatusCodeConstants.HTTP_504_GATEWAY_TIMEOUT.value
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': [],
+            'errors': {'message': str(error)},
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
+
+
+def operational_error_handler(error: OperationalError) -> Response:
+    """Custom OperationalError handler return http Response for statements cancelled by statement_timeout
+    and for transactions conflicts left after the retries.
+
+    Other operational errors are raised again.
+    """
+    code = getattr(error.orig, 'pgcode', None)
+    if code in (
+        SqlalchemyExceptionConstants.SERIALIZATION_FAILURE_CODE.value,
+        SqlalchemyExceptionConstants.DEADLOCK_DETECTED_CODE.value,
+    ):
+        return transaction_conflict_error_handler(error=error)
+    if code != SqlalchemyExceptionConstants.QUERY_CANCELED_CODE.value:
+        raise error
+    return request_deadline_exceeded_error_handler(
+        error=RequestDeadlineExceededError('Request deadline exceeded, db statement cancelled.'),
+    )
+
+
+def transaction_conflict_error_handler(error: OperationalError) -> Response:
+    """Custom handler of serialization failures and deadlocks return http Response with error message."""
+    STATUS_CODE = HttpStatusCodeConstants.HTTP_409_CONFLICT.value
+    response = get_schema(ResponseBaseSchema).load(
+        {
+            'status': {
+                'code': STATUS_CODE,
+            },
+            'data': [],
+            'errors': {'message': 'Transaction conflicted with concurrent requests, retry the request.'},
+        }
+    )
+    return make_response(jsonify(response), STATUS_CODE)
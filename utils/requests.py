@@ -0,0 +1,27 @@
+from uuid import UUID
+
+from flask import g, request
+
+from marshmallow import EXCLUDE
+
+from common.schemas.request import IdsQuerySchema
+from utils.schemas import get_schema
+
+
+def get_request_ids() -> list[UUID]:
+    """Return UUIDs of the request's objects, the view's 'id' argument or the bulk request's 'ids' query string.
+
+    Duplicated ids are dropped keeping the order of the first occurrence, the query string is loaded once per request.
+
+    Raises:
+    marshmallow ValidationError if 'ids' query string is missing or has invalid UUIDs.
+
+    Returns:
+    list of UUIDs.
+    """
+    if request.view_args.get('id') is not None:
+        return [request.view_args['id']]
+    if 'request_ids' not in g:
+        ids = get_schema(IdsQuerySchema).load(request.args, unknown=EXCLUDE)['ids']
+        g.request_ids = list(dict.fromkeys(ids))
+    return g.request_ids
@@ -0,0 +1,46 @@
+from typing import Iterator
+
+from flask import Response, json, stream_with_context
+
+from common.constants.http import HttpStatusCodeConstants
+
+
+def stream_response(data: Iterator[list[dict]], status_code: int) -> Response:
+    """Return chunked http response with json data wrapped in the 'status/data/errors' envelope.
+
+    Every batch of data is encoded and sent as a separate chunk, the request context is kept until the last one,
+    so the db session stays open while the rows are read from the server-side cursor.
+
+    Args:
+        data: iterator of serialized objects batches.
+        status_code: http status code of the response.
+
+    Returns:
+    streamed http response.
+    """
+    def generate() -> Iterator[str]:
+        yield '{"data":['
+        separator = ''
+        for batch in data:
+            if batch:
+                yield separator + ','.join(json.dumps(item) for item in batch)
+                separator = ','
+        yield f'],"errors":[],"status":{{"code":{status_code}}}}}'
+    return Response(stream_with_context(generate()), status=status_code, mimetype='application/json')
+
+
+def bulk_status_code(data: list, errors: list) -> int:
+    """Return http status code of the bulk request, 207 if only some of its items succeeded.
+
+    Args:
+        data: results of the succeeded items.
+        errors: errors of the failed items.
+
+    Returns:
+    http status code.
+    """
+    if not errors:
+        return HttpStatusCodeConstants.HTTP_201_CREATED.value
+    if not data:
+        return HttpStatusCodeConstants.HTTP_400_BAD_REQUEST.value
+    return HttpStatusCodeConstants.HTTP_207_MULTI_STATUS.value
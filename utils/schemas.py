@@ -0,0 +1,10 @@
+from functools import lru_cache
+from typing import Type
+
+from marshmallow import Schema
+
+
+@lru_cache(maxsize=None)
+def get_schema(schema_class: Type[Schema], many: bool = False) -> Schema:
+    """Return instance of the schema built once per process, schemas keep no state between load and dump calls."""
+    return schema_class(many=many)